@@ -8,25 +8,157 @@ for distributed computing experiments.
 """
 
 import argparse
+import copy
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from contextlib import contextmanager
-from functools import lru_cache
-from pathlib import Path
-from typing import Any, Dict, Generator
-
-from src.api import (
-    DeviceManager,
-    DeviceType,
-    create_ssh_client,
-    read_yaml_file,
-    start_logging_server,
-    shutdown_logging_server,
-)
-from src.api.network.protocols import SSH_DEFAULT_CONNECT_TIMEOUT, DEFAULT_PORT
+from functools import cached_property, lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+
+# Importing src.api pulls in torch and the experiment stack, so it is deferred
+# to the functions that need it; `host.py --help` never pays that cost.
 
 logger = logging.getLogger(__name__)
 
+# Log level names accepted in the config, resolved once
+_LEVELS: Dict[str, int] = {
+    name: getattr(logging, name)
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+# Defaults for the config sections read by ExperimentHost, merged in once on load
+_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "logging": {
+        "level": "INFO",
+        "file": None,
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "remote": False,
+    },
+    "dataloader": {
+        "batch_size": 1,
+        "shuffle": False,
+        "num_workers": 0,
+        "prefetch_factor": 4,
+        "collate_fn": None,
+    },
+    "experiment": {"type": "auto"},
+}
+
+# Maximum time cleanup() waits for a background result copy (seconds)
+RESULTS_COPY_TIMEOUT = 300.0
+
+# Root logger handler installed by this module, replaced on reconfiguration
+_root_handler: Optional[logging.Handler] = None
+
+# SSH clients shared across transfers, keyed by (host, user, ssh_port)
+_SSH_POOL: Dict[Tuple[str, str, int], Any] = {}
+_SSH_POOL_LOCK = threading.Lock()
+
+
+def get_ssh(server_device: Any) -> Any:
+    """
+    Return a pooled SSH client for the device, creating it on first use.
+
+    Pooled clients check that their transport is still active before every
+    operation and reconnect transparently, so a cached client is always safe
+    to hand out.
+    """
+    from src.api import create_ssh_client
+    from src.api.network.protocols import (
+        SSH_DEFAULT_CONNECT_TIMEOUT,
+        SSH_KEEPALIVE_INTERVAL,
+    )
+
+    key = (
+        server_device.get_host(),
+        server_device.get_username(),
+        server_device.working_cparams.ssh_port,
+    )
+    with _SSH_POOL_LOCK:
+        ssh_client = _SSH_POOL.get(key)
+        if ssh_client is None:
+            logger.info(f"Establishing SSH connection to server {key[0]}...")
+            ssh_client = create_ssh_client(
+                host=key[0],
+                user=key[1],
+                private_key_path=server_device.get_private_key_path(),
+                port=key[2],
+                timeout=SSH_DEFAULT_CONNECT_TIMEOUT,
+                keepalive_interval=SSH_KEEPALIVE_INTERVAL,
+                pkey=server_device.working_cparams.private_key,
+            )
+            _SSH_POOL[key] = ssh_client
+        return ssh_client
+
+
+def _set_root_handler(handler: logging.Handler, level: int) -> None:
+    """
+    Install `handler` on the root logger in place of the one set here before.
+
+    Handlers added by other code (e.g. the remote logging listener) are left
+    in place, unlike with basicConfig, which is a no-op once any handler
+    exists, or a non-incremental dictConfig, which closes all of them.
+    """
+    global _root_handler
+    root = logging.getLogger()
+    if _root_handler is not None:
+        root.removeHandler(_root_handler)
+        _root_handler.close()
+    root.addHandler(handler)
+    root.setLevel(level)
+    _root_handler = handler
+
+
+def _close_ssh_pool() -> None:
+    """Close every pooled SSH client."""
+    with _SSH_POOL_LOCK:
+        for ssh_client in _SSH_POOL.values():
+            ssh_client.close()
+        _SSH_POOL.clear()
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(config_path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse the YAML file once per version of the file.
+
+    The stat fields only serve as part of the cache key, so an edited file
+    is parsed again.
+    """
+    import yaml
+    from src.api.utils.utils import YamlLoader
+
+    with open(config_path) as f:
+        return yaml.load(f, Loader=YamlLoader) or {}
+
+
+def _load_config(config_path: str) -> Dict[str, Any]:
+    """
+    Load configuration from file, parsing it only when its contents changed.
+
+    The cache is keyed on (path, mtime, size) so an edited file is re-read.
+    A copy is returned so callers may modify it without touching the cache.
+    """
+    stat = os.stat(config_path)
+    return copy.deepcopy(
+        _load_config_cached(config_path, stat.st_mtime_ns, stat.st_size)
+    )
+
+
+def _apply_defaults(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the config with every section in _DEFAULTS filled in."""
+    return {
+        **config,
+        **{
+            section: defaults | (config.get(section) or {})
+            for section, defaults in _DEFAULTS.items()
+        },
+    }
+
 
 def parse_arguments() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -67,13 +199,22 @@ class ExperimentHost:
     5. Running the experiment and handling results
     """
 
-    def __init__(self, config_path: str) -> None:
+    def __init__(self, config_path: Union[str, Dict[str, Any]]) -> None:
         """Initialize the experiment host with specified configuration."""
+        from src.api import DeviceManager
+
         self.results_copied = False
         self.logging_server_started = False
-        self.config = read_yaml_file(config_path)
+        self.logging_server = None
+        self.log_listener = None
+        self._copy_future: Optional[Future] = None
+        if isinstance(config_path, dict):
+            self.config = config_path
+        else:
+            self.config = _load_config(config_path)
         if not self.config:
             raise ValueError(f"Failed to load configuration from {config_path}")
+        self.config = _apply_defaults(self.config)
 
         self._setup_logging()
         self.device_mgr = DeviceManager()
@@ -82,11 +223,26 @@ class ExperimentHost:
 
         logger.info("Experiment host initialized successfully")
 
-    @staticmethod
-    @lru_cache(maxsize=1)
-    def _load_config(config_path: str) -> Dict[str, Any]:
-        """Load and cache configuration from file for efficient reuse."""
-        return read_yaml_file(config_path)
+    @classmethod
+    def from_config_dict(cls, config: Dict[str, Any]) -> "ExperimentHost":
+        """Create a host from an already parsed configuration dictionary."""
+        return cls(config)
+
+    @cached_property
+    def server_device(self) -> Any:
+        """The SERVER device from the device configuration, or None."""
+        from src.api import DeviceType
+
+        server_device = self.device_mgr.get_device_by_type(DeviceType.SERVER)
+        if not server_device:
+            # Try with string value as fallback
+            server_device = self.device_mgr.get_device_by_type("SERVER")
+        return server_device
+
+    @cached_property
+    def server_reachable(self) -> bool:
+        """Whether the SERVER device has a reachable connection."""
+        return bool(self.server_device and self.server_device.is_reachable())
 
     def _setup_logging(self) -> None:
         """
@@ -97,35 +253,34 @@ class ExperimentHost:
         - File logging with rotation
         - Remote logging via logging server
         """
-        log_config = self.config.get("logging", {})
-        log_level_str = log_config.get("level", "INFO")
-        log_level = getattr(logging, log_level_str.upper(), logging.INFO)
+        log_config = self.config["logging"]
+        log_level_str = log_config["level"]
+        log_level = _LEVELS.get(log_level_str.upper(), logging.INFO)
 
         # Configure file logging if specified
-        log_file = log_config.get("file")
+        log_file = log_config["file"]
         if log_file:
             log_file = Path(log_file)
             log_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Configure logging format
-        log_format = log_config.get(
-            "format", "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        # Configure root logger, replacing the handler installed by main() or
+        # a previous host
+        handler: logging.Handler = (
+            logging.FileHandler(log_file) if log_file else logging.StreamHandler()
         )
+        handler.setFormatter(logging.Formatter(log_config["format"]))
+        _set_root_handler(handler, log_level)
 
         # Start logging server if remote logging is enabled
-        if log_config.get("remote", False):
-            start_logging_server()
+        if log_config["remote"]:
+            from src.api import start_async_logging, start_logging_server
+
+            self.logging_server = start_logging_server()
+            # Keep handler I/O off the experiment threads under burst load
+            self.log_listener = start_async_logging()
             self.logging_server_started = True
             logger.info("Remote logging server started")
 
-        # Configure root logger
-        logging.basicConfig(
-            level=log_level,
-            format=log_format,
-            filename=log_file,
-            filemode="a" if log_file else None,
-        )
-
         logger.debug(f"Logging initialized with level {log_level_str}")
 
     def _verify_devices(self) -> None:
@@ -138,32 +293,25 @@ class ExperimentHost:
         """
         logger.info("Verifying device configuration...")
 
-        from src.api import DeviceType
-
         # Check all devices - use get_devices() instead of get_all_devices()
         devices = self.device_mgr.get_devices()
         logger.info(f"Loaded {len(devices)} device(s)")
 
-        for device in devices:
-            logger.info(
-                f"Device: {device.device_type}, Host: {device.get_host()}, Port: {device.get_port()}, Reachable: {device.is_reachable()}"
-            )
-
-        # Check specifically for SERVER device using both the enum and string
-        server_device = self.device_mgr.get_device_by_type(DeviceType.SERVER)
-        if not server_device:
-            # Try with string value as fallback
-            server_device = self.device_mgr.get_device_by_type("SERVER")
-            if server_device:
-                logger.info("SERVER device found using string name 'SERVER'")
+        # Per-device details are only resolved when they will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            for device in devices:
+                host, port = device.get_host(), device.get_port()
+                reachable = device.is_reachable()
+                logger.info(
+                    f"Device: {device.device_type}, Host: {host}, Port: {port}, Reachable: {reachable}"
+                )
 
+        server_device = self.server_device
         if server_device:
             logger.info(
                 f"SERVER device found: {server_device.get_host()}:{server_device.get_port()}"
             )
-            # Test if it's truly reachable
-            is_reachable = server_device.is_reachable()
-            logger.info(f"SERVER is reachable: {is_reachable}")
+            logger.info(f"SERVER is reachable: {self.server_reachable}")
         else:
             logger.warning("No SERVER device found in configuration")
 
@@ -177,17 +325,14 @@ class ExperimentHost:
 
         The mode selection can be:
         - Explicitly specified in the configuration
-        - Automatically determined based on server availability
+        - Automatically determined based on server reachability ('auto'),
+          running locally with a warning when the server did not answer
         """
         logger.info("Setting up experiment...")
 
-        from src.api import DeviceType
-
-        server_device = self.device_mgr.get_device_by_type(DeviceType.SERVER)
-        # Try with string name if the enum doesn't work
-        if not server_device:
-            server_device = self.device_mgr.get_device_by_type("SERVER")
+        from src.api.network.protocols import DEFAULT_PORT
 
+        server_device = self.server_device
         host = None
         port = None
 
@@ -204,12 +349,17 @@ class ExperimentHost:
             logger.warning("No SERVER device found, will run in local mode")
 
         # Determine if networked mode is requested or forced
-        exp_config = self.config.get("experiment", {})
-        exp_type = exp_config.get("type", "auto")
+        exp_type = self.config["experiment"]["type"]
 
-        # If experiment type is auto, use networked if server device is available
+        # If experiment type is auto, use networked if the server is reachable.
+        # server_reachable was already resolved by _verify_devices.
         if exp_type == "auto":
-            exp_type = "networked" if server_device else "local"
+            exp_type = "networked" if self.server_reachable else "local"
+            if server_device and exp_type == "local":
+                logger.warning(
+                    "SERVER device is not reachable, falling back to local mode; "
+                    "set experiment.type to 'networked' to require the server"
+                )
             logger.info(f"Auto-selecting experiment type: {exp_type}")
 
         # Set up experiment based on type
@@ -237,6 +387,13 @@ class ExperimentHost:
         # Attach data loader to experiment
         self.experiment.data_loader = self.data_loader
 
+        # Result locations used when copying to the server (a POSIX host); the
+        # remote base comes from the server device, defaulting to /tmp
+        self._local_results_path = Path(self.experiment.paths.results_dir)
+        self._remote_results_base = PurePosixPath(
+            getattr(server_device, "results_dir", None) or "/tmp"
+        )
+
         logger.info(f"Experiment of type '{exp_type}' set up successfully")
 
     def _setup_dataloader(self) -> None:
@@ -257,7 +414,7 @@ class ExperimentHost:
 
         # Get dataset and dataloader configurations
         dataset_config = self.config.get("dataset", {})
-        dataloader_config = self.config.get("dataloader", {})
+        dataloader_config = self.config["dataloader"]
 
         # Get dataset name - required parameter
         dataset_name = dataset_config.get("name")
@@ -271,29 +428,23 @@ class ExperimentHost:
 
         # Add transform from dataloader config if not already specified
         if "transform" not in complete_config and "transform" in dataloader_config:
-            complete_config["transform"] = dataloader_config.get("transform")
+            complete_config["transform"] = dataloader_config["transform"]
 
         # Get the appropriate collate function if specified
         collate_fn = None
-        if dataloader_config.get("collate_fn"):
-            try:
-                collate_fn_name = dataloader_config["collate_fn"]
-                collate_fn = CollateRegistry.get(collate_fn_name)
-                if not collate_fn:
-                    logger.warning(
-                        f"Collate function '{collate_fn_name}' not found in registry. "
-                        "Using default collation."
-                    )
-            except KeyError:
+        collate_fn_name = dataloader_config["collate_fn"]
+        if collate_fn_name:
+            collate_fn = CollateRegistry.get(collate_fn_name)
+            if not collate_fn:
                 logger.warning(
-                    f"Collate function '{dataloader_config['collate_fn']}' not found. "
+                    f"Collate function '{collate_fn_name}' not found in registry. "
                     "Using default collation."
                 )
 
         # Load dataset using registry
         try:
             # First register the dataset if needed
-            if DatasetRegistry.get_metadata(dataset_name) is None:
+            if dataset_name not in DatasetRegistry:
                 logger.info(f"Registering dataset '{dataset_name}'")
                 DatasetRegistry.register_dataset(dataset_name)
 
@@ -305,13 +456,19 @@ class ExperimentHost:
             raise  # Re-raise to ensure the error is properly handled
 
         # Create data loader
-        self.data_loader = torch.utils.data.DataLoader(
-            dataset,
-            batch_size=dataloader_config.get("batch_size", 1),
-            shuffle=dataloader_config.get("shuffle", False),
-            num_workers=dataloader_config.get("num_workers", 0),
+        num_workers = dataloader_config["num_workers"]
+        loader_kwargs: Dict[str, Any] = dict(
+            batch_size=dataloader_config["batch_size"],
+            shuffle=dataloader_config["shuffle"],
+            num_workers=num_workers,
             collate_fn=collate_fn,
+            pin_memory=torch.cuda.is_available(),
         )
+        if num_workers > 0:
+            # Keep workers alive across epochs instead of re-forking them
+            loader_kwargs["persistent_workers"] = True
+            loader_kwargs["prefetch_factor"] = dataloader_config["prefetch_factor"]
+        self.data_loader = torch.utils.data.DataLoader(dataset, **loader_kwargs)
 
         logger.info(
             f"Data loader for '{dataset_name}' dataset initialized successfully"
@@ -330,83 +487,130 @@ class ExperimentHost:
             logger.error(f"Error during experiment execution: {e}", exc_info=True)
             raise
 
+        if self.config.get("copy_results_on_cleanup", False):
+            # Start the transfer now so the network I/O overlaps with teardown
+            executor = ThreadPoolExecutor(max_workers=1)
+            self._copy_future = executor.submit(self._copy_results_to_server)
+            executor.shutdown(wait=False)
+
     @contextmanager
     def _ssh_connection(self, server_device: Any) -> Generator[Any, None, None]:
         """
-        Create and manage an SSH connection to the server.
+        Provide the pooled SSH connection to the server.
 
-        This context manager ensures proper resource cleanup even if
-        an exception occurs during SSH operations.
+        The connection is kept open for reuse by later transfers and is only
+        closed by cleanup().
         """
-        ssh_client = None
         try:
-            # Get SSH port for file transfer operations
-            ssh_port = server_device.working_cparams.ssh_port
-            logger.info(
-                f"Establishing SSH connection to server {server_device.get_host()}..."
-            )
-
-            # Create SSH client
-            ssh_client = create_ssh_client(
-                host=server_device.get_host(),
-                user=server_device.get_username(),
-                private_key_path=server_device.get_private_key_path(),
-                port=ssh_port,
-                timeout=SSH_DEFAULT_CONNECT_TIMEOUT,
-            )
-
-            yield ssh_client
-
+            yield get_ssh(server_device)
         except Exception as e:
             logger.error(f"SSH connection error: {e}", exc_info=True)
             raise
+
+    def _sftp_put_files(
+        self,
+        ssh_client: Any,
+        files: List[Path],
+        local_root: Path,
+        remote_root: PurePosixPath,
+    ) -> None:
+        """
+        Upload files over an SFTP session of their own on the shared transport.
+
+        Files whose remote copy has the same size and is at least as new as
+        the local file are skipped, so reruns only move newly produced results.
+        """
+        from src.api.network.protocols import SFTP_CHANNEL_TIMEOUT
+
+        sftp = ssh_client.open_sftp()
+        try:
+            sftp.get_channel().settimeout(SFTP_CHANNEL_TIMEOUT)
+            for path in files:
+                remote_path = str(remote_root / path.relative_to(local_root).as_posix())
+                local_stat = path.stat()
+                try:
+                    remote_stat = sftp.stat(remote_path)
+                    if (
+                        remote_stat.st_size == local_stat.st_size
+                        and remote_stat.st_mtime >= int(local_stat.st_mtime)
+                    ):
+                        logger.debug(f"Skipping unchanged file {remote_path}")
+                        continue
+                except FileNotFoundError:
+                    pass
+                sftp.put(str(path), remote_path)
         finally:
-            if ssh_client:
-                ssh_client.close()
-                logger.debug("SSH connection closed")
+            sftp.close()
 
     def _copy_results_to_server(self) -> bool:
         """
-        Transfer experiment results to the server using SCP.
+        Transfer experiment results to the server over SFTP.
+
+        Files are spread across a few SFTP sessions opened on the already
+        authenticated SSH transport, so the handshake is paid once and each
+        session gets its own flow-control window.
 
         Returns:
             bool: True if results were successfully copied
         """
         logger.info("Copying results to server...")
-        server_device = self.device_mgr.get_device_by_type(DeviceType.SERVER)
+        from src.api.network.protocols import SFTP_TRANSFER_WORKERS
+
+        server_device = self.server_device
         if not server_device:
             logger.error("No server device found, cannot copy results")
             return False
 
         try:
-            # Create SSH client to remote server
-            ssh_client = create_ssh_client(
-                server_device.hostname,
-                server_device.port,
-                server_device.username,
-                server_device.key_path,
-            )
-
-            # Copy results directory to server
-            local_results_path = self.experiment.paths.results_dir
-            remote_results_path = (
-                f"{server_device.results_dir}/{local_results_path.name}"
-            )
+            local_results_path = self._local_results_path
+            remote_base = self._remote_results_base
+            remote_results_path = remote_base / local_results_path.name
 
             logger.info(
                 f"Copying results from {local_results_path} to {remote_results_path}"
             )
 
-            # Use scp to copy the directory
-            cmd = f"scp -r -i {server_device.key_path} {local_results_path} {server_device.username}@{server_device.hostname}:{server_device.results_dir}/"
-            logger.debug(f"Running command: {cmd}")
-
-            # Execute the command
-            os.system(cmd)
-            logger.info("Results copied successfully")
-
-            # Close SSH connection
-            ssh_client.close()
+            files, dirs = [], []
+            for path in local_results_path.rglob("*"):
+                (files if path.is_file() else dirs).append(path)
+
+            with self._ssh_connection(server_device) as ssh_client:
+                # Create the directory tree up front, parents before children
+                sftp = ssh_client.open_sftp()
+                try:
+                    remote_dirs = [remote_base, remote_results_path] + [
+                        remote_results_path / rel.as_posix()
+                        for rel in sorted(d.relative_to(local_results_path) for d in dirs)
+                    ]
+                    for remote_dir in remote_dirs:
+                        try:
+                            sftp.mkdir(str(remote_dir))
+                        except IOError:
+                            pass  # Directory already exists
+                finally:
+                    sftp.close()
+
+                workers = min(SFTP_TRANSFER_WORKERS, len(files))
+                if workers <= 1:
+                    self._sftp_put_files(
+                        ssh_client, files, local_results_path, remote_results_path
+                    )
+                else:
+                    with ThreadPoolExecutor(max_workers=workers) as executor:
+                        futures = [
+                            executor.submit(
+                                self._sftp_put_files,
+                                ssh_client,
+                                files[i::workers],
+                                local_results_path,
+                                remote_results_path,
+                            )
+                            for i in range(workers)
+                        ]
+                        for future in futures:
+                            future.result()
+
+            logger.info(f"Results copied successfully ({len(files)} files)")
 
             # Set the flag to indicate results have been copied
             self.results_copied = True
@@ -426,15 +630,34 @@ class ExperimentHost:
         logger.info("Cleaning up...")
 
         # Optionally copy results to server if not already done
-        if not self.results_copied and self.config.get(
+        if self._copy_future is not None:
+            try:
+                if self._copy_future.result(timeout=RESULTS_COPY_TIMEOUT):
+                    logger.info("Results copied during cleanup")
+            except FutureTimeoutError:
+                logger.error(
+                    f"Result copy did not finish within {RESULTS_COPY_TIMEOUT}s"
+                )
+                self._copy_future.cancel()
+        elif not self.results_copied and self.config.get(
             "copy_results_on_cleanup", False
         ):
             success = self._copy_results_to_server()
             if success:
                 logger.info("Results copied during cleanup")
 
+        if self._copy_future is not None and not self._copy_future.done():
+            # The copy still uses a pooled client; closing it underneath the
+            # transfer would fail it midway, so leave it to process exit
+            logger.warning("Result copy still running, leaving SSH connections open")
+        else:
+            _close_ssh_pool()
+
         if self.logging_server_started:
-            shutdown_logging_server()
+            from src.api import shutdown_logging_server, stop_async_logging
+
+            shutdown_logging_server(self.logging_server)
+            stop_async_logging(self.log_listener)
 
         logger.info("Cleanup completed")
 
@@ -452,18 +675,16 @@ def main() -> None:
     args = parse_arguments()
     config_path = Path(args.config)
 
-    logging_level = logging.INFO
-    logging.basicConfig(
-        level=logging_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(_DEFAULTS["logging"]["format"]))
+    _set_root_handler(handler, logging.INFO)
 
     host = None
     try:
         print(f"Initializing experiment with config from {config_path}...")
 
         # Load config to check if we should modify it
-        config = read_yaml_file(str(config_path))
+        config = _load_config(str(config_path))
 
         # Add experiment type if not already set - prefer networked unless explicit
         if "experiment" not in config:
@@ -472,12 +693,13 @@ def main() -> None:
             config["experiment"]["type"] = "networked"
             print("Setting experiment type to 'networked'")
 
-        host = ExperimentHost(str(config_path))
+        host = ExperimentHost.from_config_dict(config)
 
         print("Starting experiment...")
         host.run_experiment()
 
-        if args.copy_results and host:
+        # A background copy already started by run_experiment() is awaited in cleanup()
+        if args.copy_results and host and host._copy_future is None:
             print("Copying results to server...")
             success = host._copy_results_to_server()
             if success:
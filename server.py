@@ -7,17 +7,27 @@ It can be run in either networked mode (handling connections from clients) or lo
 (running experiments locally without network communication).
 """
 
+import hashlib
 import logging
-import pickle
+import os
+import queue
+import select
+import selectors
 import socket
+import struct
 import sys
+import threading
 import time
 import argparse
-from contextlib import contextmanager
-from dataclasses import dataclass
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
-from typing import Optional, Tuple, Any, Dict, Generator
+from typing import Optional, Tuple, Any, Callable, Deque, Dict, List, Set
 
+import blosc2  # type: ignore
 import torch
 
 # Add project root to path so we can import from src module
@@ -38,11 +48,76 @@ from src.api import ( # noqa: E402
 from src.api.network.protocols import ( # noqa: E402
     LENGTH_PREFIX_SIZE,
     ACK_MESSAGE,
+    MAX_COMPRESSION_THREADS,
+    BUFFER_SIZE,
+    RESULT_HEADER_FORMAT,
+    BANDWIDTH_PROBE_MIN_BYTES,
+    RECEIVE_BUFFER_SIZE,
+    SENDMSG_MAX_PAYLOAD,
+    ZEROCOPY_MIN_PAYLOAD,
+    FAST_LINK_MBPS,
     SERVER_COMPRESSION_SETTINGS,
+    SLOW_LINK_MBPS,
     SERVER_LISTEN_TIMEOUT,
     SOCKET_TIMEOUT,
     DEFAULT_PORT,
 )
+from src.api.network.compression import CompressionConfig # noqa: E402
+from src.api.network.handshake import unpack_config # noqa: E402
+
+try:
+    import fcntl
+    import termios
+except ImportError:  # Not available on Windows
+    fcntl = termios = None  # type: ignore
+
+try:
+    from src.experiment_design.datasets.core.collate_fns import ( # noqa: E402
+        CollateRegistry,
+    )
+except ImportError:
+    CollateRegistry = None
+
+# Precompiled wire headers: length prefix, request (split index, payload
+# length) and result (payload length, processing time)
+_LENGTH_PREFIX = struct.Struct(">I")
+_REQUEST_HEADER = struct.Struct(">II")
+_RESULT_HEADER = struct.Struct(RESULT_HEADER_FORMAT)
+
+def _queued_bytes(conn: socket.socket) -> int:
+    """
+    Return how many received bytes are waiting in the socket's kernel buffer.
+
+    Where FIONREAD is unavailable, the receive buffer size is returned as an
+    upper bound.
+    """
+    if fcntl is not None:
+        try:
+            count = fcntl.ioctl(conn.fileno(), termios.FIONREAD, b"\0\0\0\0")
+            return struct.unpack("i", count)[0]
+        except OSError:
+            pass
+    return conn.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+
+
+# Linux zero-copy send constants (not all exposed by the socket module)
+_SO_ZEROCOPY = getattr(socket, "SO_ZEROCOPY", 60)
+_MSG_ZEROCOPY = getattr(socket, "MSG_ZEROCOPY", 0x4000000)
+_SO_EE_ORIGIN_ZEROCOPY = 5
+_SOCK_EXTENDED_ERR = struct.Struct("=IBBBBII")
+
+# Dynamic batching limits (enabled with `default.dynamic_batch`)
+DYNAMIC_BATCH_MAX_SIZE = 16
+DYNAMIC_BATCH_MAX_DELAY = 0.005
+
+# sysfs root describing the host's NUMA topology
+_NUMA_SYSFS = Path("/sys/devices/system/node")
+
+# Number of experiments kept for reuse by clients sending an identical config
+EXPERIMENT_CACHE_SIZE = 4
+
+# Collate functions resolved by name, reused across experiment restarts
+_COLLATE_CACHE: Dict[str, Any] = {}
 
 DEFAULT_CONFIG: Dict[str, Any] = {
     "logging": {"log_file": "logs/server.log", "log_level": "INFO"}
@@ -53,6 +128,48 @@ logging_server = start_logging_server(device=DeviceType.SERVER, config=DEFAULT_C
 logger = logging.getLogger("split_computing_logger")
 
 
+def _numa_node_cpus(node: int) -> Set[int]:
+    """Return the CPUs of a NUMA node, or an empty set if it is unknown."""
+    try:
+        cpulist = (_NUMA_SYSFS / f"node{node}" / "cpulist").read_text().strip()
+    except OSError:
+        return set()
+
+    cpus: Set[int] = set()
+    for part in cpulist.split(","):
+        if "-" in part:
+            first, last = part.split("-")
+            cpus.update(range(int(first), int(last) + 1))
+        elif part:
+            cpus.add(int(part))
+    return cpus
+
+
+def _numa_affinity(numa_config: Dict[str, Any], key: str) -> Optional[Set[int]]:
+    """
+    Resolve the CPU set for a configured NUMA node (`nic_node` or `gpu_node`).
+
+    Returns None on single-node hosts, on platforms without thread affinity
+    support, or when the node is not configured.
+    """
+    node = numa_config.get(key)
+    if node is None or not hasattr(os, "sched_setaffinity"):
+        return None
+    if len(list(_NUMA_SYSFS.glob("node[0-9]*"))) < 2:
+        return None
+    return _numa_node_cpus(int(node)) or None
+
+
+def _pin_thread(cpus: Optional[Set[int]]) -> None:
+    """Restrict the calling thread to the given CPUs (no-op for None)."""
+    if not cpus:
+        return
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as e:
+        logger.warning(f"Failed to set CPU affinity: {e}")
+
+
 def get_device(requested_device: str = "cuda") -> str:
     """Determine the appropriate device based on availability and request."""
     requested_device = requested_device.lower()
@@ -101,19 +218,254 @@ def get_device(requested_device: str = "cuda") -> str:
     return "cpu"
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerMetrics:
     """Container for metrics collected during server operation."""
 
     total_requests: int = 0
-    total_processing_time: float = 0.0
-    avg_processing_time: float = 0.0
+    total_processing_time_ns: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
 
     def update(self, processing_time: float) -> None:
-        """Update metrics with a new processing time measurement."""
-        self.total_requests += 1
-        self.total_processing_time += processing_time
-        self.avg_processing_time = self.total_processing_time / self.total_requests
+        """Update metrics with a new processing time measurement (thread-safe)."""
+        with self._lock:
+            self.total_requests += 1
+            self.total_processing_time_ns += int(processing_time * 1e9)
+
+    @property
+    def avg_processing_time(self) -> float:
+        """Average processing time per request in seconds."""
+        if not self.total_requests:
+            return 0.0
+        return self.total_processing_time_ns / (self.total_requests * 1e9)
+
+
+class _ZeroCopySender:
+    """
+    Sends large payloads with MSG_ZEROCOPY on Linux.
+
+    The kernel reads zero-copy payloads straight from user memory after
+    sendmsg() returns, so each buffer is kept alive until its completion
+    notification arrives on the socket error queue.
+    """
+
+    def __init__(self, conn: socket.socket) -> None:
+        self._conn = conn
+        self._next_seq = 0
+        self._pending: Deque[Tuple[int, bytes]] = deque()
+        self._poller = select.poll()
+        self._poller.register(conn.fileno(), 0)
+
+    @classmethod
+    def create(cls, conn: socket.socket) -> Optional["_ZeroCopySender"]:
+        """Enable SO_ZEROCOPY on the socket, or return None if unsupported."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            conn.setsockopt(socket.SOL_SOCKET, _SO_ZEROCOPY, 1)
+        except OSError:
+            return None
+        return cls(conn)
+
+    def send(self, payload: bytes) -> None:
+        """Send the whole payload, falling back to a copying send on ENOBUFS."""
+        self._reap_completions()
+        view = memoryview(payload)
+        while view:
+            try:
+                sent = self._conn.sendmsg([view], [], _MSG_ZEROCOPY)
+            except OSError as e:
+                logger.debug(f"Zero-copy send unavailable, copying instead: {e}")
+                self._conn.sendall(view)
+                return
+            self._pending.append((self._next_seq, payload))
+            self._next_seq += 1
+            view = view[sent:]
+
+    def _reap_completions(self) -> None:
+        """Release buffers whose zero-copy sends the kernel has completed."""
+        # The error queue only signals POLLERR, so check it without blocking
+        while self._pending and self._poller.poll(0):
+            try:
+                _, ancdata, _, _ = self._conn.recvmsg(
+                    0, 256, socket.MSG_ERRQUEUE | socket.MSG_DONTWAIT
+                )
+            except (BlockingIOError, InterruptedError):
+                return
+            for _, _, data in ancdata:
+                if len(data) < _SOCK_EXTENDED_ERR.size:
+                    continue
+                _, origin, _, _, _, _, last_seq = _SOCK_EXTENDED_ERR.unpack_from(data)
+                if origin != _SO_EE_ORIGIN_ZEROCOPY:
+                    continue
+                while self._pending and self._pending[0][0] <= last_seq:
+                    self._pending.popleft()
+
+
+@dataclass
+class _BatchSlot:
+    """A queued inference request and the slot its result is delivered to."""
+
+    output: torch.Tensor
+    original_size: Any
+    split_layer: int
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Optional[BaseException] = None
+
+
+class _MicroBatcher:
+    """
+    Coalesces concurrent inference requests for one experiment into batches.
+
+    A worker thread collects up to `max_batch` requests arriving within
+    `max_delay` seconds of the first, runs requests with matching split layer
+    and tensor shape through a single forward pass, and hands each caller its
+    own result.
+    """
+
+    def __init__(
+        self,
+        experiment: Any,
+        max_batch: int = DYNAMIC_BATCH_MAX_SIZE,
+        max_delay: float = DYNAMIC_BATCH_MAX_DELAY,
+        cpus: Optional[Set[int]] = None,
+    ) -> None:
+        self._experiment = experiment
+        self._cpus = cpus
+        self._max_batch = max_batch
+        self._max_delay = max_delay
+        self._queue: "queue.Queue[Optional[_BatchSlot]]" = queue.Queue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._worker = threading.Thread(
+            target=self._run, name="server-batcher", daemon=True
+        )
+        self._worker.start()
+
+    def submit(self, output: torch.Tensor, original_size: Any, split_layer: int) -> Any:
+        """Queue a request and block until its result is available."""
+        slot = _BatchSlot(output, original_size, split_layer)
+        with self._close_lock:
+            closed = self._closed
+            if not closed:
+                self._queue.put(slot)
+        if closed:
+            # Late callers after shutdown are served inline, unbatched
+            self._run_group([slot])
+        slot.done.wait()
+        if slot.error is not None:
+            raise slot.error
+        return slot.result
+
+    def close(self) -> None:
+        """Stop the worker thread once queued requests are processed."""
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+
+    def _collect(self, first: _BatchSlot) -> Tuple[List[_BatchSlot], bool]:
+        """Gather requests until the batch is full or the delay expires."""
+        slots = [first]
+        deadline = time.perf_counter() + self._max_delay
+        while len(slots) < self._max_batch:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                slot = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if slot is None:
+                return slots, True
+            slots.append(slot)
+        return slots, False
+
+    def _run(self) -> None:
+        """Worker loop: batch, run and deliver results until closed."""
+        # This thread launches the CUDA work, so keep it near the GPU
+        _pin_thread(self._cpus)
+        device = getattr(self._experiment, "device", None)
+        if device is not None and device.type == "cuda":
+            torch.cuda.set_device(device)
+
+        with torch.inference_mode():
+            while True:
+                first = self._queue.get()
+                if first is None:
+                    return
+                slots, closing = self._collect(first)
+
+                groups: Dict[Any, List[_BatchSlot]] = {}
+                for slot in slots:
+                    key: Any = (
+                        (slot.split_layer, slot.output.shape[1:], slot.output.dtype)
+                        if isinstance(slot.output, torch.Tensor)
+                        else id(slot)
+                    )
+                    groups.setdefault(key, []).append(slot)
+
+                for group in groups.values():
+                    self._run_group(group)
+                if closing:
+                    return
+
+    def _run_group(self, group: List[_BatchSlot]) -> None:
+        """Run one group of compatible requests and release their callers."""
+        try:
+            if len(group) == 1:
+                slot = group[0]
+                results = [
+                    self._experiment.process_tensor(
+                        slot.output, slot.original_size, slot.split_layer
+                    )
+                ]
+            else:
+                results = self._experiment.process_batch(
+                    [(slot.output, slot.original_size) for slot in group],
+                    group[0].split_layer,
+                )
+            for slot, result in zip(group, results):
+                slot.result = result
+        except Exception as e:
+            for slot in group:
+                slot.error = e
+        finally:
+            for slot in group:
+                slot.done.set()
+
+
+@dataclass
+class _ExperimentEntry:
+    """An experiment set up from a client config, shared by identical configs."""
+
+    config: Dict[str, Any]
+    compression: Optional[CompressionConfig]
+    experiment: Any
+    # Manager that built `experiment`; kept per entry, not on the shared Server
+    manager: Optional[ExperimentManager] = None
+    batcher: Optional[_MicroBatcher] = None
+    # Serializes unbatched inference when several connections share the model
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # Compiled forwards keyed on (split layer, input shape, dtype) when the
+    # config enables compilation; None entries mark keys that run eagerly
+    compiled: Optional[Dict[Tuple[int, Tuple[int, ...], torch.dtype], Any]] = None
+
+
+@dataclass
+class _ConnectionState:
+    """Per-connection state kept while a client is idle between requests."""
+
+    entry: _ExperimentEntry
+    compressor: DataCompression
+    auto_codec: bool
+    zerocopy: Optional[_ZeroCopySender] = None
+    # Bound experiment.process_tensor, looked up once per connection
+    process_tensor: Optional[Callable[..., Any]] = None
 
 
 class Server:
@@ -126,18 +478,61 @@ class Server:
     """
 
     def __init__(
-        self, local_mode: bool = False, config_path: Optional[str] = None
+        self,
+        local_mode: bool = False,
+        config_path: Optional[str] = None,
+        allow_pickle_config: bool = False,
     ) -> None:
-        """Initialize the Server with specified mode and configuration."""
+        """
+        Initialize the Server with specified mode and configuration.
+
+        `allow_pickle_config` accepts pickled client configs (sent by older
+        clients, or for configs that are not JSON-serializable); unpickling
+        lets a client run arbitrary code, so only enable it for trusted peers.
+        """
         self.device_manager = DeviceManager()
+        # Local mode only; networked experiments keep theirs in _ExperimentEntry
         self.experiment_manager: Optional[ExperimentManager] = None
         self.server_socket: Optional[socket.socket] = None
         self.local_mode = local_mode
         self.config_path = config_path
+        self.allow_pickle_config = allow_pickle_config
         self.metrics = ServerMetrics()
         self.compress_data: Optional[DataCompression] = None
+        self.config: Dict[str, Any] = {}
+        # Idle connections wait in the selector; workers hand them back through
+        # a queue and wake the event loop with a byte on the socket pair
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._parked: "queue.SimpleQueue[Tuple[socket.socket, _ConnectionState]]" = (
+            queue.SimpleQueue()
+        )
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        # Set by stop() to end the event loop from another thread
+        self._stopping = threading.Event()
+        # Experiments keyed by the BLAKE2b digest of the client's config bytes
+        self._experiment_cache: "OrderedDict[bytes, _ExperimentEntry]" = (
+            OrderedDict()
+        )
+        self._experiment_cache_lock = threading.Lock()
+        # Per-worker receive buffer and pinned staging tensor, created on demand
+        self._local = threading.local()
+        # Copy stream for CUDA uploads
+        self._h2d_stream = torch.cuda.Stream() if torch.cuda.is_available() else None
 
         self._load_config_and_setup_device()
+
+        # Connections are served concurrently by a pool of worker threads. On
+        # multi-socket hosts, `default.numa` pins receive/decode workers to the
+        # NIC's node and inference batchers to the GPU's node.
+        numa_config = self.config.get("default", {}).get("numa") or {}
+        self._gpu_cpus = _numa_affinity(numa_config, "gpu_node")
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 2),
+            thread_name_prefix="server-conn",
+            initializer=_pin_thread,
+            initargs=(_numa_affinity(numa_config, "nic_node"),),
+        )
+
         # Setup compression if in networked mode
         if not local_mode:
             self._setup_compression()
@@ -155,9 +550,32 @@ class Server:
         self.config["default"]["device"] = get_device(requested_device)
 
     def _setup_compression(self) -> None:
-        """Initialize compression with minimal settings for optimal performance."""
+        """
+        Initialize compression with Zstd-1 + bitshuffle default settings.
+
+        Blosc2 splits block (de)compression across its own thread pool. The pool
+        is process-wide and shared by every connection worker, so raising the
+        connection pool size well beyond the core count oversubscribes the CPU.
+        """
+        nthreads = min(MAX_COMPRESSION_THREADS, os.cpu_count() or 1)
+        blosc2.set_nthreads(nthreads)
+        logger.debug(f"Using {nthreads} Blosc2 compression threads")
         self.compress_data = DataCompression(SERVER_COMPRESSION_SETTINGS)
-        logger.debug("Initialized compression with minimal settings")
+        logger.debug("Initialized compression with default server settings")
+
+    @staticmethod
+    def _auto_select_codec(link_mbps: float) -> Dict[str, Any]:
+        """
+        Pick compression settings suited to the measured link bandwidth.
+
+        Fast links are CPU-bound, so a light codec wins; slower links are
+        bandwidth-bound and benefit from spending more CPU on ratio.
+        """
+        if link_mbps > FAST_LINK_MBPS:
+            return {"clevel": 1, "filter": "SHUFFLE", "codec": "LZ4"}
+        if link_mbps >= SLOW_LINK_MBPS:
+            return {"clevel": 1, "filter": "BITSHUFFLE", "codec": "ZSTD"}
+        return {"clevel": 3, "filter": "BITSHUFFLE", "codec": "ZSTD"}
 
     def start(self) -> None:
         """Start the server in either networked or local mode."""
@@ -211,7 +629,7 @@ class Server:
         # Load dataset using registry
         try:
             # First register the dataset if needed
-            if DatasetRegistry.get_metadata(dataset_name) is None:
+            if dataset_name not in DatasetRegistry:
                 logger.info(f"Registering dataset '{dataset_name}'")
                 DatasetRegistry.register_dataset(dataset_name)
 
@@ -223,13 +641,21 @@ class Server:
             raise  # Re-raise to ensure the error is properly handled
 
         # Create data loader
-        data_loader = torch.utils.data.DataLoader(
-            dataset,
+        num_workers = dataloader_config.get("num_workers") or 0
+        loader_kwargs: Dict[str, Any] = dict(
             batch_size=dataloader_config.get("batch_size"),
             shuffle=dataloader_config.get("shuffle"),
-            num_workers=dataloader_config.get("num_workers"),
+            num_workers=num_workers,
             collate_fn=collate_fn,
+            pin_memory=torch.cuda.is_available(),
         )
+        if num_workers > 0:
+            # Keep workers alive across epochs instead of re-forking them
+            loader_kwargs["persistent_workers"] = True
+            loader_kwargs["prefetch_factor"] = dataloader_config.get(
+                "prefetch_factor", 4
+            )
+        data_loader = torch.utils.data.DataLoader(dataset, **loader_kwargs)
 
         # Attach data loader to experiment and run
         experiment.data_loader = data_loader
@@ -242,36 +668,31 @@ class Server:
         Collate functions customize how individual data samples are combined
         into batches for model processing.
         """
-        if not dataloader_config.get("collate_fn"):
+        collate_fn_name = dataloader_config.get("collate_fn")
+        if not collate_fn_name:
             return None
 
-        try:
-            from src.experiment_design.datasets.core.collate_fns import CollateRegistry
-
-            collate_fn_name = dataloader_config["collate_fn"]
-            collate_fn = CollateRegistry.get(collate_fn_name)
-
-            if not collate_fn:
-                logger.warning(
-                    f"Collate function '{collate_fn_name}' not found in registry. "
-                    "Using default collation."
-                )
-                return None
+        if collate_fn_name in _COLLATE_CACHE:
+            return _COLLATE_CACHE[collate_fn_name]
 
-            logger.debug(f"Using registered collate function: {collate_fn_name}")
-            return collate_fn
-        except ImportError as e:
+        if CollateRegistry is None:
             logger.warning(
-                f"Failed to import collate functions: {e}. Using default collation."
+                "Failed to import collate functions. Using default collation."
             )
             return None
-        except KeyError:
+
+        collate_fn = CollateRegistry.get(collate_fn_name)
+        if not collate_fn:
             logger.warning(
-                f"Collate function '{dataloader_config['collate_fn']}' not found. "
+                f"Collate function '{collate_fn_name}' not found in registry. "
                 "Using default collation."
             )
             return None
 
+        logger.debug(f"Using registered collate function: {collate_fn_name}")
+        _COLLATE_CACHE[collate_fn_name] = collate_fn
+        return collate_fn
+
     def _run_networked_server(self) -> None:
         """Run server in networked mode, accepting client connections."""
         # Get server device configuration
@@ -306,23 +727,80 @@ class Server:
 
     def _accept_connections(self) -> None:
         """
-        Accept and handle client connections in a continuous loop.
-
-        Uses socket timeout to allow for graceful shutdown on keyboard interrupt.
+        Run the connection event loop until interrupted.
+
+        A selector (epoll/kqueue where available) watches the listening socket
+        and every idle client connection. New clients and clients with a
+        pending request are handed to the worker pool, so the loop itself never
+        blocks on model execution. The select timeout allows for graceful
+        shutdown on keyboard interrupt; `stop()` ends the loop from another
+        thread.
         """
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.server_socket, selectors.EVENT_READ)
+        self._selector.register(self._wakeup_r, selectors.EVENT_READ)
+
+        while not self._stopping.is_set():
+            for key, _ in self._selector.select(timeout=SERVER_LISTEN_TIMEOUT):
+                if self._stopping.is_set():
+                    break
+                if key.fileobj is self.server_socket:
+                    self._accept_client()
+                elif key.fileobj is self._wakeup_r:
+                    self._register_parked_connections()
+                else:
+                    # Client sent a request; serve it on a worker thread
+                    self._selector.unregister(key.fileobj)
+                    self._pool.submit(self._serve_ready, key.fileobj, key.data)
+
+    def stop(self) -> None:
+        """Ask the event loop to return; call cleanup() once it has."""
+        self._stopping.set()
+        self._wakeup_w.send(b"\0")
+
+    def _accept_client(self) -> None:
+        """Accept a pending client and run its handshake on a worker thread."""
+        try:
+            conn, addr = self.server_socket.accept()
+        except socket.timeout:
+            return
+        except ConnectionError as e:
+            logger.error(f"Connection error: {e}")
+            return
+
+        # Set timeout on client socket for data operations
+        conn.settimeout(SOCKET_TIMEOUT)
+        # Small framed replies should not wait on Nagle's algorithm
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        logger.info(f"Connected by {addr}")
+        self._pool.submit(self.handle_connection, conn)
+
+    def _park_connection(self, conn: socket.socket, state: _ConnectionState) -> None:
+        """Return an idle connection to the event loop to wait for its next request."""
+        self._parked.put((conn, state))
+        self._wakeup_w.send(b"\0")
+
+    def _register_parked_connections(self) -> None:
+        """Register connections handed back by workers with the selector."""
+        self._wakeup_r.recv(BUFFER_SIZE)
         while True:
             try:
-                conn, addr = self.server_socket.accept()
-                # Set timeout on client socket for data operations
-                conn.settimeout(SOCKET_TIMEOUT)
-                logger.info(f"Connected by {addr}")
-                self.handle_connection(conn)
-            except socket.timeout:
-                # Handle timeout, allow checking for keyboard interrupt
-                continue
-            except ConnectionError as e:
-                logger.error(f"Connection error: {e}")
-                continue
+                conn, state = self._parked.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                self._selector.register(conn, selectors.EVENT_READ, state)
+            except (ValueError, OSError) as e:
+                logger.debug(f"Dropping closed connection: {e}")
+                self._close_connection(conn)
+
+    @staticmethod
+    def _close_connection(conn: socket.socket) -> None:
+        """Close a client connection, ignoring errors from dead sockets."""
+        try:
+            conn.close()
+        except Exception as e:
+            logger.debug(f"Error closing connection: {e}")
 
     def _setup_socket(self, port: int) -> None:
         """
@@ -330,12 +808,14 @@ class Server:
 
         Creates a socket that:
         - Allows address reuse (SO_REUSEADDR)
+        - Disables Nagle's algorithm (TCP_NODELAY)
         - Has a timeout to enable graceful shutdown
         - Listens on all interfaces (empty host string)
         """
         try:
             self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.server_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             # Set a timeout to allow graceful shutdown on keyboard interrupt
             self.server_socket.settimeout(SERVER_LISTEN_TIMEOUT)
             self.server_socket.bind(("", port))
@@ -345,16 +825,16 @@ class Server:
             logger.error(f"Failed to create server socket: {e}")
             raise
 
-    def _receive_config(self, conn: socket.socket) -> dict:
+    def _receive_config(self, conn: socket.socket) -> Optional[bytes]:
         """
-        Receive and parse configuration from client.
+        Receive the encoded configuration from client.
 
         Implements a length-prefixed protocol for receiving structured data:
         1. First 4 bytes indicate the total message length
-        2. Remaining bytes contain the serialized configuration
+        2. Remaining bytes contain the encoded configuration envelope
 
         Returns:
-            The deserialized configuration dictionary
+            The raw configuration envelope, or None if reception failed
         """
         try:
             # Read the length prefix (4 bytes)
@@ -364,14 +844,14 @@ class Server:
                 or len(config_length_bytes) != LENGTH_PREFIX_SIZE
             ):
                 logger.error("Failed to receive config length prefix")
-                return {}
+                return None
 
-            config_length = int.from_bytes(config_length_bytes, "big")
+            (config_length,) = _LENGTH_PREFIX.unpack(config_length_bytes)
             logger.debug(f"Expecting config data of length {config_length} bytes")
 
             if not self.compress_data:
                 logger.error("Compression not initialized")
-                return {}
+                return None
 
             # Receive the raw config data (no compression for config)
             config_data = self.compress_data.receive_full_message(
@@ -380,20 +860,72 @@ class Server:
 
             if not config_data:
                 logger.error("Failed to receive config data")
-                return {}
-
-            # Deserialize using pickle
-            try:
-                config = pickle.loads(config_data)
-                logger.debug("Successfully received and parsed configuration")
-                return config
-            except Exception as e:
-                logger.error(f"Failed to deserialize config: {e}")
-                return {}
+                return None
+            return config_data
 
         except Exception as e:
             logger.error(f"Error receiving config: {e}")
-            return {}
+            return None
+
+    def _get_experiment(self, config_data: bytes) -> Optional[_ExperimentEntry]:
+        """
+        Return the experiment for an encoded config, setting it up on first use.
+
+        Clients reconnecting with byte-identical configs reuse the parsed config
+        and the already built model instead of repeating experiment setup. The
+        cache keeps the most recently used EXPERIMENT_CACHE_SIZE experiments.
+        """
+        digest = hashlib.blake2b(config_data, digest_size=16).digest()
+        with self._experiment_cache_lock:
+            entry = self._experiment_cache.get(digest)
+            if entry is not None:
+                self._experiment_cache.move_to_end(digest)
+                logger.info("Reusing experiment for previously seen config")
+                return entry
+
+        try:
+            config, compression = unpack_config(
+                config_data, allow_pickle=self.allow_pickle_config
+            )
+            logger.debug("Successfully received and parsed configuration")
+        except Exception as e:
+            logger.error(f"Failed to deserialize config: {e}")
+            return None
+        if not config:
+            return None
+
+        # Initialize experiment based on received configuration
+        try:
+            manager = ExperimentManager(config)
+            experiment = manager.setup_experiment()
+            experiment.model.eval()
+            logger.info("Experiment initialized successfully with received config")
+        except Exception as e:
+            logger.error(f"Failed to initialize experiment: {e}")
+            return None
+
+        batcher = None
+        if config.get("default", {}).get("dynamic_batch", False):
+            batcher = _MicroBatcher(experiment, cpus=self._gpu_cpus)
+        entry = _ExperimentEntry(
+            config, compression, experiment, manager=manager, batcher=batcher
+        )
+        if config.get("default", {}).get("compile_server_model", False):
+            entry.compiled = {}
+
+        with self._experiment_cache_lock:
+            existing = self._experiment_cache.get(digest)
+            if existing is not None:
+                # Another connection set up the same config concurrently
+                if batcher is not None:
+                    batcher.close()
+                return existing
+            self._experiment_cache[digest] = entry
+            while len(self._experiment_cache) > EXPERIMENT_CACHE_SIZE:
+                _, evicted = self._experiment_cache.popitem(last=False)
+                if evicted.batcher is not None:
+                    evicted.batcher.close()
+        return entry
 
     def _process_data(
         self,
@@ -401,6 +933,10 @@ class Server:
         output: torch.Tensor,
         original_size: Tuple[int, int],
         split_layer_index: int,
+        batcher: Optional[_MicroBatcher] = None,
+        lock: Optional[threading.Lock] = None,
+        compiled: Optional[Dict[Tuple[int, Tuple[int, ...], torch.dtype], Any]] = None,
+        process_tensor: Optional[Callable[..., Any]] = None,
     ) -> Tuple[Any, float]:
         """
         Process received tensor data through the model and measure performance.
@@ -414,144 +950,296 @@ class Server:
             output: The tensor output from the client
             original_size: Original size information
             split_layer_index: The index of the split layer
+            batcher: Optional micro-batcher coalescing concurrent requests
+            lock: Optional lock guarding a model shared between connections
+            compiled: Optional cache of shape-specialized compiled forwards
+            process_tensor: Optional bound `experiment.process_tensor`
 
         Returns:
             Tuple of (processed_result, processing_time)
         """
-        server_start_time = time.time()
-        processed_result = experiment.process_data(
-            {"input": (output, original_size), "split_layer": split_layer_index}
-        )
-        return processed_result, time.time() - server_start_time
+        server_start_ns = time.perf_counter_ns()
+        if batcher is not None:
+            processed_result = batcher.submit(output, original_size, split_layer_index)
+            return processed_result, (time.perf_counter_ns() - server_start_ns) / 1e9
+
+        device = getattr(experiment, "device", None)
+        if (
+            self._h2d_stream is not None
+            and isinstance(output, torch.Tensor)
+            and device is not None
+            and device.type == "cuda"
+        ):
+            output = self._copy_to_device(output, device)
+        with lock or nullcontext():
+            forward = None
+            if compiled is not None and isinstance(output, torch.Tensor):
+                forward = self._compiled_forward(
+                    experiment, compiled, split_layer_index, output
+                )
+            forward = forward or process_tensor or experiment.process_tensor
+            processed_result = forward(output, original_size, split_layer_index)
+        return processed_result, (time.perf_counter_ns() - server_start_ns) / 1e9
 
-    @contextmanager
-    def _safe_connection(self, conn: socket.socket) -> Generator[None, None, None]:
+    def _copy_to_device(
+        self, tensor: torch.Tensor, device: torch.device
+    ) -> torch.Tensor:
         """
-        Context manager for safely handling client connections.
+        Upload a CPU tensor to the GPU through a reusable pinned staging buffer.
 
-        Ensures proper exception handling and connection cleanup regardless
-        of how the connection processing terminates.
+        Pinned memory allows DMA transfers, and issuing the copy on a dedicated
+        stream keeps it off the default compute stream.
         """
-        try:
-            yield
-        except Exception as e:
-            logger.error(f"Error handling connection: {e}", exc_info=True)
-        finally:
-            try:
-                conn.close()
-            except Exception as e:
-                logger.debug(f"Error closing connection: {e}")
+        pinned = getattr(self._local, "pinned", None)
+        if (
+            pinned is None
+            or pinned.shape != tensor.shape
+            or pinned.dtype != tensor.dtype
+        ):
+            pinned = torch.empty_like(tensor, device="cpu").pin_memory()
+            self._local.pinned = pinned
+
+        pinned.copy_(tensor)
+        with torch.cuda.stream(self._h2d_stream):
+            device_tensor = pinned.to(device, non_blocking=True)
+
+        # Make the compute stream wait for the upload before using the tensor
+        compute_stream = torch.cuda.current_stream(device)
+        compute_stream.wait_stream(self._h2d_stream)
+        device_tensor.record_stream(compute_stream)
+        return device_tensor
 
     def handle_connection(self, conn: socket.socket) -> None:
         """
-        Handle an individual client connection for split computing.
+        Handle the setup phase of a client connection for split computing.
 
         The connection handling protocol follows these steps:
         1. Receive experiment configuration from client
         2. Initialize experiment based on received configuration
         3. Send acknowledgment to client
-        4. Enter processing loop to handle tensor data
-           - Receive intermediate tensors from client
-           - Process tensors through the model from the split point
-           - Send results back to client
-        """
-        with self._safe_connection(conn):
-            # Receive configuration from the client
-            config = self._receive_config(conn)
-            if not config:
-                logger.error("Failed to receive valid configuration from client")
-                return
+        4. Park the connection in the event loop; each request it sends is
+           then processed by `_serve_ready` on a worker thread
+        """
+        try:
+            state = self._handshake(conn)
+        except Exception as e:
+            logger.error(f"Error handling connection: {e}", exc_info=True)
+            state = None
 
-            # Update compression settings based on received config
-            self._update_compression(config)
+        if state is None:
+            self._close_connection(conn)
+            return
+        self._park_connection(conn, state)
+
+    def _handshake(self, conn: socket.socket) -> Optional[_ConnectionState]:
+        """Receive the client config, set up its experiment and acknowledge it."""
+        # Receive configuration from the client
+        config_data = self._receive_config(conn)
+        entry = self._get_experiment(config_data) if config_data else None
+        if entry is None:
+            logger.error("Failed to receive valid configuration from client")
+            return None
 
-            # Initialize experiment based on received configuration
-            try:
-                self.experiment_manager = ExperimentManager(config)
-                experiment = self.experiment_manager.setup_experiment()
-                experiment.model.eval()
-                logger.info("Experiment initialized successfully with received config")
-            except Exception as e:
-                logger.error(f"Failed to initialize experiment: {e}")
-                return
+        # Select compression settings based on received config; when the
+        # client sent none (AUTO handshake flag, or a legacy config without a
+        # compression section), the codec is chosen from the measured link speed
+        compressor = self._update_compression(entry.config, entry.compression)
+        auto_codec = entry.compression is None and not entry.config.get(
+            "compression"
+        )
 
-            # Cache torch.no_grad() context for inference
-            no_grad_context = torch.no_grad()
+        # Send acknowledgment to the client - must be exactly b"OK"
+        conn.sendall(ACK_MESSAGE)
+        logger.debug("Sent 'OK' acknowledgment to client")
+        return _ConnectionState(
+            entry,
+            compressor,
+            auto_codec,
+            _ZeroCopySender.create(conn),
+            entry.experiment.process_tensor,
+        )
 
-            # Send acknowledgment to the client - must be exactly b"OK"
-            conn.sendall(ACK_MESSAGE)
-            logger.debug("Sent 'OK' acknowledgment to client")
+    def _compiled_forward(
+        self,
+        experiment: Any,
+        compiled: Dict[Tuple[int, Tuple[int, ...], torch.dtype], Any],
+        split_layer_index: int,
+        output: torch.Tensor,
+    ) -> Optional[Callable[..., Any]]:
+        """
+        Return the compiled forward for this split layer and input shape.
 
-            # Process incoming data in a loop
-            while True:
-                try:
-                    # Receive header - 8 bytes total (4 for split index, 4 for length)
-                    header = conn.recv(LENGTH_PREFIX_SIZE * 2)
-                    if not header or len(header) != LENGTH_PREFIX_SIZE * 2:
-                        logger.info("Client disconnected or sent invalid header")
-                        break
-
-                    split_layer_index = int.from_bytes(
-                        header[:LENGTH_PREFIX_SIZE], "big"
-                    )
-                    expected_length = int.from_bytes(header[LENGTH_PREFIX_SIZE:], "big")
-                    logger.debug(
-                        f"Received header: split_layer={split_layer_index}, data_length={expected_length}"
-                    )
+        Each (split layer, shape, dtype) key gets its own torch.compile with
+        dynamic=False, so Inductor specializes kernels to the exact shape and
+        reduce-overhead mode replays CUDA graphs after warmup. Returns None
+        when the key cannot be compiled and should run eagerly.
+        """
+        key = (split_layer_index, tuple(output.shape), output.dtype)
+        if key in compiled:
+            return compiled[key]
 
-                    # Receive compressed data from client
-                    if not self.compress_data:
-                        logger.error("Compression not initialized")
-                        break
+        model = self._compile_model(experiment.model)
+        if model is experiment.model:
+            compiled[key] = None
+            return None
 
-                    compressed_data = self.compress_data.receive_full_message(
-                        conn=conn, expected_length=expected_length
-                    )
+        try:
+            # Compilation happens on the first call; warm up before caching
+            model(
+                output.to(experiment.device, non_blocking=True),
+                start=split_layer_index,
+            )
+            logger.info(f"Compiled server model for split {key[0]}, shape {key[1]}")
+        except Exception as e:
+            logger.warning(f"Model compilation failed, using eager model: {e}")
+            compiled[key] = None
+            return None
+        forward = partial(experiment.process_tensor, model=model)
+        compiled[key] = forward
+        return forward
 
-                    if not compressed_data:
-                        logger.warning("Failed to receive compressed data from client")
-                        break
+    @staticmethod
+    def _compile_model(model: torch.nn.Module) -> torch.nn.Module:
+        """
+        Compile the server-side model with torch.compile when available.
 
-                    logger.debug(
-                        f"Received {len(compressed_data)} bytes of compressed data"
-                    )
+        Enabled by the `default.compile_server_model` config flag. Shapes are
+        treated as static; `_compiled_forward` compiles once per input shape.
+        Falls back to the eager model if compilation is unsupported.
+        """
+        if not hasattr(torch, "compile"):
+            logger.warning("torch.compile not available, using eager model")
+            return model
+        try:
+            return torch.compile(model, mode="reduce-overhead", dynamic=False)
+        except Exception as e:
+            logger.warning(f"Model compilation failed, using eager model: {e}")
+            return model
 
-                    # Process the data
-                    with no_grad_context:
-                        # Decompress received data
-                        output, original_size = self.compress_data.decompress_data(
-                            compressed_data=compressed_data
-                        )
-
-                        # Process data using the experiment's model
-                        processed_result, processing_time = self._process_data(
-                            experiment=experiment,
-                            output=output,
-                            original_size=original_size,
-                            split_layer_index=split_layer_index,
-                        )
-
-                        # Update metrics
-                        self.metrics.update(processing_time)
-
-                    logger.debug(f"Processed data in {processing_time:.4f}s")
-
-                    # Compress the processed result to send back
-                    compressed_result, result_size = self.compress_data.compress_data(
-                        processed_result
-                    )
+    def _serve_ready(self, conn: socket.socket, state: _ConnectionState) -> None:
+        """
+        Serve one pending request, then park the connection or close it.
 
-                    # Send result back to client
-                    self._send_result(
-                        conn, result_size, processing_time, compressed_result
-                    )
-                    logger.debug(
-                        f"Sent result of size {result_size} bytes back to client"
-                    )
+        Runs on a worker thread under inference mode.
+        """
+        keep_open = False
+        try:
+            with torch.inference_mode():
+                keep_open = self._serve_request(conn, state)
+        except Exception as e:
+            logger.error(f"Error processing client data: {e}", exc_info=True)
 
-                except Exception as e:
-                    logger.error(f"Error processing client data: {e}", exc_info=True)
-                    break
+        if keep_open:
+            self._park_connection(conn, state)
+        else:
+            self._close_connection(conn)
+
+    def _serve_request(self, conn: socket.socket, state: _ConnectionState) -> bool:
+        """
+        Process a single split computation request from a client.
+
+        The request is received, run through the model from its split point,
+        and answered with the compressed result. Returns False once the client
+        has disconnected.
+        """
+        # Receive header - 8 bytes total (4 for split index, 4 for length)
+        header = conn.recv(_REQUEST_HEADER.size)
+        if not header or len(header) != _REQUEST_HEADER.size:
+            logger.info("Client disconnected or sent invalid header")
+            return False
+
+        split_layer_index, expected_length = _REQUEST_HEADER.unpack(header)
+        logger.debug(
+            f"Received header: split_layer={split_layer_index}, data_length={expected_length}"
+        )
+
+        # A link speed sample only times the bytes that were still on the
+        # wire: whatever the kernel had already buffered is read at memory
+        # speed and would inflate the estimate
+        probe = state.auto_codec and expected_length >= BANDWIDTH_PROBE_MIN_BYTES
+        if probe:
+            probe_start = time.perf_counter()
+            buffered = min(_queued_bytes(conn), expected_length)
+
+        # Receive compressed data from client
+        compressed_data = state.compressor.receive_full_message_into(
+            conn, expected_length, self._receive_view(expected_length)
+        )
+        if probe:
+            elapsed = time.perf_counter() - probe_start
+            timed = expected_length - buffered
+            if timed >= BANDWIDTH_PROBE_MIN_BYTES:
+                link_mbps = timed * 8 / max(elapsed, 1e-6) / 1e6
+                settings = self._auto_select_codec(link_mbps)
+                logger.info(
+                    f"Measured link at {link_mbps:.1f} Mbit/s, "
+                    f"using compression settings {settings}"
+                )
+                state.compressor = DataCompression(settings)
+                state.auto_codec = False
+            else:
+                logger.debug(
+                    f"{buffered} of {expected_length} request bytes were already "
+                    "buffered, deferring link measurement to a larger request"
+                )
+
+        if not compressed_data:
+            logger.warning("Failed to receive compressed data from client")
+            return False
+
+        # Per-request messages are only built when debug logging is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(f"Received {len(compressed_data)} bytes of compressed data")
+
+        # Decompress received data
+        output, original_size = state.compressor.decompress_data(
+            compressed_data=compressed_data
+        )
+
+        # Process data using the experiment's model
+        processed_result, processing_time = self._process_data(
+            experiment=state.entry.experiment,
+            output=output,
+            original_size=original_size,
+            split_layer_index=split_layer_index,
+            batcher=state.entry.batcher,
+            lock=state.entry.lock,
+            compiled=state.entry.compiled,
+            process_tensor=state.process_tensor,
+        )
+
+        # Update metrics
+        self.metrics.update(processing_time)
+
+        if debug:
+            logger.debug(f"Processed data in {processing_time:.4f}s")
+
+        # Compress the processed result to send back
+        compressed_result, result_size = state.compressor.compress_data(
+            processed_result
+        )
+
+        # Send result back to client
+        self._send_result(
+            conn, result_size, processing_time, compressed_result, state.zerocopy
+        )
+        if debug:
+            logger.debug(f"Sent result of size {result_size} bytes back to client")
+        return True
+
+    def _receive_view(self, size: int) -> memoryview:
+        """
+        Return this worker's reusable receive buffer, grown to hold `size` bytes.
+
+        Each connection thread owns its buffer, so tensor payloads are received
+        without per-message allocation and without sharing across clients.
+        """
+        rx_view = getattr(self._local, "rx_view", None)
+        if rx_view is None or len(rx_view) < size:
+            rx_view = memoryview(bytearray(max(size, RECEIVE_BUFFER_SIZE)))
+            self._local.rx_view = rx_view
+        return rx_view
 
     def _send_result(
         self,
@@ -559,49 +1247,76 @@ class Server:
         result_size: int,
         processing_time: float,
         compressed_result: bytes,
+        zerocopy: Optional[_ZeroCopySender] = None,
     ) -> None:
         """
         Send the processed result back to the client using framed protocol.
 
         The response protocol uses:
         1. 4-byte length prefix for result size
-        2. 4-byte field for processing time (as padded string)
+        2. 4-byte field for processing time (big-endian float32)
         3. Variable-length compressed result data
+
+        Small replies are written with a single scatter-gather sendmsg() call;
+        large payloads are sent separately to avoid extra kernel buffering, and
+        use MSG_ZEROCOPY when the connection supports it.
         """
         try:
-            # Send result size as header (4 bytes)
-            size_bytes = result_size.to_bytes(LENGTH_PREFIX_SIZE, "big")
-            conn.sendall(size_bytes)
+            header = _RESULT_HEADER.pack(result_size, processing_time)
 
-            # Send processing time as fixed-length bytes (4 bytes)
-            # Format as a string, pad/truncate to exactly 4 bytes
-            time_str = str(processing_time).ljust(LENGTH_PREFIX_SIZE)
-            time_bytes = time_str[:LENGTH_PREFIX_SIZE].encode()
-            conn.sendall(time_bytes)
-
-            # Send compressed result data
-            conn.sendall(compressed_result)
+            if len(compressed_result) > SENDMSG_MAX_PAYLOAD or not hasattr(
+                conn, "sendmsg"
+            ):
+                conn.sendall(header)
+                if zerocopy is not None and result_size >= ZEROCOPY_MIN_PAYLOAD:
+                    zerocopy.send(compressed_result)
+                else:
+                    conn.sendall(memoryview(compressed_result))
+            else:
+                self._sendmsg_all(conn, [header, compressed_result])
 
         except Exception as e:
             logger.error(f"Error sending result: {e}")
             raise
 
-    def _update_compression(self, config: dict) -> None:
+    @staticmethod
+    def _sendmsg_all(conn: socket.socket, buffers: List[bytes]) -> None:
+        """Write all buffers with sendmsg(), resuming after partial writes."""
+        views = [memoryview(buf) for buf in buffers]
+        while views:
+            sent = conn.sendmsg(views)
+            while views and sent >= len(views[0]):
+                sent -= len(views.pop(0))
+            if sent:
+                views[0] = views[0][sent:]
+
+    def _update_compression(
+        self, config: dict, compression: Optional[CompressionConfig] = None
+    ) -> DataCompression:
         """
-        Update compression settings from received configuration.
+        Select compression settings for a connection from its configuration.
 
         Compression settings affect the tradeoff between:
         - Network bandwidth usage
         - CPU utilization for compression/decompression
         - Memory usage during transfer
+
+        Settings decoded from the handshake header take precedence over the
+        dictionary in the config body. Returns a compressor owned by the
+        connection, leaving the server default untouched for other clients.
         """
+        if compression is not None:
+            # The handshake header carries codec settings only
+            dtype_policy = config.get("compression", {}).get("dtype_policy")
+            if dtype_policy:
+                compression = replace(compression, dtype_policy=dtype_policy)
+            logger.debug(f"Updating compression settings: {compression}")
+            return DataCompression(compression)
         if "compression" in config:
             logger.debug(f"Updating compression settings: {config['compression']}")
-            self.compress_data = DataCompression(config["compression"])
-        else:
-            logger.warning(
-                "No compression settings in config, keeping minimal settings"
-            )
+            return DataCompression(config["compression"])
+        logger.warning("No compression settings in config, keeping default settings")
+        return self.compress_data or DataCompression(SERVER_COMPRESSION_SETTINGS)
 
     def cleanup(self) -> None:
         """
@@ -620,6 +1335,25 @@ class Server:
             except Exception as e:
                 logger.error(f"Error during socket cleanup: {e}")
 
+        # Let in-flight requests finish, then close idle client connections
+        self._pool.shutdown(wait=True)
+        if self._selector is not None:
+            for key in list(self._selector.get_map().values()):
+                if key.data is not None:
+                    self._close_connection(key.fileobj)
+            self._selector.close()
+            self._selector = None
+        while not self._parked.empty():
+            self._close_connection(self._parked.get_nowait()[0])
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+
+        with self._experiment_cache_lock:
+            for entry in self._experiment_cache.values():
+                if entry.batcher is not None:
+                    entry.batcher.close()
+            self._experiment_cache.clear()
+
         if logging_server:
             shutdown_logging_server(logging_server)
 
@@ -647,6 +1381,11 @@ def parse_arguments() -> argparse.Namespace:
         help="Path to configuration file (required for local mode)",
         required=False,
     )
+    parser.add_argument(
+        "--allow-pickle-config",
+        action="store_true",
+        help="Accept pickled client configs (trusted clients only)",
+    )
     args = parser.parse_args()
 
     if args.local and not args.config:
@@ -658,7 +1397,11 @@ def parse_arguments() -> argparse.Namespace:
 if __name__ == "__main__":
     args = parse_arguments()
 
-    server = Server(local_mode=args.local, config_path=args.config)
+    server = Server(
+        local_mode=args.local,
+        config_path=args.config,
+        allow_pickle_config=args.allow_pickle_config,
+    )
     try:
         server.start()
     except KeyboardInterrupt:
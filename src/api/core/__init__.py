@@ -25,6 +25,8 @@ from .log_manager import (
     setup_logger,
     start_logging_server,
     shutdown_logging_server,
+    start_async_logging,
+    stop_async_logging,
     get_logger,
 )
 
@@ -53,5 +55,7 @@ __all__ = [
     "setup_logger",
     "start_logging_server",
     "shutdown_logging_server",
+    "start_async_logging",
+    "stop_async_logging",
     "get_logger",
 ]
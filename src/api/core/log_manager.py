@@ -1,6 +1,7 @@
 """Logging system for the application."""
 
 import logging
+import queue
 import socket
 import socketserver
 import struct
@@ -10,7 +11,12 @@ from enum import Enum, auto
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Final, ClassVar
 
-from logging.handlers import RotatingFileHandler, SocketHandler
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    SocketHandler,
+)
 from rich.logging import RichHandler
 
 from .exceptions import NetworkError, ConnectionError
@@ -203,29 +209,32 @@ class BufferedSocketHandler(SocketHandler):
             self.handleError(record)
 
     def flush(self) -> None:
-        """Flush buffered logs by sending each message over the socket."""
+        """Flush buffered logs by sending them over the socket in a single write."""
         if not self.buffer or self.connection_error:
             return
 
         with self.lock:
-            try:
-                for msg in self.buffer:
-                    self._send_log(msg)
-            finally:
-                self.buffer.clear()
+            batch = self.buffer
+            self.buffer = []
+            self._send_logs(batch)
 
-    def _send_log(self, msg: str) -> None:
-        """Send a single log message with length-prefixed framing for proper message boundaries."""
+    def _send_logs(self, messages: List[str]) -> None:
+        """Send log messages with length-prefixed framing, coalesced into one payload."""
         if not self.sock or self.connection_error:
             return
 
-        try:
+        frames = []
+        for msg in messages:
             msg_bytes = msg.encode("utf-8")
             # Prepend the message length as a 4-byte big-endian integer
-            self.sock.sendall(struct.pack(">L", len(msg_bytes)) + msg_bytes)
+            frames.append(struct.pack(">L", len(msg_bytes)))
+            frames.append(msg_bytes)
+
+        try:
+            self.sock.sendall(b"".join(frames))
         except BlockingIOError:
-            # If non-blocking send fails, re-buffer the message
-            self.buffer.append(msg)
+            # If non-blocking send fails, re-buffer the messages
+            self.buffer[:0] = messages
         except Exception:
             self.connection_error = True
             raise
@@ -444,6 +453,46 @@ def shutdown_logging_server(server: DaemonThreadingTCPServer) -> None:
         server.server_close()
 
 
+def start_async_logging(
+    logger_name: str = "split_computing_logger",
+) -> Optional[QueueListener]:
+    """Move a logger's handlers behind a queue drained by a background thread.
+
+    Logging calls then only enqueue the record; formatting and I/O happen on
+    the listener thread. Returns None if the logger has no handlers to move.
+    """
+    logger = logging.getLogger(logger_name)
+    handlers = [h for h in logger.handlers if not isinstance(h, QueueHandler)]
+    if not handlers:
+        return None
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    for handler in handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    return listener
+
+
+def stop_async_logging(
+    listener: Optional[QueueListener],
+    logger_name: str = "split_computing_logger",
+) -> None:
+    """Drain the queue, stop the listener and restore the original handlers."""
+    if not listener:
+        return
+
+    listener.stop()
+    logger = logging.getLogger(logger_name)
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    for handler in listener.handlers:
+        logger.addHandler(handler)
+
+
 def get_logger() -> logging.Logger:
     """Get the pre-configured application logger."""
     return logging.getLogger("split_computing_logger")
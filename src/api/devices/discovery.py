@@ -1,81 +1,305 @@
 """Network discovery utilities"""
 
+import errno
+import itertools
 import logging
+import os
+import selectors
 import socket
-from concurrent.futures import ThreadPoolExecutor
-from queue import Queue
-from typing import List, Union, Optional, Callable
-
-import ipaddress
+import subprocess
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from ..core import NetworkError
 from ..network.protocols import (
     SSH_PORT,
     DISCOVERY_TIMEOUT,
-    MAX_DISCOVERY_THREADS,
+    MAX_DISCOVERY_CONNECTIONS,
     DEFAULT_LOCAL_CIDR,
+    DISCOVERY_DNS_TTL,
+    DISCOVERY_FD_RESERVE,
 )
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore
+
 logger = logging.getLogger("split_computing_logger")
 
+# Kernel neighbour table (Linux); `ip neigh` is used where it is unavailable
+_PROC_ARP = "/proc/net/arp"
+# Neighbour states that indicate a host answered recently
+_NEIGH_SEEN_STATES = {"REACHABLE", "STALE", "DELAY", "PROBE", "PERMANENT"}
+
+# Resolved hostnames: (host, port) -> (socket address, time.monotonic())
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[Any, float]] = {}
+_DNS_CACHE_LOCK = threading.Lock()
+
+
+def _resolve(host: str, port: int) -> Any:
+    """Return the IPv4 socket address for a host, skipping DNS for IP literals.
+
+    Addresses are parsed with AI_NUMERICHOST, so they never reach the
+    resolver; hostnames are resolved normally and cached for DISCOVERY_DNS_TTL.
+    """
+    try:
+        return socket.getaddrinfo(
+            host, port, socket.AF_INET, socket.SOCK_STREAM, 0, socket.AI_NUMERICHOST
+        )[0][4]
+    except socket.gaierror:
+        pass
+
+    key = (host, port)
+    with _DNS_CACHE_LOCK:
+        cached = _DNS_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[1] < DISCOVERY_DNS_TTL:
+        return cached[0]
+
+    address = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)[0][4]
+    with _DNS_CACHE_LOCK:
+        _DNS_CACHE[key] = (address, time.monotonic())
+    return address
+
+
+def _max_open_probes(max_connections: int) -> int:
+    """Cap concurrent probe sockets to what the file descriptor limit allows."""
+    if resource is None:
+        return max_connections
+    try:
+        soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (OSError, ValueError):
+        return max_connections
+    if soft_limit == resource.RLIM_INFINITY:
+        return max_connections
+    return max(1, min(max_connections, soft_limit - DISCOVERY_FD_RESERVE))
+
 
 class LAN:
     """Provides utilities for host discovery and reachability testing in local networks."""
 
-    # Generate IP address list from CIDR notation
-    LOCAL_CIDR_BLOCK: List[str] = [
-        str(ip) for ip in ipaddress.ip_network(DEFAULT_LOCAL_CIDR).hosts()
-    ]
+    @staticmethod
+    def iter_local_cidr(cidr: str = DEFAULT_LOCAL_CIDR) -> Iterator[str]:
+        """Return a lazy iterator over the host addresses of a CIDR block."""
+        import ipaddress
+
+        return map(str, ipaddress.ip_network(cidr).hosts())
+
+    @staticmethod
+    def _arp_seen_hosts(cidr: str = DEFAULT_LOCAL_CIDR) -> Set[str]:
+        """Return the addresses in `cidr` that the kernel's ARP cache has seen.
+
+        Reads /proc/net/arp, falling back to `ip neigh show`. Returns an empty
+        set if neither is available.
+        """
+        import ipaddress
+
+        network = ipaddress.ip_network(cidr)
+        seen: Set[str] = set()
+        try:
+            with open(_PROC_ARP) as arp_table:
+                next(arp_table, None)  # Header line
+                for line in arp_table:
+                    fields = line.split()
+                    # IP address, HW type, flags, HW address, mask, device;
+                    # flags 0x0 marks an incomplete entry
+                    if len(fields) >= 4 and int(fields[2], 16) != 0:
+                        seen.add(fields[0])
+        except (OSError, ValueError):
+            try:
+                output = subprocess.run(
+                    ["ip", "neigh", "show"],
+                    capture_output=True,
+                    text=True,
+                    timeout=DISCOVERY_TIMEOUT,
+                    check=True,
+                ).stdout
+            except (OSError, subprocess.SubprocessError):
+                return set()
+            for line in output.splitlines():
+                fields = line.split()
+                if fields and fields[-1] in _NEIGH_SEEN_STATES:
+                    seen.add(fields[0])
+
+        hosts = set()
+        for address in seen:
+            try:
+                if ipaddress.ip_address(address) in network:
+                    hosts.add(address)
+            except ValueError:
+                continue
+        return hosts
+
+    @staticmethod
+    def _open_probe(host: str, port: int) -> Optional[socket.socket]:
+        """Start a non-blocking connect to `host`, or return None if it failed."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            # Probes only need the handshake; allow quick reuse of local
+            # ports left in TIME_WAIT by repeated scans
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            address = _resolve(host, port)
+            sock.setblocking(False)
+            result = sock.connect_ex(address)
+        except Exception as error:
+            sock.close()
+            logger.debug(f"Host {host} is not reachable on port {port}: {error}")
+            return None
+        if result not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+            sock.close()
+            logger.debug(
+                f"Host {host} is not reachable on port {port}: {os.strerror(result)}"
+            )
+            return None
+        return sock
+
+    @classmethod
+    def scan(
+        cls,
+        hosts: Iterable[str],
+        port: int,
+        timeout: Union[int, float],
+        max_connections: int = MAX_DISCOVERY_CONNECTIONS,
+        callback: Optional[Callable[[str], None]] = None,
+        limit: Optional[int] = None,
+        deadline: Optional[float] = None,
+    ) -> List[str]:
+        """Return the hosts accepting TCP connections on `port`, in answer order.
+
+        Connects are issued to up to `max_connections` hosts at once on
+        non-blocking sockets and waited on together with a selector, so each
+        batch costs at most one `timeout` regardless of the OS connect timeout.
+        Batches are also kept below the process file descriptor limit, and
+        `hosts` is consumed lazily, so large blocks can be scanned in sweeps.
+
+        Each reachable host is passed to the optional `callback` as it answers.
+        The scan stops early once `limit` hosts are found or after `deadline`
+        seconds overall, closing the outstanding probes.
+        """
+        host_iter = iter(hosts)
+        batch_size = _max_open_probes(max_connections)
+        reachable: List[str] = []
+        scan_deadline = None if deadline is None else time.monotonic() + deadline
+        # Per-host messages are only built when debug logging is enabled
+        debug = logger.isEnabledFor(logging.DEBUG)
+        while limit is None or len(reachable) < limit:
+            if scan_deadline is not None and time.monotonic() >= scan_deadline:
+                logger.debug(f"Network scan stopped at {deadline}s deadline")
+                break
+            batch = list(itertools.islice(host_iter, batch_size))
+            if not batch:
+                break
+            with selectors.DefaultSelector() as selector:
+                try:
+                    for host in batch:
+                        sock = cls._open_probe(host, port)
+                        if sock is not None:
+                            selector.register(sock, selectors.EVENT_WRITE, host)
+
+                    batch_deadline = time.monotonic() + timeout
+                    if scan_deadline is not None:
+                        batch_deadline = min(batch_deadline, scan_deadline)
+                    while selector.get_map():
+                        if limit is not None and len(reachable) >= limit:
+                            break
+                        remaining = batch_deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        for key, _ in selector.select(remaining):
+                            sock, host = key.fileobj, key.data
+                            selector.unregister(sock)
+                            error = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                            sock.close()
+                            if error:
+                                if debug:
+                                    logger.debug(
+                                        f"Host {host} is not reachable on port "
+                                        f"{port}: {os.strerror(error)}"
+                                    )
+                                continue
+                            if debug:
+                                logger.debug(f"Host {host} is reachable on port {port}")
+                            reachable.append(host)
+                            if callback:
+                                callback(host)
+                            if limit is not None and len(reachable) >= limit:
+                                break
+
+                    if debug:
+                        for key in selector.get_map().values():
+                            logger.debug(
+                                f"Connection to host {key.data} on port {port} "
+                                "timed out or was abandoned"
+                            )
+                finally:
+                    for key in list(selector.get_map().values()):
+                        key.fileobj.close()
+        return reachable
 
     @classmethod
     def is_host_reachable(
         cls, host: str, port: int, timeout: Union[int, float]
     ) -> bool:
         """Test if a host is reachable by attempting a socket connection."""
-        try:
-            with socket.create_connection((host, port), timeout):
-                logger.debug(f"Host {host} is reachable on port {port}")
-                return True
-        except socket.timeout:
-            logger.debug(f"Connection to host {host} on port {port} timed out")
-            return False
-        except Exception as error:
-            logger.debug(f"Host {host} is not reachable on port {port}: {error}")
-            return False
+        return bool(cls.scan([host], port, timeout))
 
     @classmethod
     def get_available_hosts(
         cls,
-        hosts: Optional[List[str]] = None,
+        hosts: Optional[Iterable[str]] = None,
         port: int = SSH_PORT,
         timeout: Union[int, float] = DISCOVERY_TIMEOUT,
-        max_threads: int = MAX_DISCOVERY_THREADS,
+        max_connections: int = MAX_DISCOVERY_CONNECTIONS,
         callback: Optional[Callable[[str], None]] = None,
+        limit: Optional[int] = None,
+        deadline: Optional[float] = None,
     ) -> List[str]:
-        """Discover available hosts using parallel connection testing.
+        """Discover available hosts using concurrent connection testing.
 
-        Uses ThreadPoolExecutor to efficiently scan multiple hosts concurrently.
+        Probing is done by `scan`, at most `max_connections` hosts at a time.
         Each successful connection triggers the optional callback function.
+
+        Hosts are returned in the order they answered. The scan stops early once
+        `limit` hosts are found (e.g. 1 when any server will do) or after
+        `deadline` seconds overall.
+
+        Without explicit hosts, only local CIDR addresses present in the ARP
+        cache are probed; the full block is scanned if the cache is empty.
         """
-        # Use the provided list of hosts or default to the local CIDR block
-        hosts_to_check = hosts or cls.LOCAL_CIDR_BLOCK
-        available_hosts = Queue()
-
-        # Define a helper function to check each host
-        def check_host(host: str) -> None:
-            """Check if a host is reachable and add it to the queue if it is."""
-            if cls.is_host_reachable(host, port, timeout):
-                available_hosts.put(host)
-                if callback:
-                    callback(host)
+        # Use the provided hosts or default to the local CIDR block
+        hosts_to_check = hosts
+        if not hosts_to_check:
+            arp_hosts = cls._arp_seen_hosts()
+            if arp_hosts:
+                logger.debug(f"Probing {len(arp_hosts)} hosts seen in the ARP cache")
+                hosts_to_check = sorted(arp_hosts)
+            else:
+                hosts_to_check = cls.iter_local_cidr()
 
         try:
-            logger.debug(f"Checking availability of {len(hosts_to_check)} hosts")
-            # Use ThreadPoolExecutor to perform checks in parallel
-            with ThreadPoolExecutor(max_workers=max_threads) as executor:
-                executor.map(check_host, hosts_to_check)
-
-            available = list(available_hosts.queue)
+            logger.debug("Checking availability of hosts")
+            available = cls.scan(
+                hosts_to_check,
+                port,
+                timeout,
+                max_connections=max_connections,
+                callback=callback,
+                limit=limit,
+                deadline=deadline,
+            )
             logger.debug(f"Found {len(available)} available hosts")
             return available
         except Exception as e:
@@ -1,11 +1,18 @@
 """Manage devices and their SSH connections"""
 
+import atexit
+import copy
 import logging
 import os
 import socket
-import yaml
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Tuple, Any
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union, Tuple, Any
 
 from ..core import (
     SSHError,
@@ -15,18 +22,93 @@ from ..core import (
     KeyPermissionError,
 )
 from .discovery import LAN
-from ..network.ssh import SSHKeyHandler, SSHConfig, create_ssh_client
-from ..network.protocols import SSH_PORT, SSH_CONNECTIVITY_TIMEOUT, DEFAULT_PORT # noqa: F401
+from ..network.ssh import SSHClient, SSHKeyHandler, SSHConfig, create_ssh_client
+from ..network.protocols import (
+    SSH_PORT,
+    SSH_CONNECTIVITY_TIMEOUT,
+    SSH_DEFAULT_HANDSHAKE_TIMEOUT,
+    SSH_KEEPALIVE_INTERVAL,
+    SSH_REACHABILITY_TTL,
+    DEFAULT_PORT,
+)
 from ..utils.utils import get_repo_root
 
 logger = logging.getLogger("split_computing_logger")
 
+# Upper bound on devices initialized concurrently from the config file
+MAX_DEVICE_INIT_WORKERS = 8
+
+# Accepted spellings for `Device.get_attribute`, mapped to the
+# SSHConnectionParams attribute they refer to
+_ATTRIBUTE_ALIASES: Dict[str, str] = {
+    "host": "host",
+    "hostname": "host",
+    "host name": "host",
+    "user": "username",
+    "username": "username",
+    "usr": "username",
+    "user name": "username",
+    "port": "experiment_port",
+    "experiment_port": "experiment_port",
+    "ssh_port": "ssh_port",
+}
+
+
+def _env_timeout(name: str, default: float) -> float:
+    """Read a timeout override from the environment, falling back to `default`."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning(f"Ignoring invalid {name}={value!r}, using {default}s")
+        return default
+
+
+@lru_cache(maxsize=8)
+def _parse_devices_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a devices config file once per version of the file.
+
+    The stat fields only serve as part of the cache key, so an edited file
+    is parsed again.
+    """
+    import yaml
+    from ..utils.utils import YamlLoader
+
+    with open(path) as file:
+        return yaml.load(file, Loader=YamlLoader)
+
+
+@lru_cache(maxsize=32)
+def _load_key_cached(key_path: str, inode: int, mtime_ns: int, size: int) -> Any:
+    """Load a private key, parsing each version of a key file only once.
+
+    Devices commonly share a key file; the stat fields in the cache key make
+    a replaced or edited key file load again.
+    """
+    path = Path(key_path)
+    _, private_key = SSHKeyHandler.detect_and_load_key(path, path.read_bytes())
+    return private_key
+
 
 class SSHConnectionParams:
     """Encapsulates SSH connection parameters for a remote host."""
 
     REQUIRED_FIELDS = {"host", "user", "pkey_fp"}
-    TIMEOUT: float = SSH_CONNECTIVITY_TIMEOUT  # Timeout for connectivity checks
+    # Connectivity probe and SSH handshake timeouts (seconds). Defaults can be
+    # overridden per process with TRACR_PROBE_TIMEOUT / TRACR_SSH_TIMEOUT and
+    # per connection with the probe_timeout / ssh_timeout config fields
+    PROBE_TIMEOUT: float = _env_timeout("TRACR_PROBE_TIMEOUT", SSH_CONNECTIVITY_TIMEOUT)
+    SSH_HANDSHAKE_TIMEOUT: float = _env_timeout(
+        "TRACR_SSH_TIMEOUT", SSH_DEFAULT_HANDSHAKE_TIMEOUT
+    )
+    REACHABILITY_TTL: float = SSH_REACHABILITY_TTL  # Reuse window for check results
+
+    # Connectivity check results shared by all instances:
+    # (host, ssh_port) -> (reachable, time.monotonic() of the check)
+    _reachability_cache: Dict[Tuple[str, int], Tuple[bool, float]] = {}
+    _reachability_lock = threading.Lock()
 
     def __init__(
         self,
@@ -36,6 +118,8 @@ class SSHConnectionParams:
         port: Optional[int] = None,
         ssh_port: Optional[int] = None,
         is_default: bool = True,
+        probe_timeout: Optional[float] = None,
+        ssh_timeout: Optional[float] = None,
     ) -> None:
         """Initialize SSH connection parameters."""
         self.host = host
@@ -44,6 +128,17 @@ class SSHConnectionParams:
         self.experiment_port = port  # Port for experiment communication
         self.ssh_port = ssh_port or self.SSH_PORT  # Port for SSH connections
         self._is_default = is_default
+        self.probe_timeout = probe_timeout or self.PROBE_TIMEOUT
+        self.ssh_timeout = ssh_timeout or self.SSH_HANDSHAKE_TIMEOUT
+        # Per-connection overrides, written back by `to_dict`
+        self._timeout_overrides = {
+            key: value
+            for key, value in (
+                ("probe_timeout", probe_timeout),
+                ("ssh_timeout", ssh_timeout),
+            )
+            if value is not None
+        }
         logger.debug(f"Initialized SSHConnectionParams for host {host}")
 
     @property
@@ -73,6 +168,8 @@ class SSHConnectionParams:
             port=source.get("port"),  # Optional experiment port
             ssh_port=source.get("ssh_port"),  # Optional SSH port
             is_default=source.get("default", True),
+            probe_timeout=source.get("probe_timeout"),  # Optional probe timeout
+            ssh_timeout=source.get("ssh_timeout"),  # Optional SSH handshake timeout
         )
 
     def _set_username(self, username: str) -> None:
@@ -88,12 +185,10 @@ class SSHConnectionParams:
     def _set_rsa_key(self, rsa_key_path: Union[Path, str]) -> None:
         """Set and validate the RSA key path, resolving relative paths against project root.
 
-        Also verifies key permissions and detects key type.
+        Also verifies key permissions. The key itself is parsed on first access
+        to `private_key`, so unused alternate connections cost no key loading.
         """
         try:
-            # Get project root path
-            project_root = Path(get_repo_root())
-
             # Ensure rsa_key_path is a Path object
             rsa_path = (
                 Path(rsa_key_path)
@@ -101,27 +196,28 @@ class SSHConnectionParams:
                 else rsa_key_path
             )
 
-            # If the path is not absolute, resolve it relative to the project root
+            # If the path is not absolute, resolve it relative to the project
+            # root. Absolute paths (as produced by DeviceManager) are used as
+            # given, skipping the repository root search
             if not rsa_path.is_absolute():
-                rsa_path = project_root / rsa_path
+                rsa_path = (Path(get_repo_root()) / rsa_path).expanduser().absolute()
 
-            rsa_path = rsa_path.expanduser().absolute()
+            # Stat the key once; the existence and permission checks both
+            # work from this result
+            try:
+                key_stat = rsa_path.stat()
+            except OSError:
+                key_stat = None
 
-            if rsa_path.exists() and rsa_path.is_file():
+            if key_stat is not None and stat.S_ISREG(key_stat.st_mode):
                 # Verify key permissions
-                if not SSHKeyHandler.check_key_permissions(rsa_path):
+                if not SSHKeyHandler.check_key_permissions(rsa_path, key_stat):
                     error_msg = f"Invalid permissions for SSH key: {rsa_path}"
                     logger.error(error_msg)
                     raise KeyPermissionError(error_msg)
 
-                # Detect the type of the SSH key
-                key_type = SSHKeyHandler.detect_key_type(rsa_path)
-                logger.debug(f"Detected key type: {key_type} for {rsa_path}")
-
-                # Load the private key
-                self.private_key = SSHKeyHandler.load_key(str(rsa_path))
                 self.private_key_path = rsa_path
-                logger.debug(f"SSH key loaded successfully from {rsa_path}")
+                logger.debug(f"SSH key found at {rsa_path}")
             else:
                 error_msg = f"Invalid SSH key path: {rsa_path}"
                 logger.error(error_msg)
@@ -134,9 +230,66 @@ class SSHConnectionParams:
             logger.error(error_msg)
             raise ValidationError(error_msg) from e
 
+    @cached_property
+    def private_key(self) -> Any:
+        """The parsed private key, loaded on first access."""
+        key_stat = self.private_key_path.stat()
+        return _load_key_cached(
+            str(self.private_key_path),
+            key_stat.st_ino,
+            key_stat.st_mtime_ns,
+            key_stat.st_size,
+        )
+
     def is_host_reachable(self) -> bool:
-        """Check if the host is reachable on the configured SSH port."""
-        return LAN.is_host_reachable(self.host, self.ssh_port, self.TIMEOUT)
+        """Check if the host is reachable on the configured SSH port.
+
+        Results are reused for REACHABILITY_TTL seconds, so repeated checks of
+        the same host and port do not open a new connection each time.
+        """
+        key = (self.host, self.ssh_port)
+        with self._reachability_lock:
+            cached = self._reachability_cache.get(key)
+        if cached is not None and time.monotonic() - cached[1] < self.REACHABILITY_TTL:
+            return cached[0]
+
+        reachable = LAN.is_host_reachable(self.host, self.ssh_port, self.probe_timeout)
+        with self._reachability_lock:
+            self._reachability_cache[key] = (reachable, time.monotonic())
+        return reachable
+
+    @classmethod
+    def prime_reachability(cls, targets: Iterable[Tuple[str, int, float]]) -> None:
+        """Probe (host, ssh_port, probe_timeout) targets in one round and cache them.
+
+        Hosts sharing a port and timeout are scanned together, so connections
+        created afterwards answer `is_host_reachable` from the cache instead of
+        each probing on its own. Targets with a fresh cached result are skipped.
+        """
+        now = time.monotonic()
+        groups: Dict[Tuple[int, float], Set[str]] = {}
+        with cls._reachability_lock:
+            for host, port, timeout in targets:
+                cached = cls._reachability_cache.get((host, port))
+                if cached is None or now - cached[1] >= cls.REACHABILITY_TTL:
+                    groups.setdefault((port, timeout), set()).add(host)
+
+        for (port, timeout), hosts in groups.items():
+            reachable = set(LAN.scan(hosts, port, timeout))
+            checked = time.monotonic()
+            with cls._reachability_lock:
+                for host in hosts:
+                    cls._reachability_cache[(host, port)] = (host in reachable, checked)
+
+    @classmethod
+    def invalidate(cls, host: Optional[str] = None) -> None:
+        """Forget cached connectivity results for a host, or for all hosts."""
+        with cls._reachability_lock:
+            if host is None:
+                cls._reachability_cache.clear()
+            else:
+                for key in [key for key in cls._reachability_cache if key[0] == host]:
+                    del cls._reachability_cache[key]
 
     def get_ssh_config(self) -> SSHConfig:
         """Return an SSHConfig object with this connection's parameters."""
@@ -145,7 +298,8 @@ class SSHConnectionParams:
             user=self.username,
             private_key_path=self.private_key_path,
             port=self.ssh_port,  # Use SSH port for connections
-            timeout=self.TIMEOUT,
+            timeout=self.ssh_timeout,
+            pkey=self.private_key,
         )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -157,6 +311,7 @@ class SSHConnectionParams:
             "port": self.experiment_port,
             "ssh_port": self.ssh_port,
             "default": self.is_default(),
+            **self._timeout_overrides,
         }
 
     def is_default(self) -> bool:
@@ -178,6 +333,10 @@ class Device:
 
         self.device_type = device_record["device_type"]
 
+        # Persistent SSH session, opened on first use by `ssh_session`
+        self._ssh_client: Optional[SSHClient] = None
+        self._ssh_lock = threading.Lock()
+
         if "connection_params" not in device_record:
             raise ValidationError(
                 f"Device {self.device_type} missing 'connection_params'"
@@ -217,10 +376,8 @@ class Device:
             reverse=True,
         )
 
-        # Select the first connection that is reachable
-        self.working_cparams = next(
-            (cp for cp in self.connection_params if cp.is_host_reachable()), None
-        )
+        # Select the first connection (in priority order) that is reachable
+        self.working_cparams = self._select_reachable(self.connection_params)
 
         if self.working_cparams:
             logger.info(
@@ -233,6 +390,42 @@ class Device:
                 f"Device {self.device_type} is not reachable on any configured connection"
             )
 
+    @staticmethod
+    def _select_reachable(
+        connection_params: List[SSHConnectionParams],
+    ) -> Optional[SSHConnectionParams]:
+        """Probe all connections concurrently and return the first reachable one.
+
+        Connections keep their priority: a reachable connection is only chosen
+        once every connection ahead of it has been probed and found unreachable.
+        """
+        if len(connection_params) == 1:
+            cparams = connection_params[0]
+            return cparams if cparams.is_host_reachable() else None
+
+        executor = ThreadPoolExecutor(max_workers=len(connection_params))
+        try:
+            futures = {
+                executor.submit(cparams.is_host_reachable): index
+                for index, cparams in enumerate(connection_params)
+            }
+            results: List[Optional[bool]] = [None] * len(connection_params)
+            best: Optional[int] = None
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                if results[index] and (best is None or index < best):
+                    best = index
+                if best is not None and all(
+                    result is not None for result in results[:best]
+                ):
+                    break
+        finally:
+            # Remaining probes are lower priority; don't wait for them
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return connection_params[best] if best is not None else None
+
     def get_host(self) -> str:
         """Return the host address of the working connection."""
         if not self.working_cparams:
@@ -262,6 +455,21 @@ class Device:
         """Check if the device has a reachable connection."""
         return self.working_cparams is not None
 
+    def refresh_reachability(self) -> bool:
+        """Re-select the working connection and return whether one is reachable.
+
+        Cached probe results for this device's hosts are dropped first, so
+        every connection is probed again.
+        """
+        for cparams in self.connection_params:
+            SSHConnectionParams.invalidate(cparams.host)
+        working_cparams = self._select_reachable(self.connection_params)
+        if working_cparams is not self.working_cparams:
+            # The persistent session targets the old connection
+            self.close()
+            self.working_cparams = working_cparams
+        return self.is_reachable()
+
     def serialize(self) -> Tuple[str, Dict[str, Any]]:
         """Serialize the device to a (device_type, connection_params) tuple."""
         return self.device_type, {
@@ -270,17 +478,13 @@ class Device:
 
     def get_attribute(self, attribute: str) -> Optional[str]:
         """Retrieve a specific attribute of the active connection using case-insensitive matching."""
-        if self.working_cparams:
-            attr_clean = attribute.lower().strip()
-            if attr_clean in {"host", "hostname", "host name"}:
-                return self.working_cparams.host
-            if attr_clean in {"user", "username", "usr", "user name"}:
-                return self.working_cparams.username
-            if attr_clean in {"port", "experiment_port"}:
-                return str(self.working_cparams.experiment_port)
-            if attr_clean in {"ssh_port"}:
-                return str(self.working_cparams.ssh_port)
-        return None
+        if not self.working_cparams:
+            return None
+        name = _ATTRIBUTE_ALIASES.get(attribute.lower().strip())
+        if name is None:
+            return None
+        value = getattr(self.working_cparams, name)
+        return value if isinstance(value, str) else str(value)
 
     def create_ssh_client(self):
         """Create an SSH client for this device."""
@@ -292,25 +496,53 @@ class Device:
             user=self.working_cparams.username,
             private_key_path=self.working_cparams.private_key_path,
             port=self.working_cparams.ssh_port,
+            pkey=self.working_cparams.private_key,
         )
 
-    def execute_remote_command(self, command: str) -> Dict[str, Any]:
-        """Execute a command on the remote device via SSH."""
+    @contextmanager
+    def ssh_session(self) -> Iterator[SSHClient]:
+        """Yield this device's persistent SSH client, connecting on first use.
+
+        The client stays open between calls so that commands and transfers
+        reuse one authenticated connection instead of repeating the SSH
+        handshake; it reconnects by itself if the transport drops. Use of the
+        session is serialized per device. Call `close` to tear it down; open
+        sessions are also closed at interpreter exit.
+        """
         if not self.is_reachable():
             raise DeviceNotReachableError(f"Device {self.device_type} is not reachable")
 
-        client = self.create_ssh_client()
+        with self._ssh_lock:
+            if self._ssh_client is None:
+                self._ssh_client = create_ssh_client(
+                    host=self.working_cparams.host,
+                    user=self.working_cparams.username,
+                    private_key_path=self.working_cparams.private_key_path,
+                    port=self.working_cparams.ssh_port,
+                    timeout=self.working_cparams.ssh_timeout,
+                    keepalive_interval=SSH_KEEPALIVE_INTERVAL,
+                    pkey=self.working_cparams.private_key,
+                )
+                atexit.register(self.close)
+            yield self._ssh_client
+
+    def close(self) -> None:
+        """Close the persistent SSH session, if one is open."""
+        with self._ssh_lock:
+            if self._ssh_client is not None:
+                self._ssh_client.close()
+                self._ssh_client = None
+                atexit.unregister(self.close)
 
-        with client:
+    def execute_remote_command(self, command: str) -> Dict[str, Any]:
+        """Execute a command on the remote device via SSH."""
+        with self.ssh_session() as client:
             # Execute the command using the SSH client
             return client.execute_command(command)
 
     def transfer_files(self, source: Path, destination: Path) -> None:
         """Transfer files or directories to the remote device."""
-        if not self.is_reachable():
-            raise DeviceNotReachableError(f"Device {self.device_type} is not reachable")
-
-        with self.create_ssh_client() as client:
+        with self.ssh_session() as client:
             if source.is_dir():
                 client.transfer_directory(source, destination)
             else:
@@ -365,29 +597,64 @@ class DeviceManager:
         """Load devices from the YAML config file, resolving key paths to absolute paths."""
         logger.debug(f"Loading devices from {self.datafile_path}")
         try:
-            with open(self.datafile_path) as file:
-                data = yaml.safe_load(file)
+            file_stat = self.datafile_path.stat()
+            # The parsed file is shared between managers; work on a copy
+            data = copy.deepcopy(
+                _parse_devices_file(
+                    str(self.datafile_path), file_stat.st_mtime_ns, file_stat.st_size
+                )
+            )
 
-            # Update the private key file paths to point to the DEFAULT_PKEYS_DIR
+            # Update the private key file paths to point to the DEFAULT_PKEYS_DIR,
+            # using one directory listing instead of building each path
+            with os.scandir(self.DEFAULT_PKEYS_DIR) as entries:
+                pkey_index = {entry.name: entry.path for entry in entries}
             for device in data.get("devices", []):
                 for conn_param in device.get("connection_params", []):
                     if "pkey_fp" in conn_param:
                         # Convert to absolute path in pkeys directory
                         key_name = os.path.basename(conn_param["pkey_fp"])
-                        conn_param["pkey_fp"] = str(self.DEFAULT_PKEYS_DIR / key_name)
+                        key_path = pkey_index.get(key_name)
+                        if key_path is None:
+                            logger.warning(
+                                f"Key {key_name} not found in {self.DEFAULT_PKEYS_DIR}"
+                            )
+                            key_path = os.path.join(self.DEFAULT_PKEYS_DIR, key_name)
+                        conn_param["pkey_fp"] = key_path
+
+            # Probe every distinct host once up front; the devices below then
+            # select their connections from the cached results
+            SSHConnectionParams.prime_reachability(
+                (
+                    conn_param["host"],
+                    conn_param.get("ssh_port") or SSH_PORT,
+                    conn_param.get("probe_timeout")
+                    or SSHConnectionParams.PROBE_TIMEOUT,
+                )
+                for device in data.get("devices", [])
+                for conn_param in device.get("connection_params", [])
+                if isinstance(conn_param.get("host"), str)
+            )
 
-            # Create Device objects for each device configuration
+            # Create Device objects for each device configuration. Each one
+            # probes its connections, so they are built concurrently; results
+            # keep the order of the config file
+            records = data.get("devices", [])
             self.devices = []
-            for record in data.get("devices", []):
-                try:
-                    device = Device(record)
-                    self.devices.append(device)
-                except (SSHError, ValidationError, DeviceError) as e:
-                    logger.error(f"Failed to initialize device: {e}")
-                    continue
-                except Exception as e:
-                    logger.error(f"Unexpected error initializing device: {e}")
-                    continue
+            if records:
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_DEVICE_INIT_WORKERS, len(records))
+                ) as executor:
+                    futures = [executor.submit(Device, record) for record in records]
+                for future in futures:
+                    try:
+                        self.devices.append(future.result())
+                    except (SSHError, ValidationError, DeviceError) as e:
+                        logger.error(f"Failed to initialize device: {e}")
+                        continue
+                    except Exception as e:
+                        logger.error(f"Unexpected error initializing device: {e}")
+                        continue
 
             if not self.devices:
                 logger.warning(
@@ -402,15 +669,34 @@ class DeviceManager:
             raise DeviceError(error_msg) from e
 
     def get_devices(
-        self, available_only: bool = False, device_type: Optional[str] = None
+        self,
+        available_only: bool = False,
+        device_type: Optional[str] = None,
+        refresh: bool = False,
     ) -> List[Device]:
-        """Retrieve devices filtered by availability and/or device type."""
-        filtered_devices = [
+        """Retrieve devices filtered by availability and/or device type.
+
+        With `refresh`, availability is re-probed instead of taken from the
+        check made at load time or from cached probe results; all candidate
+        devices are probed in one parallel round.
+        """
+        candidates = [
             device
             for device in self.devices
-            if (not available_only or device.is_reachable())
-            and (device_type is None or device.device_type == device_type)
+            if device_type is None or device.device_type == device_type
         ]
+        if not available_only:
+            filtered_devices = candidates
+        elif refresh and candidates:
+            with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+                reachable = list(executor.map(Device.refresh_reachability, candidates))
+            filtered_devices = [
+                device for device, ok in zip(candidates, reachable) if ok
+            ]
+        else:
+            filtered_devices = [
+                device for device in candidates if device.is_reachable()
+            ]
         logger.info(
             f"Retrieved {len(filtered_devices)} devices "
             f"(available_only={available_only}, device_type={device_type})"
@@ -445,9 +731,16 @@ class DeviceManager:
 
         return device
 
+    def close(self) -> None:
+        """Close the persistent SSH sessions of all devices."""
+        for device in self.devices:
+            device.close()
+
     def create_server_socket(self, host: str, port: int) -> socket.socket:
         """Create a server socket, falling back to all interfaces if specific binding fails."""
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Allow rebinding the port while a previous socket is in TIME_WAIT
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
             # Try binding to the specified host
             sock.bind((host, port))
@@ -462,6 +755,9 @@ class DeviceManager:
 
     def save_devices(self) -> None:
         """Save the current device configurations back to the YAML file."""
+        import yaml
+        from ..utils.utils import YamlDumper
+
         try:
             logger.info(f"Saving devices to {self.datafile_path}")
             data = {
@@ -472,7 +768,7 @@ class DeviceManager:
             }
 
             with open(self.datafile_path, "w") as file:
-                yaml.dump(data, file, default_flow_style=False)
+                yaml.dump(data, file, Dumper=YamlDumper, default_flow_style=False)
 
             logger.info(f"Saved {len(self.devices)} devices")
         except Exception as e:
@@ -487,19 +783,30 @@ class DeviceManager:
         results = {}
         # Get only the devices that are available (reachable) and match the device type (if provided)
         devices = self.get_devices(available_only=True, device_type=device_type)
-
-        for device in devices:
-            try:
-                # Execute the command via SSH and store the result
-                results[device.get_host()] = device.execute_remote_command(command)
-            except (SSHError, DeviceNotReachableError) as e:
-                logger.error(f"Failed to execute command on {device.get_host()}: {e}")
-                results[device.get_host()] = {"success": False, "error": str(e)}
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error executing command on {device.get_host()}: {e}"
-                )
-                results[device.get_host()] = {"success": False, "error": str(e)}
+        if not devices:
+            return results
+
+        # Devices are independent, so commands run on all of them concurrently
+        with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+            futures = {
+                executor.submit(device.execute_remote_command, command): device
+                for device in devices
+            }
+            for future in as_completed(futures):
+                device = futures[future]
+                try:
+                    # Store the result of the command executed via SSH
+                    results[device.get_host()] = future.result()
+                except (SSHError, DeviceNotReachableError) as e:
+                    logger.error(
+                        f"Failed to execute command on {device.get_host()}: {e}"
+                    )
+                    results[device.get_host()] = {"success": False, "error": str(e)}
+                except Exception as e:
+                    logger.error(
+                        f"Unexpected error executing command on {device.get_host()}: {e}"
+                    )
+                    results[device.get_host()] = {"success": False, "error": str(e)}
 
         return results
 
@@ -510,19 +817,29 @@ class DeviceManager:
         results = {}
         # Get only the available devices that match the given type
         devices = self.get_devices(available_only=True, device_type=device_type)
-
-        for device in devices:
-            try:
-                # Transfer files to the remote device
-                device.transfer_files(source, destination)
-                results[device.get_host()] = True
-            except (SSHError, DeviceNotReachableError) as e:
-                logger.error(f"Failed to transfer files to {device.get_host()}: {e}")
-                results[device.get_host()] = False
-            except Exception as e:
-                logger.error(
-                    f"Unexpected error transferring files to {device.get_host()}: {e}"
-                )
-                results[device.get_host()] = False
+        if not devices:
+            return results
+
+        # Transfer to all devices concurrently
+        with ThreadPoolExecutor(max_workers=len(devices)) as executor:
+            futures = {
+                executor.submit(device.transfer_files, source, destination): device
+                for device in devices
+            }
+            for future in as_completed(futures):
+                device = futures[future]
+                try:
+                    future.result()
+                    results[device.get_host()] = True
+                except (SSHError, DeviceNotReachableError) as e:
+                    logger.error(
+                        f"Failed to transfer files to {device.get_host()}: {e}"
+                    )
+                    results[device.get_host()] = False
+                except Exception as e:
+                    logger.error(
+                        f"Unexpected error transferring files to {device.get_host()}: {e}"
+                    )
+                    results[device.get_host()] = False
 
         return results
@@ -1,6 +1,7 @@
 """Core experiment infrastructure for split computing"""
 
 import logging
+import math
 import sys # noqa: F401
 import time
 from dataclasses import dataclass, field
@@ -66,6 +67,9 @@ class BaseExperiment(ExperimentInterface):
     while concrete subclasses implement specific tensor sharing strategies.
     """
 
+    # Whether test_split_performance abandons layers over split_time_budget
+    supports_split_pruning: bool = False
+
     def __init__(self, config: Dict[str, Any], host: str, port: int) -> None:
         """Initialize experiment infrastructure for potential tensor sharing."""
         self.config = config
@@ -89,6 +93,8 @@ class BaseExperiment(ExperimentInterface):
 
         # Initialize timing and metrics data structures
         self.layer_timing_data = {}
+        # Best total time seen so far when pruning split layers (see `run`)
+        self.split_time_budget: Optional[float] = None
 
         # Initialize model and processor components
         self.model = self.initialize_model()
@@ -171,7 +177,21 @@ class BaseExperiment(ExperimentInterface):
         # Extract the transmitted tensor and metadata
         # This is where decryption would occur if encryption is implemented
         output, original_size = data["input"]
+        return self.process_tensor(output, original_size, data["split_layer"])
 
+    def process_tensor(
+        self,
+        output: Any,
+        original_size: Any,
+        split_layer: int,
+        model: Optional[Any] = None,
+    ) -> Any:
+        """Continue model execution from the split point for one received tensor.
+
+        Positional fast path behind `process_data` for the server's per-request
+        loop. `model` substitutes another callable for `self.model`, such as a
+        compiled copy.
+        """
         with torch.no_grad():
             # === TENSOR PREPARATION ===
             # Move tensor to appropriate computation device (GPU/CPU)
@@ -187,7 +207,9 @@ class BaseExperiment(ExperimentInterface):
 
             # === TENSOR PROCESSING ===
             # Continue model execution from the split point specified
-            result = self.model(output, start=data["split_layer"])
+            if model is None:
+                model = self.model
+            result = model(output, start=split_layer)
             # Handle models that return additional metadata
             if isinstance(result, tuple):
                 result, _ = result
@@ -203,6 +225,43 @@ class BaseExperiment(ExperimentInterface):
             # Apply post-processing to generate final output
             return self.post_processor.process_output(result, original_size)
 
+    def process_batch(
+        self, inputs: List[Tuple[torch.Tensor, Any]], split_layer: int
+    ) -> List[Any]:
+        """Process several client tensors for the same split layer in one forward pass.
+
+        Tensors are concatenated along the batch dimension, run through the model
+        once, and the output is split back per request before post-processing.
+        Falls back to per-request processing when the model output cannot be
+        split along the batch dimension.
+        """
+        if len(inputs) == 1:
+            output, original_size = inputs[0]
+            return [self.process_tensor(output, original_size, split_layer)]
+
+        with torch.no_grad():
+            batch = torch.cat([tensor for tensor, _ in inputs]).to(
+                self.device, non_blocking=True
+            )
+            result = self.model(batch, start=split_layer)
+            if isinstance(result, tuple):
+                result, _ = result
+
+            splittable = (
+                isinstance(result, torch.Tensor) and result.shape[0] == batch.shape[0]
+            )
+            if not splittable:
+                return [
+                    self.process_tensor(output, original_size, split_layer)
+                    for output, original_size in inputs
+                ]
+
+            chunks = result.cpu().split([tensor.shape[0] for tensor, _ in inputs])
+            return [
+                self.post_processor.process_output(chunk, original_size)
+                for chunk, (_, original_size) in zip(chunks, inputs)
+            ]
+
     def _get_original_image(self, tensor: torch.Tensor, image_path: str) -> Image.Image:
         """Reconstruct or load original image from tensor or file path."""
         try:
@@ -259,10 +318,27 @@ class BaseExperiment(ExperimentInterface):
             [split_layer] if split_layer != -1 else range(1, self.model.layer_count)
         )
 
+        # With prune_splits, a split layer is abandoned as soon as its running
+        # total exceeds the best total so far (or split_time_budget seconds)
+        defaults = self.config.get("default", {})
+        if defaults.get("prune_splits") and not self.supports_split_pruning:
+            logger.warning(
+                f"prune_splits is ignored by {type(self).__name__}: only "
+                "networked experiments prune split layers"
+            )
+        elif defaults.get("prune_splits"):
+            budget = defaults.get("split_time_budget")
+            self.split_time_budget = float(budget) if budget else math.inf
+
         # Run experiments for each split layer and collect performance records
-        performance_records = [
-            self.test_split_performance(split_layer=layer) for layer in split_layers
-        ]
+        performance_records = []
+        for layer in split_layers:
+            record = self.test_split_performance(split_layer=layer)
+            performance_records.append(record)
+            # Pruned (NaN) and failed (zero) layers don't lower the budget
+            total = sum(record[1:4])
+            if self.split_time_budget is not None and total > 0:
+                self.split_time_budget = min(self.split_time_budget, total)
 
         self.save_results(performance_records)
 
@@ -929,102 +1005,123 @@ class BaseExperiment(ExperimentInterface):
                                 f"Failed to update Windows CPU metrics for layer {layer_id}: {e}"
                             )
 
-        # Generate timestamped output filename
+        # Generate timestamped output filename (the extension is set on writing)
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         if hasattr(self.paths, "model_dir") and self.paths.model_dir:
-            output_file = self.paths.model_dir / f"analysis_{timestamp}.xlsx"
+            output_file = self.paths.model_dir / f"analysis_{timestamp}"
         elif hasattr(self.paths, "base_dir") and self.paths.base_dir:
-            output_file = self.paths.base_dir / f"analysis_{timestamp}.xlsx"
+            output_file = self.paths.base_dir / f"analysis_{timestamp}"
         else:
-            output_file = Path(f"./analysis_{timestamp}.xlsx")
+            output_file = Path(f"./analysis_{timestamp}")
 
         # Make sure parent directory exists
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Write results to Excel with multiple sheets for comprehensive analysis
-        with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
-            df.to_excel(writer, sheet_name="Overall Performance", index=False)
-
-            if not layer_metrics_df.empty:
-                # Add explicit GPU utilization logging before writing to Excel
+        # Collect the result tables, one per sheet or CSV file
+        sheets = {"Overall Performance": df}
+        if not layer_metrics_df.empty:
+            # Add explicit GPU utilization logging before writing the results
+            if logger.isEnabledFor(logging.DEBUG):
                 for idx, row in layer_metrics_df.iterrows():
                     gpu_util = row.get("GPU Utilization (%)", 0.0)
                     logger.debug(
-                        f"Excel row {idx}: Layer {row.get('Layer ID', -1)} GPU utilization = {gpu_util}%"
+                        f"Results row {idx}: Layer {row.get('Layer ID', -1)} GPU utilization = {gpu_util}%"
                     )
 
-                layer_metrics_df.to_excel(
-                    writer, sheet_name="Layer Metrics", index=False
-                )
+            sheets["Layer Metrics"] = layer_metrics_df
+
+            # === CREATE ENERGY SUMMARY FOR TENSOR SHARING ANALYSIS ===
+            # Aggregate energy metrics across layers for research analysis
+            energy_agg_dict = {
+                "Processing Energy (J)": "sum",
+                "Communication Energy (J)": "sum",
+                "Total Energy (J)": "sum",
+                "Power Reading (W)": "mean",
+                "GPU Utilization (%)": "mean",
+                "Host Battery Energy (mWh)": "first",
+            }
 
-                # === CREATE ENERGY SUMMARY FOR TENSOR SHARING ANALYSIS ===
-                # Aggregate energy metrics across layers for research analysis
-                energy_agg_dict = {
-                    "Processing Energy (J)": "sum",
-                    "Communication Energy (J)": "sum",
-                    "Total Energy (J)": "sum",
-                    "Power Reading (W)": "mean",
-                    "GPU Utilization (%)": "mean",
-                    "Host Battery Energy (mWh)": "first",
-                }
+            # Add Memory Utilization to aggregation if available
+            if "Memory Utilization (%)" in layer_metrics_df.columns:
+                energy_agg_dict["Memory Utilization (%)"] = "mean"
 
-                # Add Memory Utilization to aggregation if available
-                if "Memory Utilization (%)" in layer_metrics_df.columns:
-                    energy_agg_dict["Memory Utilization (%)"] = "mean"
+            # Group by Split Layer for comprehensive tensor sharing analysis
+            energy_summary = (
+                layer_metrics_df.groupby("Split Layer")
+                .agg(energy_agg_dict)
+                .reset_index()
+            )
 
-                # Group by Split Layer for comprehensive tensor sharing analysis
-                energy_summary = (
-                    layer_metrics_df.groupby("Split Layer")
-                    .agg(energy_agg_dict)
-                    .reset_index()
-                )
+            # Filter metrics to only include active layers for accurate reporting
+            for split_layer in energy_summary["Split Layer"].unique():
+                # Get metrics for this split layer
+                split_metrics = layer_metrics_df[
+                    (layer_metrics_df["Split Layer"] == split_layer)
+                    & (
+                        layer_metrics_df["Layer ID"] <= split_layer
+                    )  # Only include layers up to split_layer
+                ]
 
-                # Filter metrics to only include active layers for accurate reporting
-                for split_layer in energy_summary["Split Layer"].unique():
-                    # Get metrics for this split layer
-                    split_metrics = layer_metrics_df[
-                        (layer_metrics_df["Split Layer"] == split_layer)
-                        & (
-                            layer_metrics_df["Layer ID"] <= split_layer
-                        )  # Only include layers up to split_layer
-                    ]
-
-                    # Filter to only include layers with non-zero power readings
-                    active_layers = split_metrics[
-                        split_metrics["Power Reading (W)"] > 0
-                    ]
-
-                    if not active_layers.empty:
-                        # Recalculate averages only for active layers
-                        energy_summary.loc[
-                            energy_summary["Split Layer"] == split_layer,
-                            "Power Reading (W)",
-                        ] = active_layers["Power Reading (W)"].mean()
-
-                        # Always include GPU utilization, even if it's all zeros
-                        energy_summary.loc[
-                            energy_summary["Split Layer"] == split_layer,
-                            "GPU Utilization (%)",
-                        ] = active_layers["GPU Utilization (%)"].mean()
-
-                        # Only recalculate memory utilization if the column exists
-                        if "Memory Utilization (%)" in active_layers.columns:
-                            # Filter to non-null values
-                            memory_active = active_layers[
-                                active_layers["Memory Utilization (%)"].notnull()
-                            ]
-                            if not memory_active.empty:
-                                energy_summary.loc[
-                                    energy_summary["Split Layer"] == split_layer,
-                                    "Memory Utilization (%)",
-                                ] = memory_active["Memory Utilization (%)"].mean()
-
-                energy_summary.to_excel(
-                    writer, sheet_name="Energy Analysis", index=False
-                )
+                # Filter to only include layers with non-zero power readings
+                active_layers = split_metrics[
+                    split_metrics["Power Reading (W)"] > 0
+                ]
+
+                if not active_layers.empty:
+                    # Recalculate averages only for active layers
+                    energy_summary.loc[
+                        energy_summary["Split Layer"] == split_layer,
+                        "Power Reading (W)",
+                    ] = active_layers["Power Reading (W)"].mean()
+
+                    # Always include GPU utilization, even if it's all zeros
+                    energy_summary.loc[
+                        energy_summary["Split Layer"] == split_layer,
+                        "GPU Utilization (%)",
+                    ] = active_layers["GPU Utilization (%)"].mean()
+
+                    # Only recalculate memory utilization if the column exists
+                    if "Memory Utilization (%)" in active_layers.columns:
+                        # Filter to non-null values
+                        memory_active = active_layers[
+                            active_layers["Memory Utilization (%)"].notnull()
+                        ]
+                        if not memory_active.empty:
+                            energy_summary.loc[
+                                energy_summary["Split Layer"] == split_layer,
+                                "Memory Utilization (%)",
+                            ] = memory_active["Memory Utilization (%)"].mean()
+
+            sheets["Energy Analysis"] = energy_summary
+
+        output_file = self._write_results(sheets, output_file)
 
         logger.info(f"Results saved to {output_file}")
 
+    def _write_results(
+        self, sheets: Dict[str, pd.DataFrame], output_file: Path
+    ) -> Path:
+        """Write result tables as Excel sheets or CSV files and return the output path.
+
+        `default.results_format: csv` writes one `<output_file>_<sheet>.csv` per
+        table, skipping the openpyxl import and XML writer; the default is a
+        single workbook with one sheet per table.
+        """
+        if self.config.get("default", {}).get("results_format", "xlsx") == "csv":
+            for sheet_name, frame in sheets.items():
+                suffix = sheet_name.lower().replace(" ", "_")
+                frame.to_csv(
+                    output_file.with_name(f"{output_file.name}_{suffix}.csv"),
+                    index=False,
+                )
+            return output_file.with_name(f"{output_file.name}_*.csv")
+
+        output_file = output_file.with_suffix(".xlsx")
+        with pd.ExcelWriter(output_file, engine="openpyxl") as writer:
+            for sheet_name, frame in sheets.items():
+                frame.to_excel(writer, sheet_name=sheet_name, index=False)
+        return output_file
+
     def test_split_performance(
         self, split_layer: int
     ) -> Tuple[int, float, float, float]:
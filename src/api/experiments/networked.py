@@ -14,8 +14,12 @@ Key aspects of tensor sharing:
 """
 
 import logging
+import math
 import psutil
+import queue
+import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Tuple, Optional
 
@@ -27,10 +31,43 @@ from .base import BaseExperiment, ProcessingTimes
 
 logger = logging.getLogger("split_computing_logger")
 
+# Images prepared by the host stage that may wait for the network stage
+PIPELINE_DEPTH = 2
+
+
+@dataclass
+class _PreparedImage:
+    """An image processed up to the split layer and ready for transmission."""
+
+    compressed_output: bytes
+    original_image: Any
+    class_idx: Any
+    image_file: str
+    host_time: float
+
+
+def _slice_batch(output: Any, index: int) -> Any:
+    """Select one image from a batched split-layer output, keeping its batch dim.
+
+    Tensors are sliced along the first dimension; containers (including the
+    model's EarlyOutput wrapper) are rebuilt around their sliced contents.
+    """
+    if isinstance(output, torch.Tensor):
+        return output[index : index + 1]
+    if hasattr(output, "inner_dict"):
+        return type(output)(_slice_batch(output.inner_dict, index))
+    if isinstance(output, dict):
+        return {key: _slice_batch(value, index) for key, value in output.items()}
+    if isinstance(output, (list, tuple)):
+        return type(output)(_slice_batch(value, index) for value in output)
+    return output
+
 
 class NetworkedExperiment(BaseExperiment):
     """Class for running experiments with networked split computing."""
 
+    supports_split_pruning = True
+
     def __init__(self, config: Dict[str, Any], host: str, port: int):
         """Initialize the networked experiment with server connection and compression setup."""
         super().__init__(config, host, port)
@@ -41,14 +78,6 @@ class NetworkedExperiment(BaseExperiment):
         if not hasattr(self, "layer_timing_data"):
             self.layer_timing_data = {}
 
-        # Configure compression settings for tensor transmission
-        if "compression" not in self.config:
-            self.config["compression"] = {
-                "clevel": 3,  # Compression level (higher = smaller size but slower)
-                "filter": "SHUFFLE",  # Data pre-conditioning filter
-                "codec": "ZSTD",  # Compression algorithm
-            }
-
         # Setup network client for tensor sharing with the server
         try:
             logger.info(f"Creating network client to connect to {host}:{port}")
@@ -62,7 +91,13 @@ class NetworkedExperiment(BaseExperiment):
 
         # Initialize data compression for efficient tensor transmission over the network
         try:
-            compression_config = self.config.get("compression", {})
+            # Without configured settings, payloads use these defaults and the
+            # server picks its own codec from the measured link speed
+            compression_config = self.config.get("compression") or {
+                "clevel": 3,  # Compression level (higher = smaller size but slower)
+                "filter": "SHUFFLE",  # Data pre-conditioning filter
+                "codec": "ZSTD",  # Compression algorithm
+            }
             logger.info(
                 f"Initializing data compression with config: {compression_config}"
             )
@@ -97,6 +132,35 @@ class NetworkedExperiment(BaseExperiment):
         3. Server completes processing and returns results
         4. Process results locally and optionally save visualization
         """
+        prepared = self._prepare_image(inputs, class_idx, image_file, split_layer)
+        if prepared is None:
+            return None
+        return self._send_image(prepared, split_layer, output_dir)
+
+    def _prepare_image(
+        self,
+        inputs: torch.Tensor,
+        class_idx: Any,
+        image_file: str,
+        split_layer: int,
+    ) -> Optional[_PreparedImage]:
+        """Run the host stage for a single image (inputs with a batch dim of 1)."""
+        return self._prepare_batch(inputs, [class_idx], [image_file], split_layer)[0]
+
+    def _prepare_batch(
+        self,
+        inputs: torch.Tensor,
+        class_indices: Any,
+        image_files: List[str],
+        split_layer: int,
+    ) -> List[Optional[_PreparedImage]]:
+        """Run the host stage for a batch: one forward pass, then per-image compression.
+
+        The local part of the model runs once for the whole batch; each image is
+        charged an equal share of that time plus its own preparation time.
+        Entries are None for images that failed.
+        """
+        batch_size = len(image_files)
         try:
             # ===== HOST DEVICE PROCESSING =====
             # Process the initial part of the model (up to split_layer) on the local device
@@ -105,11 +169,41 @@ class NetworkedExperiment(BaseExperiment):
             # Move input tensor to target device (CPU/GPU)
             inputs = inputs.to(self.device, non_blocking=True)
 
-            # Generate intermediate tensor by running model up to split point
+            # Generate intermediate tensors by running model up to split point
             output = self._get_model_output(inputs, split_layer)
 
             # Move inputs back to CPU for image reconstruction
-            original_image = self._get_original_image(inputs.cpu(), image_file)
+            cpu_inputs = inputs.cpu()
+            inference_time = (time.time() - host_start) / batch_size
+        except Exception as e:
+            logger.error(f"Error processing image batch: {e}", exc_info=True)
+            return [None] * batch_size
+
+        return [
+            self._package_image(
+                output if batch_size == 1 else _slice_batch(output, index),
+                cpu_inputs[index : index + 1],
+                class_idx,
+                image_file,
+                inference_time,
+            )
+            for index, (class_idx, image_file) in enumerate(
+                zip(class_indices, image_files)
+            )
+        ]
+
+    def _package_image(
+        self,
+        output: Any,
+        inputs: torch.Tensor,
+        class_idx: Any,
+        image_file: str,
+        inference_time: float,
+    ) -> Optional[_PreparedImage]:
+        """Compress one image's split-layer output together with its metadata."""
+        try:
+            package_start = time.time()
+            original_image = self._get_original_image(inputs, image_file)
 
             # ===== TENSOR PREPARATION FOR TRANSMISSION =====
             # Package tensor with metadata needed by server for processing
@@ -124,10 +218,29 @@ class NetworkedExperiment(BaseExperiment):
             compressed_output, output_size = self.compress_data.compress_data(
                 data_to_send
             )
-            logger.debug(f"Compressed tensor data size: {output_size} bytes")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Compressed tensor data size: {output_size} bytes")
+
+            return _PreparedImage(
+                compressed_output=compressed_output,
+                original_image=original_image,
+                class_idx=class_idx,
+                image_file=image_file,
+                host_time=inference_time + time.time() - package_start,
+            )
 
-            host_time = time.time() - host_start
+        except Exception as e:
+            logger.error(f"Error processing image: {e}", exc_info=True)
+            return None
 
+    def _send_image(
+        self,
+        prepared: _PreparedImage,
+        split_layer: int,
+        output_dir: Optional[Path],
+    ) -> Optional[ProcessingTimes]:
+        """Run the network stage: server round trip and optional visualization."""
+        try:
             # ===== NETWORK TRANSMISSION =====
             # Transmit compressed tensor to server and receive processed results
             travel_start = time.time()
@@ -143,7 +256,7 @@ class NetworkedExperiment(BaseExperiment):
                 # Server time is returned separately for accurate performance measurement
                 processed_result, server_time = (
                     self.network_client.process_split_computation(
-                        split_layer, compressed_output
+                        split_layer, prepared.compressed_output
                     )
                 )
             except Exception as e:
@@ -159,15 +272,17 @@ class NetworkedExperiment(BaseExperiment):
             if output_dir and self.config.get("default", {}).get("save_layer_images"):
                 self._save_intermediate_results(
                     processed_result,
-                    original_image,
-                    class_idx,
-                    image_file,
+                    prepared.original_image,
+                    prepared.class_idx,
+                    prepared.image_file,
                     output_dir,
                 )
 
             # Return comprehensive timing metrics for performance analysis
             return ProcessingTimes(
-                host_time=host_time, travel_time=travel_time, server_time=server_time
+                host_time=prepared.host_time,
+                travel_time=travel_time,
+                server_time=server_time,
             )
 
         except Exception as e:
@@ -246,10 +361,22 @@ class NetworkedExperiment(BaseExperiment):
 
         # Process dataset using distributed computation with tensors split at specified layer
         with torch.no_grad():
-            for batch in tqdm(
-                self.data_loader, desc=f"Processing at split {split_layer}"
-            ):
-                times.extend(self._process_batch(batch, split_layer, split_dir))
+            if self.config.get("default", {}).get("pipeline_network"):
+                times.extend(self._process_pipelined(split_layer, split_dir))
+            else:
+                for batch in tqdm(
+                    self.data_loader, desc=f"Processing at split {split_layer}"
+                ):
+                    times.extend(self._process_batch(batch, split_layer, split_dir))
+                    if self._over_budget(times):
+                        break
+
+        if self._over_budget(times):
+            logger.warning(
+                f"Pruned split layer {split_layer}: exceeded the best total time "
+                f"of {self.split_time_budget:.4f}s"
+            )
+            return split_layer, math.nan, math.nan, math.nan
 
         # Calculate and report performance metrics
         if times:
@@ -300,27 +427,75 @@ class NetworkedExperiment(BaseExperiment):
         split_layer: int,
         split_dir: Path,
     ) -> List[ProcessingTimes]:
-        """Process a batch of images through the distributed tensor sharing pipeline."""
+        """Process a batch of images through the distributed tensor sharing pipeline.
+
+        The host stage runs one forward pass for the whole batch; each image is
+        then sent to the server on its own.
+        """
         inputs, class_indices, image_files = batch
         return [
             result
             for result in (
-                self.process_single_image(
-                    input_tensor.unsqueeze(
-                        0
-                    ),  # Add batch dimension for single image processing
-                    class_idx,
-                    image_file,
-                    split_layer,
-                    split_dir if split_dir else None,
-                )
-                for input_tensor, class_idx, image_file in zip(
-                    inputs, class_indices, image_files
+                self._send_image(prepared, split_layer, split_dir or None)
+                for prepared in self._prepare_batch(
+                    inputs, class_indices, image_files, split_layer
                 )
+                if prepared is not None
             )
             if result is not None
         ]
 
+    def _process_pipelined(
+        self, split_layer: int, split_dir: Optional[Path]
+    ) -> List[ProcessingTimes]:
+        """Process the dataset with the host and network stages overlapped.
+
+        A worker thread performs the server round trip of each image while the
+        main thread runs the host stage of the next ones, with at most
+        PIPELINE_DEPTH prepared images waiting in between. Results keep the
+        order of the dataset.
+        """
+        pending: "queue.Queue[Optional[_PreparedImage]]" = queue.Queue(
+            maxsize=PIPELINE_DEPTH
+        )
+        times: List[ProcessingTimes] = []
+
+        def network_stage() -> None:
+            while True:
+                prepared = pending.get()
+                if prepared is None:
+                    return
+                result = self._send_image(prepared, split_layer, split_dir)
+                if result is not None:
+                    times.append(result)
+
+        worker = threading.Thread(
+            target=network_stage, name="network-stage", daemon=True
+        )
+        worker.start()
+        try:
+            for inputs, class_indices, image_files in tqdm(
+                self.data_loader, desc=f"Processing at split {split_layer}"
+            ):
+                for prepared in self._prepare_batch(
+                    inputs, class_indices, image_files, split_layer
+                ):
+                    if prepared is not None:
+                        pending.put(prepared)
+                if self._over_budget(times):
+                    break
+        finally:
+            pending.put(None)
+            worker.join()
+        return times
+
+    def _over_budget(self, times: List[ProcessingTimes]) -> bool:
+        """Return whether the running total of `times` exceeds the split time budget."""
+        if self.split_time_budget is None:
+            return False
+        total = sum(t.host_time + t.travel_time + t.server_time for t in list(times))
+        return total > self.split_time_budget
+
     def run_experiment(self) -> None:
         """Run complete experiment with tensor sharing and measure energy consumption."""
         try:
@@ -8,7 +8,7 @@ from .processors import (
     YOLOProcessor,
     CustomModelProcessor,
 )
-from .predictors import ImageNetPredictor, YOLODetector
+from .predictors import Detections, ImageNetPredictor, YOLODetector
 from .visualizers import PredictionVisualizer, DetectionVisualizer
 
 from .configs import (
@@ -37,6 +37,7 @@ __all__ = [
     # Predictors
     "ImageNetPredictor",
     "YOLODetector",
+    "Detections",
     # Visualizers
     "PredictionVisualizer",
     "DetectionVisualizer",
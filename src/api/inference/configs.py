@@ -7,6 +7,7 @@ from typing import Final, Tuple
 DEFAULT_FONT_SIZE: Final[int] = 10
 DEFAULT_CONF_THRESHOLD: Final[float] = 0.25
 DEFAULT_IOU_THRESHOLD: Final[float] = 0.45
+DEFAULT_TOP_K: Final[int] = 300  # Highest scoring candidates passed to NMS
 DEFAULT_INPUT_SIZE: Final[Tuple[int, int]] = (
     224,
     224,
@@ -39,6 +40,7 @@ class DetectionConfig:
     - Input dimensions determine how input tensors are shaped
     - Confidence threshold filters weak detections from tensor outputs
     - IOU threshold controls duplicate detection removal in tensor post-processing
+    - Top-k bounds how many candidates reach the quadratic NMS step
 
     These parameters directly impact tensor sharing efficiency by controlling
     the quantity and quality of data extracted from model tensors.
@@ -50,5 +52,11 @@ class DetectionConfig:
     # Threshold for Non-Maximum Suppression algorithm in tensor post-processing
     iou_threshold: float = DEFAULT_IOU_THRESHOLD
 
+    # Maximum number of highest scoring candidates kept for NMS (0 keeps all)
+    top_k: int = DEFAULT_TOP_K
+
+    # Suppress overlapping boxes across classes instead of only within a class
+    class_agnostic: bool = False
+
     # Expected tensor dimensions (H,W) for the model input
     input_size: Tuple[int, int] = DEFAULT_INPUT_SIZE
@@ -74,6 +74,8 @@ class ModelProcessorFactory:
                 # Configure tensor filtering thresholds
                 conf_threshold=model_config.get("conf_threshold", 0.25),
                 iou_threshold=model_config.get("iou_threshold", 0.45),
+                top_k=model_config.get("top_k", 300),
+                class_agnostic=model_config.get("class_agnostic_nms", False),
             )
             return processor_class(class_names, det_config, vis_config)
 
@@ -1,11 +1,11 @@
 """Prediction utilities for different model types"""
 
 import logging
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
 
-import cv2  # type: ignore
-import numpy as np
 import torch
+from torchvision.ops import batched_nms, nms
 
 from .configs import DetectionConfig, VisualizationConfig
 
@@ -23,9 +23,6 @@ class ImageNetPredictor:
         """Initialize predictor with class names and visualization settings."""
         self.class_names = class_names
         self.vis_config = vis_config
-        self._softmax = torch.nn.Softmax(
-            dim=0
-        )  # For converting logits to probabilities
 
     def predict_top_k(
         self, output: torch.Tensor, k: int = 5
@@ -33,31 +30,34 @@ class ImageNetPredictor:
         """Obtain the top-k predictions from model output tensor.
 
         === TENSOR PROCESSING ===
-        Transforms the raw logit tensor from the network into probability scores,
-        then identifies the top k class predictions by probability.
+        Identifies the top k classes from the raw logit tensor, then converts
+        only those k logits into softmax probabilities using the log-sum-exp of
+        all logits, without materializing the full probability vector.
         """
         # Reshape tensor if necessary to remove batch dimension
         logits = output.squeeze(0) if output.dim() > 1 else output
-        # Convert logits to probability distribution
-        probabilities = self._softmax(logits)
-        # Extract top k probabilities and corresponding class indices
-        top_prob, top_catid = torch.topk(probabilities, k)
+        # Softmax is monotonic, so the top k logits are the top k probabilities
+        top_logits, top_catid = torch.topk(logits, k)
+        top_prob = (top_logits - torch.logsumexp(logits, dim=0)).exp()
+
+        # Copy the k results to the host once rather than syncing per element
+        probs = top_prob.tolist()
+        catids = top_catid.tolist()
 
         # Validate predicted indices
-        if max(top_catid) >= len(self.class_names):
+        if max(catids) >= len(self.class_names):
             logger.error(
-                f"Invalid class index {max(top_catid)} for {len(self.class_names)} classes"
+                f"Invalid class index {max(catids)} for {len(self.class_names)} classes"
             )
             return [("unknown", 0.0)]
 
         # Map indices to class names and return with probabilities
-        return [
-            (self.class_names[catid.item()], prob.item())
-            for prob, catid in zip(top_prob, top_catid)
-        ]
+        return [(self.class_names[catid], prob) for prob, catid in zip(probs, catids)]
 
     def log_predictions(self, predictions: List[Tuple[str, float]]) -> None:
         """Log top predictions in a formatted manner."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug("\nTop predictions:")
         logger.debug("-" * 50)
         for i, (class_name, prob) in enumerate(predictions, 1):
@@ -65,6 +65,34 @@ class ImageNetPredictor:
         logger.debug("-" * 50)
 
 
+@dataclass
+class Detections:
+    """YOLO detections stored as parallel tensors, one row per detection.
+
+    Iterating yields `(box, score, class_id)` tuples, converting all rows to
+    Python values in one transfer.
+    """
+
+    boxes: torch.Tensor  # (N, 4) int32 [left, top, width, height]
+    scores: torch.Tensor  # (N,) confidence scores
+    class_ids: torch.Tensor  # (N,) class indices
+
+    @classmethod
+    def empty(cls) -> "Detections":
+        """Return a result with no detections."""
+        return cls(
+            torch.empty((0, 4), dtype=torch.int32),
+            torch.empty(0),
+            torch.empty(0, dtype=torch.long),
+        )
+
+    def __len__(self) -> int:
+        return self.scores.shape[0]
+
+    def __iter__(self) -> Iterator[Tuple[List[int], float, int]]:
+        return zip(self.boxes.tolist(), self.scores.tolist(), self.class_ids.tolist())
+
+
 class YOLODetector:
     """Handles YOLO detection processing.
 
@@ -77,32 +105,23 @@ class YOLODetector:
         self.class_names = class_names
         self.config = config
 
-    def _scale_box(
-        self, box: np.ndarray, x_factor: float, y_factor: float
-    ) -> List[int]:
-        """Scale a detection box to the original image size."""
-        x, y, w, h = box
+    def _scale_boxes(
+        self, boxes: torch.Tensor, x_factor: float, y_factor: float
+    ) -> torch.Tensor:
+        """Scale (N, 4) center-format detection boxes to the original image size."""
+        factors = boxes.new_tensor([x_factor, y_factor])
 
-        # Scale width and height
-        w = w * x_factor
-        h = h * y_factor
-
-        # Scale center coordinates
-        x = x * x_factor
-        y = y * y_factor
+        # Scale center coordinates and width/height
+        centers = boxes[:, :2] * factors
+        sizes = boxes[:, 2:4] * factors
 
         # Convert to top-left coordinates with width and height
-        left = int(x - w / 2)
-        top = int(y - h / 2)
-        width = int(w)
-        height = int(h)
-
-        return [left, top, width, height]
+        return torch.cat([centers - sizes / 2, sizes], dim=1).to(torch.int32)
 
     def process_detections(
         self, outputs: torch.Tensor, original_img_size: Tuple[int, int]
-    ) -> List[Tuple[List[int], float, int]]:
-        """Process YOLO detection tensors into a list of bounding boxes.
+    ) -> Detections:
+        """Process YOLO detection tensors into bounding boxes, scores and classes.
 
         === TENSOR PROCESSING ===
         Transforms the raw tensor outputs from YOLO models into detection objects
@@ -116,62 +135,67 @@ class YOLODetector:
         input_h, input_w = self.config.input_size
         scale_factors = (float(img_w) / float(input_w), float(img_h) / float(input_h))
 
-        # Extract class scores from the tensor (scores start at index 4)
-        class_scores = outputs[:, 4:]
-        # Get highest scoring class for each detection
-        class_ids = np.argmax(class_scores, axis=1)
-        confidences = class_scores[np.arange(len(class_scores)), class_ids]
+        # Get the highest scoring class for each detection (scores start at
+        # index 4), on the device that produced the outputs
+        confidences, class_ids = outputs[:, 4:].max(dim=1)
 
         # Filter detections by confidence threshold
         mask = confidences >= self.config.conf_threshold
 
-        if not np.any(mask):
-            return []
-
-        # Apply mask to filter outputs
-        filtered_outputs = outputs[mask]
-        filtered_confidences = confidences[mask]
-        filtered_class_ids = class_ids[mask]
+        if not mask.any():
+            return Detections.empty()
 
         # Scale boxes from model output space to original image dimensions
-        boxes = np.array(
-            [self._scale_box(det[:4], *scale_factors) for det in filtered_outputs]
-        )
+        boxes = self._scale_boxes(outputs[mask, :4], *scale_factors)
 
         # Filter invalid boxes
         valid_mask = (boxes[:, 2] > 0) & (boxes[:, 3] > 0)
-        if not np.any(valid_mask):
-            return []
+        if not valid_mask.any():
+            return Detections.empty()
+
+        boxes = boxes[valid_mask]
+        scores = confidences[mask][valid_mask].float()
+        class_ids = class_ids[mask][valid_mask]
 
-        boxes = boxes[valid_mask].tolist()
-        scores = filtered_confidences[valid_mask].tolist()
-        class_ids = filtered_class_ids[valid_mask].tolist()
+        # Keep only the highest scoring candidates; NMS cost grows with the
+        # square of the candidate count
+        top_k = self.config.top_k
+        if top_k and scores.numel() > top_k:
+            scores, top = scores.topk(top_k)
+            boxes, class_ids = boxes[top], class_ids[top]
 
         try:
-            # Apply Non-Maximum Suppression to remove duplicate/overlapping detections
-            indices = cv2.dnn.NMSBoxes(
-                boxes, scores, self.config.conf_threshold, self.config.iou_threshold
-            ).flatten()
-            return [(boxes[i], scores[i], class_ids[i]) for i in indices]
+            # Apply Non-Maximum Suppression to remove duplicate/overlapping
+            # detections, still on the device; only the kept detections are
+            # copied to the host. Per-class suppression offsets each class's
+            # boxes apart so a single NMS call covers every class
+            corners = torch.cat([boxes[:, :2], boxes[:, :2] + boxes[:, 2:]], dim=1)
+            if self.config.class_agnostic:
+                keep = nms(corners.float(), scores, self.config.iou_threshold)
+            else:
+                keep = batched_nms(
+                    corners.float(), scores, class_ids, self.config.iou_threshold
+                )
+            return Detections(boxes[keep], scores[keep], class_ids[keep])
         except Exception as e:
             logger.error(f"Error during NMS: {e}")
-            return []
+            return Detections.empty()
 
-    def _prepare_outputs(self, outputs: torch.Tensor) -> np.ndarray:
+    def _prepare_outputs(self, outputs: torch.Tensor) -> torch.Tensor:
         """Prepare raw model tensor outputs for processing.
 
         === TENSOR TRANSFORMATION ===
-        Converts PyTorch tensor outputs to numpy arrays and reshapes
-        them for consistent processing regardless of model output format.
+        Reshapes PyTorch tensor outputs to one row per candidate detection for
+        consistent processing regardless of model output format. The tensor
+        stays on its device so thresholding happens before any host copy.
         """
         # Handle tuple outputs (common in some YOLO implementations)
         if isinstance(outputs, tuple):
             outputs = outputs[0]
 
-        # Move tensor to CPU and convert to numpy
-        outputs = outputs.detach().cpu().numpy()
+        outputs = outputs.detach()
 
         # Normalize dimensions
-        outputs = outputs[np.newaxis, :] if outputs.ndim == 1 else outputs
-        outputs = np.transpose(np.squeeze(outputs))
-        return outputs
+        outputs = outputs.unsqueeze(0) if outputs.dim() == 1 else outputs
+        outputs = outputs.squeeze()
+        return outputs.permute(*reversed(range(outputs.dim())))
@@ -141,9 +141,11 @@ class YOLOProcessor(ModelProcessor):
         # Process the detection tensor through the detector
         detections = self.detector.process_detections(output, original_size)
         logger.info(f"{len(detections)} detections found")
-        logger.debug(f"Detections: {detections}")
+        if logger.isEnabledFor(logging.DEBUG):
+            # Formatting every detection is costly; skip it unless it is shown
+            logger.debug(f"Detections: {detections}")
 
-        # Convert raw detection tuples to structured dictionaries
+        # Convert the detection rows to structured dictionaries
         return [
             {
                 "box": box,  # [x1, y1, width, height]
@@ -1,8 +1,9 @@
 """Visualization utilities for inference results"""
 
+import functools
 import logging
 import os
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from PIL import Image, ImageDraw, ImageFont
 
@@ -11,6 +12,45 @@ from .configs import VisualizationConfig
 logger = logging.getLogger("split_computing_logger")
 
 
+@functools.lru_cache(maxsize=8)
+def _load_font(font_size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a font with fallback mechanisms for different platforms.
+
+    Cached per size, so visualizers created for each experiment and split
+    share one parsed font instead of probing and loading it again.
+    """
+    # Try to load the default font with size parameter
+    try:
+        return ImageFont.load_default()
+    except (AttributeError, ValueError) as e:
+        logger.warning(f"Could not load default font with size: {e}")
+
+    # Look for common system fonts as fallback
+    system_fonts = [
+        # Linux/Jetson
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+        "/usr/share/fonts/TTF/DejaVuSans.ttf",
+        "/usr/share/fonts/truetype/ttf-dejavu/DejaVuSans.ttf",
+        # Windows
+        "C:\\Windows\\Fonts\\arial.ttf",
+        # MacOS
+        "/Library/Fonts/Arial.ttf",
+        "/System/Library/Fonts/Helvetica.ttc",
+    ]
+
+    for system_font in system_fonts:
+        if os.path.exists(system_font):
+            try:
+                return ImageFont.truetype(system_font, font_size)
+            except Exception as e:
+                logger.debug(f"Could not load system font {system_font}: {e}")
+
+    # Final fallback: use the default font without size parameter
+    logger.warning("Using default font without size parameter as last resort")
+    return ImageFont.load_default()
+
+
 class PredictionVisualizer:
     """Handles visualization of classification predictions.
 
@@ -21,39 +61,7 @@ class PredictionVisualizer:
     def __init__(self, vis_config: VisualizationConfig):
         """Initialize the visualizer with configuration settings."""
         self.config = vis_config
-        self.font = self._load_font(self.config.font_size)
-
-    def _load_font(self, font_size: int) -> ImageFont.FreeTypeFont:
-        """Load a font with fallback mechanisms for different platforms."""
-        # Try to load the default font with size parameter
-        try:
-            return ImageFont.load_default()
-        except (AttributeError, ValueError) as e:
-            logger.warning(f"Could not load default font with size: {e}")
-
-        # Look for common system fonts as fallback
-        system_fonts = [
-            # Linux/Jetson
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/TTF/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/ttf-dejavu/DejaVuSans.ttf",
-            # Windows
-            "C:\\Windows\\Fonts\\arial.ttf",
-            # MacOS
-            "/Library/Fonts/Arial.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-        ]
-
-        for system_font in system_fonts:
-            if os.path.exists(system_font):
-                try:
-                    return ImageFont.truetype(system_font, font_size)
-                except Exception as e:
-                    logger.debug(f"Could not load system font {system_font}: {e}")
-
-        # Final fallback: use the default font without size parameter
-        logger.warning("Using default font without size parameter as last resort")
-        return ImageFont.load_default()
+        self.font = _load_font(self.config.font_size)
 
     def draw_classification_result(
         self,
@@ -132,39 +140,45 @@ class DetectionVisualizer:
         """Initialize the detection visualizer with class names and configuration."""
         self.class_names = class_names
         self.config = vis_config
-        self.font = self._load_font(self.config.font_size)
-
-    def _load_font(self, font_size: int) -> ImageFont.FreeTypeFont:
-        """Load a font with fallback mechanisms for different platforms."""
-        # Try to load the default font with size parameter
+        self.font = _load_font(self.config.font_size)
+        # Rendered background and text mask of each label drawn so far; labels
+        # repeat across detections and frames, and the font never changes
+        self._label_tiles: Dict[str, Tuple[Image.Image, Image.Image]] = {}
+
+    def _label_tile(
+        self, draw: ImageDraw.ImageDraw, label: str
+    ) -> Tuple[Image.Image, Image.Image]:
+        """Return the background and text mask of a label, rendering it once."""
+        tile = self._label_tiles.get(label)
+        if tile is not None:
+            return tile
+
+        # Calculate text dimensions based on font capabilities
         try:
-            return ImageFont.load_default()
-        except (AttributeError, ValueError) as e:
-            logger.warning(f"Could not load default font with size: {e}")
-
-        # Look for common system fonts as fallback
-        system_fonts = [
-            # Linux/Jetson
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
-            "/usr/share/fonts/TTF/DejaVuSans.ttf",
-            "/usr/share/fonts/truetype/ttf-dejavu/DejaVuSans.ttf",
-            # Windows
-            "C:\\Windows\\Fonts\\arial.ttf",
-            # MacOS
-            "/Library/Fonts/Arial.ttf",
-            "/System/Library/Fonts/Helvetica.ttc",
-        ]
-
-        for system_font in system_fonts:
-            if os.path.exists(system_font):
-                try:
-                    return ImageFont.truetype(system_font, font_size)
-                except Exception as e:
-                    logger.debug(f"Could not load system font {system_font}: {e}")
-
-        # Final fallback: use the default font without size parameter
-        logger.warning("Using default font without size parameter as last resort")
-        return ImageFont.load_default()
+            # Try to use textbbox if available (requires TrueType font)
+            bbox = draw.textbbox((0, 0), label, font=self.font)
+            text_w, text_h = bbox[2] - bbox[0], bbox[3] - bbox[1]
+        except (ValueError, AttributeError):
+            # Fallback to older method for non-TrueType fonts; approximate height
+            bbox = (0, 0, int(draw.textlength(label, font=self.font)), 0)
+            text_w, text_h = bbox[2], self.config.font_size + 4
+
+        # Semi-transparent background sized to the text plus padding
+        background = Image.new(
+            "RGBA",
+            (text_w + 2 * self.config.padding, text_h + 2 * self.config.padding),
+            self.config.bg_color,
+        )
+
+        # Glyph coverage of the label drawn at the origin, as draw.text would
+        # place it; later draws only blend it in with the text color
+        mask = Image.new(
+            "L", (max(bbox[2], text_w, 1), max(bbox[3], text_h, 1))
+        )
+        ImageDraw.Draw(mask).text((0, 0), label, fill=255, font=self.font)
+
+        tile = self._label_tiles[label] = (background, mask)
+        return tile
 
     def draw_detections(
         self, image: Image.Image, detections: List[Dict[str, Any]]
@@ -174,6 +188,7 @@ class DetectionVisualizer:
         === RESULT VISUALIZATION ===
         Renders the processed tensor output (now as detection objects)
         by drawing bounding boxes and labels for each detected object.
+        Each distinct label is rendered once and then only blended in.
         """
         draw = ImageDraw.Draw(image)
 
@@ -192,43 +207,20 @@ class DetectionVisualizer:
                 # Prepare the label text with class name and confidence
                 label = f"{class_name}: {score:.2f}"
 
-                # Calculate text dimensions based on font capabilities
-                try:
-                    # Try to use textbbox if available (requires TrueType font)
-                    bbox = draw.textbbox((0, 0), label, font=self.font)
-                    text_w = bbox[2] - bbox[0]
-                    text_h = bbox[3] - bbox[1]
-                except (ValueError, AttributeError):
-                    # Fallback to older method for non-TrueType fonts
-                    text_w = draw.textlength(label, font=self.font)
-                    # Approximate text height
-                    text_h = self.config.font_size + 4
+                background, text_mask = self._label_tile(draw, label)
 
                 # Calculate label position with padding
                 label_x = max(x1 + self.config.padding, 0)
                 label_y = max(y1 + self.config.padding, 0)
 
                 # Draw a semi-transparent background for the label
-                background = Image.new(
-                    "RGBA",
-                    (
-                        text_w + 2 * self.config.padding,
-                        text_h + 2 * self.config.padding,
-                    ),
-                    self.config.bg_color,
-                )
                 image.paste(
                     background,
                     (label_x - self.config.padding, label_y - self.config.padding),
                     background,
                 )
 
-                # Draw the label text over the background
-                draw.text(
-                    (label_x, label_y),
-                    label,
-                    fill=self.config.text_color,
-                    font=self.font,
-                )
+                # Draw the pre-rendered label text over the background
+                draw.bitmap((label_x, label_y), text_mask, fill=self.config.text_color)
 
         return image
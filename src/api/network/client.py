@@ -5,20 +5,24 @@ This module implements client-side networking for distributed neural network com
 handling connections to server-side processing nodes and tensor data transfer.
 """
 
-import pickle
 import socket
+import struct
 import logging
+import threading
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Tuple
 
 from .protocols import (
     LENGTH_PREFIX_SIZE,
-    BUFFER_SIZE,
+    RESULT_HEADER_FORMAT,
     ACK_MESSAGE,
-    HIGHEST_PROTOCOL,
     DEFAULT_COMPRESSION_SETTINGS,
     DEFAULT_PORT,
+    SENDMSG_MAX_PAYLOAD,
 )
+from .compression import compress_segments, decompress_segments
+from .handshake import pack_config
+from .serialization import Buffer, dequantize, deserialize, quantize, serialize_parts
 
 try:
     import blosc2
@@ -36,6 +40,11 @@ except ImportError:
 
 logger = logging.getLogger("split_computing_logger")
 
+# Precompiled wire headers: request (split index, payload length) and
+# result (payload length, server processing time)
+_REQUEST_HEADER = struct.Struct(">II")
+_RESULT_HEADER = struct.Struct(RESULT_HEADER_FORMAT)
+
 
 @dataclass(frozen=True)
 class NetworkConfig:
@@ -105,22 +114,12 @@ class DataCompression:
         requirements. This method is critical for efficient tensor sharing between devices.
         """
         try:
-            # First serialize the tensor data structure using pickle
-            serialized_data = pickle.dumps(data, protocol=HIGHEST_PROTOCOL)
-
-            # Apply compression algorithm based on available libraries
-            if BLOSC2_AVAILABLE:
-                compressed_data = blosc2.compress(
-                    serialized_data,
-                    clevel=self.config["clevel"],
-                    filter=self._filter,
-                    codec=self._codec,
-                )
-            else:
-                compressed_data = zlib.compress(
-                    serialized_data, level=self.config["clevel"]
-                )
-
+            # Reduce tensors to the transport dtype, then serialize (raw frames
+            # for tensors, left in place for the compressor)
+            parts = serialize_parts(
+                quantize(data, self.config.get("dtype_policy", "fp32"))
+            )
+            compressed_data = compress_segments(parts, self._compress)
             return compressed_data, len(compressed_data)
         except Exception as e:
             logger.error(f"Tensor compression failed: {e}")
@@ -136,42 +135,57 @@ class DataCompression:
         """
         try:
             # Apply decompression algorithm based on available libraries
-            if BLOSC2_AVAILABLE:
-                decompressed = blosc2.decompress(compressed_data)
-            else:
-                decompressed = zlib.decompress(compressed_data)
-
-            # Deserialize data back to tensor structure
-            return pickle.loads(decompressed)
+            decompressed = decompress_segments(compressed_data, self._decompress_into)
+            if decompressed is None and BLOSC2_AVAILABLE:
+                decompressed = blosc2.decompress(compressed_data, as_bytearray=True)
+            elif decompressed is None:
+                decompressed = bytearray(zlib.decompress(compressed_data))
+
+            # Deserialize data back to tensor structure at its original dtype
+            return dequantize(deserialize(decompressed))
         except Exception as e:
             logger.error(f"Tensor decompression failed: {e}")
             raise DecompressionError(f"Failed to decompress tensor data: {e}")
 
-    def receive_full_message(self, conn: socket.socket, expected_length: int) -> bytes:
+    def _compress(self, buffer: Buffer) -> bytes:
+        """Compress one buffer with whichever compression library is available."""
+        if BLOSC2_AVAILABLE:
+            return blosc2.compress(
+                buffer,
+                typesize=memoryview(buffer).itemsize,
+                clevel=self.config["clevel"],
+                filter=self._filter,
+                codec=self._codec,
+            )
+        return zlib.compress(buffer, level=self.config["clevel"])
+
+    @staticmethod
+    def _decompress_into(source: Buffer, destination: memoryview) -> None:
+        """Decompress one segment into its place in the reassembled payload."""
+        if BLOSC2_AVAILABLE:
+            blosc2.decompress(source, dst=destination)
+        else:
+            destination[:] = zlib.decompress(source)
+
+    def receive_full_message(
+        self, conn: socket.socket, expected_length: int
+    ) -> bytearray:
         """
         Receive a complete tensor data message of expected length from a socket.
 
         === TENSOR SHARING PIPELINE - STAGE 2: DATA RECEPTION ===
-        Handles fragmentation of large tensors by receiving in chunks until the complete
-        tensor is received or a connection error occurs.
+        Handles fragmentation of large tensors by filling a preallocated buffer
+        with recv_into() until the complete tensor is received or a connection
+        error occurs. Each call takes whatever the kernel has buffered, so large
+        tensors need far fewer system calls than fixed-size chunked reads.
         """
-        data = bytearray()
+        data = bytearray(expected_length)
+        view = memoryview(data)
         received = 0
 
         while received < expected_length:
             try:
-                remaining = expected_length - received
-                chunk = conn.recv(min(BUFFER_SIZE, remaining))
-
-                if not chunk:
-                    logger.error(
-                        f"Connection closed while receiving tensor data ({received}/{expected_length} bytes received)"
-                    )
-                    raise NetworkError("Connection closed while receiving tensor data")
-
-                data.extend(chunk)
-                received += len(chunk)
-
+                chunk_size = conn.recv_into(view[received:])
             except socket.timeout:
                 logger.error("Socket timed out while receiving tensor data")
                 raise NetworkError("Socket timed out while receiving tensor data")
@@ -182,7 +196,14 @@ class DataCompression:
                 logger.error(f"Error receiving tensor data: {e}")
                 raise NetworkError(f"Error receiving tensor data: {e}")
 
-        return bytes(data)
+            if not chunk_size:
+                logger.error(
+                    f"Connection closed while receiving tensor data ({received}/{expected_length} bytes received)"
+                )
+                raise NetworkError("Connection closed while receiving tensor data")
+            received += chunk_size
+
+        return data
 
 
 class SplitComputeClient:
@@ -195,10 +216,12 @@ class SplitComputeClient:
         self.port = network_config.port
         self.socket = None
         self.connected = False
+        # One request/response exchange at a time on the shared connection
+        self._lock = threading.Lock()
 
         # Initialize tensor compression with configuration settings
-        compression_config = self.config.get(
-            "compression", {"clevel": 3, "filter": "SHUFFLE", "codec": "ZSTD"}
+        compression_config = self.config.get("compression") or dict(
+            DEFAULT_COMPRESSION_SETTINGS
         )
         self.compressor = DataCompression(compression_config)
 
@@ -215,11 +238,14 @@ class SplitComputeClient:
 
         try:
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Headers are small writes followed by a reply wait; don't let
+            # Nagle's algorithm hold them back
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.socket.connect((self.host, self.port))
             logger.info(f"Connected to {self.host}:{self.port}")
 
-            # Serialize configuration for server synchronization
-            config_bytes = pickle.dumps(self.config, protocol=HIGHEST_PROTOCOL)
+            # Encode configuration for server synchronization
+            config_bytes = pack_config(self.config)
 
             # Send length-prefixed configuration in one atomic operation
             # This ensures the server receives configuration parameters before any tensor data
@@ -263,7 +289,32 @@ class SplitComputeClient:
 
         Returns:
             Tuple of (processed_result, server_time)
+
+        The connection is kept open across calls. If the server has dropped it
+        while idle, the request is sent again once over a new connection.
         """
+        with self._lock:
+            return self._exchange(split_index, intermediate_output)
+
+    def _send_request(self, header: bytes, payload: bytes) -> None:
+        """Write a request, coalescing small payloads with their header."""
+        if len(payload) > SENDMSG_MAX_PAYLOAD or not hasattr(self.socket, "sendmsg"):
+            self.socket.sendall(header)
+            self.socket.sendall(payload)
+            return
+
+        views = [memoryview(header), memoryview(payload)]
+        while views:
+            sent = self.socket.sendmsg(views)
+            while views and sent >= len(views[0]):
+                sent -= len(views.pop(0))
+            if sent:
+                views[0] = views[0][sent:]
+
+    def _exchange(
+        self, split_index: int, intermediate_output: bytes
+    ) -> Tuple[Any, float]:
+        """Send one split computation request and wait for its result."""
         if not self.connected or not self.socket:
             if not self.connect():
                 raise NetworkError("Failed to connect to server")
@@ -271,48 +322,45 @@ class SplitComputeClient:
         try:
             # Prepare header containing split point and tensor size information
             # This informs the server which model layer to resume computation from
-            header = split_index.to_bytes(LENGTH_PREFIX_SIZE, "big") + len(
-                intermediate_output
-            ).to_bytes(LENGTH_PREFIX_SIZE, "big")
+            header = _REQUEST_HEADER.pack(split_index, len(intermediate_output))
+            # Per-request messages are only built when debug logging is enabled
+            debug = logger.isEnabledFor(logging.DEBUG)
 
-            # Send the header and compressed tensor in sequence
-            self.socket.sendall(header)
-            self.socket.sendall(intermediate_output)
-            logger.debug(
-                f"Sent {len(intermediate_output)} bytes for split layer {split_index}"
-            )
-
-            # Receive expected result size to properly handle fragmentation
-            result_size_bytes = self.socket.recv(LENGTH_PREFIX_SIZE)
-            if not result_size_bytes or len(result_size_bytes) != LENGTH_PREFIX_SIZE:
-                raise NetworkError(
-                    "Connection closed by server while reading result size"
+            # Send the header and compressed tensor
+            try:
+                self._send_request(header, intermediate_output)
+            except (BrokenPipeError, ConnectionResetError) as e:
+                # Nothing has been processed yet; retry once on a new connection
+                logger.warning(f"Connection lost ({e}), reconnecting to resend")
+                self.close()
+                if not self.connect():
+                    raise NetworkError("Failed to reconnect to server")
+                self._send_request(header, intermediate_output)
+            if debug:
+                logger.debug(
+                    f"Sent {len(intermediate_output)} bytes for split layer "
+                    f"{split_index}"
                 )
 
-            result_size = int.from_bytes(result_size_bytes, "big")
-            logger.debug(f"Server will send {result_size} bytes of tensor result data")
-
-            # Receive server processing time metric
-            server_time_bytes = self.socket.recv(LENGTH_PREFIX_SIZE)
-            if not server_time_bytes or len(server_time_bytes) != LENGTH_PREFIX_SIZE:
-                raise NetworkError(
-                    "Connection closed by server while reading server time"
+            # Receive result size and server processing time in one header
+            result_header = self.compressor.receive_full_message(
+                conn=self.socket, expected_length=_RESULT_HEADER.size
+            )
+            result_size, server_time = _RESULT_HEADER.unpack(result_header)
+            if debug:
+                logger.debug(
+                    f"Server will send {result_size} bytes of tensor result data "
+                    f"(server tensor processing time: {server_time}s)"
                 )
 
-            try:
-                server_time = float(server_time_bytes.strip().decode())
-                logger.debug(f"Server tensor processing time: {server_time}s")
-            except ValueError:
-                logger.error(f"Invalid server time received: {server_time_bytes!r}")
-                server_time = 0.0
-
             # Receive the compressed result tensor data
             response_data = self.compressor.receive_full_message(
                 conn=self.socket, expected_length=result_size
             )
-            logger.debug(
-                f"Received {len(response_data)} bytes of compressed result tensor"
-            )
+            if debug:
+                logger.debug(
+                    f"Received {len(response_data)} bytes of compressed result tensor"
+                )
 
             # Decompress the tensor result
             processed_result = self.compressor.decompress_data(response_data)
@@ -352,9 +400,7 @@ def create_network_client(
     if config is None:
         config = {}
 
-    # Ensure compression configuration for efficient tensor transmission
-    if "compression" not in config:
-        config["compression"] = DEFAULT_COMPRESSION_SETTINGS
-
+    # A config without compression settings is sent as is, so the server can
+    # choose the codec; the client then compresses with the defaults
     network_config = NetworkConfig(config=config, host=host, port=port)
     return SplitComputeClient(network_config)
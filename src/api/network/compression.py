@@ -6,22 +6,34 @@ to optimize network transmission in distributed computation environments.
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, cast
 
 import blosc2  # type: ignore
 import logging
-import pickle
 import socket
+import struct
 
 from .protocols import (
+    COMPRESSION_SEGMENT_MIN_BYTES,
     LENGTH_PREFIX_SIZE,
-    CHUNK_SIZE,
-    HIGHEST_PROTOCOL,
+    SEGMENTED_MAGIC,
+    TRANSPORT_DTYPE_POLICIES,
+)
+from .serialization import (
+    Buffer,
+    dequantize,
+    deserialize,
+    quantize,
+    serialize_parts,
 )
 from ..core import NetworkError
 
 logger = logging.getLogger("split_computing_logger")
 
+# Segmented payload header: segment count, then (raw size, compressed size) pairs
+_SEGMENT_COUNT = struct.Struct(">I")
+_SEGMENT_SIZES = struct.Struct(">QQ")
+
 
 @dataclass(frozen=True)
 class CompressionConfig:
@@ -30,6 +42,7 @@ class CompressionConfig:
     clevel: int  # Compression level (0=fast/low, 9=slow/high)
     filter: str  # Data preparation filter (e.g., "NOSHUFFLE", "SHUFFLE", "BITSHUFFLE")
     codec: str  # Compression algorithm (e.g., "ZSTD", "LZ4", "BLOSCLZ")
+    dtype_policy: str = "fp32"  # Tensor transport precision (TRANSPORT_DTYPE_POLICIES)
 
     def __post_init__(self) -> None:
         """Validate compression configuration parameters for tensor optimization."""
@@ -42,6 +55,9 @@ class CompressionConfig:
         if self.codec not in blosc2.Codec.__members__:
             raise ValueError(f"Invalid codec: {self.codec}")
 
+        if self.dtype_policy not in TRANSPORT_DTYPE_POLICIES:
+            raise ValueError(f"Invalid dtype policy: {self.dtype_policy}")
+
 
 class CompressionError(Exception):
     """Base exception for tensor compression-related errors."""
@@ -55,16 +71,97 @@ class DecompressionError(CompressionError):
     pass
 
 
+def compress_segments(
+    parts: List[Buffer], compress: Callable[[Buffer], bytes]
+) -> bytes:
+    """
+    Compress serialized parts without first joining them into one buffer.
+
+    Parts of at least COMPRESSION_SEGMENT_MIN_BYTES (raw tensor data) are handed
+    to `compress` in place; runs of smaller parts are joined and compressed
+    together. A payload that forms a single segment is returned as a plain
+    compressed chunk, anything else as:
+
+        SEGMENTED_MAGIC | count (uint32) | per segment: raw size, compressed size
+        (2 x uint64) | compressed segments
+    """
+    segments: List[Buffer] = []
+    pending: List[Buffer] = []
+    for part in parts:
+        if memoryview(part).nbytes < COMPRESSION_SEGMENT_MIN_BYTES:
+            pending.append(part)
+            continue
+        if pending:
+            segments.append(b"".join(pending))
+            pending = []
+        segments.append(part)
+    if pending or not segments:
+        segments.append(b"".join(pending))
+
+    if len(segments) == 1:
+        return compress(segments[0])
+
+    compressed = [compress(segment) for segment in segments]
+    header = [SEGMENTED_MAGIC, _SEGMENT_COUNT.pack(len(segments))]
+    for segment, chunk in zip(segments, compressed):
+        header.append(_SEGMENT_SIZES.pack(memoryview(segment).nbytes, len(chunk)))
+    return b"".join(header + compressed)
+
+
+def decompress_segments(
+    data: Buffer, decompress_into: Callable[[Buffer, memoryview], None]
+) -> Optional[bytearray]:
+    """
+    Reassemble a payload written by `compress_segments` into one buffer.
+
+    Each segment is decompressed straight into its place in the result by
+    `decompress_into(source, destination)`. Returns None for plain compressed
+    chunks, which the caller decompresses as before.
+    """
+    view = memoryview(data)
+    if view[: len(SEGMENTED_MAGIC)] != SEGMENTED_MAGIC:
+        return None
+
+    offset = len(SEGMENTED_MAGIC)
+    (count,) = _SEGMENT_COUNT.unpack_from(view, offset)
+    offset += _SEGMENT_COUNT.size
+    sizes = [
+        _SEGMENT_SIZES.unpack_from(view, offset + i * _SEGMENT_SIZES.size)
+        for i in range(count)
+    ]
+    offset += count * _SEGMENT_SIZES.size
+
+    result = bytearray(sum(raw_size for raw_size, _ in sizes))
+    out = memoryview(result)
+    position = 0
+    for raw_size, compressed_size in sizes:
+        decompress_into(
+            view[offset : offset + compressed_size],
+            out[position : position + raw_size],
+        )
+        offset += compressed_size
+        position += raw_size
+    return result
+
+
+def _blosc2_decompress_into(source: Buffer, destination: memoryview) -> None:
+    blosc2.decompress(source, dst=destination)
+
+
 class DataCompression:
     """Handles advanced tensor compression for distributed neural network computation."""
 
-    def __init__(self, config: Dict[str, Any]) -> None:
+    def __init__(self, config: Union[Dict[str, Any], CompressionConfig]) -> None:
         """Initialize tensor compression engine with optimal configuration."""
-        self.config = CompressionConfig(
-            clevel=config.get("clevel", 3),
-            filter=config.get("filter", "NOSHUFFLE"),
-            codec=config.get("codec", "ZSTD"),
-        )
+        if isinstance(config, CompressionConfig):
+            self.config = config
+        else:
+            self.config = CompressionConfig(
+                clevel=config.get("clevel", 3),
+                filter=config.get("filter", "NOSHUFFLE"),
+                codec=config.get("codec", "ZSTD"),
+                dtype_policy=config.get("dtype_policy", "fp32"),
+            )
         # Map string parameters to actual blosc2 enum values for direct API use
         self._filter = blosc2.Filter[self.config.filter]
         self._codec = blosc2.Codec[self.config.codec]
@@ -75,46 +172,57 @@ class DataCompression:
 
         === TENSOR SHARING - COMPRESSION PHASE ===
         Optimizes neural network tensors for network transmission by:
-        1. Serializing the tensor data structure with pickle
-        2. Applying compression with tuned parameters for tensor data patterns
+        1. Reducing floating point tensors to the configured transport dtype
+        2. Serializing tensors as typed raw frames (other data with pickle)
+        3. Applying compression with tuned parameters for tensor data patterns,
+           reading raw tensor data in place rather than from a joined copy
 
         Returns a tuple of (compressed_bytes, compressed_length)
         """
         try:
-            # Serialize tensor to bytes using highest available pickle protocol
-            serialized_data = pickle.dumps(data, protocol=HIGHEST_PROTOCOL)
+            # Serialize tensors as raw frames, anything else with pickle
+            parts = serialize_parts(quantize(data, self.config.dtype_policy))
 
             # Apply Blosc2 compression with configured parameters optimized for tensors
-            compressed_data = blosc2.compress(
-                serialized_data,
-                clevel=self.config.clevel,
-                filter=self._filter,
-                codec=self._codec,
-            )
+            compressed_data = compress_segments(parts, self._compress)
             return compressed_data, len(compressed_data)
         except Exception as e:
             logger.error(f"Tensor compression failed: {e}")
             raise CompressionError(f"Failed to compress tensor data: {e}")
 
-    def decompress_data(self, compressed_data: bytes) -> Any:
+    def decompress_data(self, compressed_data: Union[bytes, memoryview]) -> Any:
         """
         Decompress tensor data received over network.
 
         === TENSOR SHARING - DECOMPRESSION PHASE ===
         Recovers the original tensor structure from compressed network data by:
         1. Applying Blosc2 decompression to restore serialized bytes
-        2. Deserializing the data back to its original tensor structure
+        2. Deserializing the data back to its original tensor structure; tensor
+           frames are viewed in place over the decompressed buffer
+        3. Restoring reduced-precision tensors to their original dtype
         """
         try:
-            # Decompress the bytes using Blosc2
-            decompressed = blosc2.decompress(compressed_data)
+            # Decompress into a writable buffer that tensors can share
+            decompressed = decompress_segments(compressed_data, _blosc2_decompress_into)
+            if decompressed is None:
+                decompressed = blosc2.decompress(compressed_data, as_bytearray=True)
 
             # Deserialize back to original tensor data structure
-            return pickle.loads(decompressed)
+            return dequantize(deserialize(decompressed))
         except Exception as e:
             logger.error(f"Tensor decompression failed: {e}")
             raise DecompressionError(f"Failed to decompress tensor data: {e}")
 
+    def _compress(self, buffer: Buffer) -> bytes:
+        """Compress one buffer, shuffling by the element size of its format."""
+        return blosc2.compress(
+            buffer,
+            typesize=memoryview(buffer).itemsize,
+            clevel=self.config.clevel,
+            filter=self._filter,
+            codec=self._codec,
+        )
+
     @staticmethod
     def _receive_chunk(conn: socket.socket, size: int) -> bytes:
         """
@@ -129,44 +237,56 @@ class DataCompression:
             raise NetworkError("Socket connection broken during tensor transmission")
         return chunk
 
-    def receive_full_message(self, conn: socket.socket, expected_length: int) -> bytes:
+    def receive_full_message(
+        self, conn: socket.socket, expected_length: int
+    ) -> bytearray:
         """
         Receive complete tensor data of specified length from network connection.
 
         === TENSOR SHARING - RECEPTION PHASE ===
         Handles large tensor reception by:
-        1. Determining if the tensor fits in a single network packet
-        2. For larger tensors, receiving and assembling multiple chunks
+        1. Allocating the complete message buffer once
+        2. Filling it with recv_into(), letting the kernel deliver as much as it
+           has buffered per call instead of fixed 4KB chunks
         3. Ensuring all bytes are received completely before processing
 
         This method is critical for reliable tensor transmission as deep learning
         tensors can easily exceed single packet sizes.
         """
-        if expected_length <= CHUNK_SIZE:
-            # Small tensor can be received in one operation
-            return self._receive_chunk(conn, expected_length)
+        buffer = bytearray(expected_length)
+        self.receive_full_message_into(conn, expected_length, memoryview(buffer))
+        return buffer
 
-        # Allocate space for the complete tensor data
-        data_chunks = bytearray(expected_length)
-        bytes_received = 0
+    @staticmethod
+    def receive_full_message_into(
+        conn: socket.socket, expected_length: int, mv_out: memoryview
+    ) -> memoryview:
+        """
+        Receive tensor data of specified length directly into a caller-owned buffer.
 
-        # Receive tensor in chunks until complete
-        while bytes_received < expected_length:
-            remaining = expected_length - bytes_received
-            chunk_size = min(remaining, CHUNK_SIZE)
+        Avoids allocating a new bytes object per message by reading with
+        recv_into() into a preallocated buffer. Returns a view over the
+        received bytes, valid until the buffer is reused.
+        """
+        if expected_length > len(mv_out):
+            raise NetworkError(
+                f"Message of {expected_length} bytes exceeds receive buffer "
+                f"of {len(mv_out)} bytes"
+            )
 
+        bytes_received = 0
+        while bytes_received < expected_length:
             try:
-                # Get next chunk of tensor data
-                chunk = self._receive_chunk(conn, chunk_size)
-
-                # Insert chunk at the correct position in the buffer
-                data_chunks[bytes_received : bytes_received + len(chunk)] = chunk
-                bytes_received += len(chunk)
-            except Exception as e:
+                received = conn.recv_into(mv_out[bytes_received:expected_length])
+            except OSError as e:
                 raise NetworkError(f"Failed to receive tensor data: {e}")
+            if not received:
+                raise NetworkError(
+                    "Socket connection broken during tensor transmission"
+                )
+            bytes_received += received
 
-        # Convert to immutable bytes before returning
-        return bytes(data_chunks)
+        return mv_out[:expected_length]
 
     def receive_data(self, conn: socket.socket) -> Optional[Dict[str, Any]]:
         """
@@ -0,0 +1,106 @@
+"""
+Configuration handshake encoding for split computing connections.
+
+The client opens every connection by sending its experiment configuration.
+JSON-serializable configurations are framed as a small binary envelope, so
+the server can read compression parameters directly from a fixed header
+without unpickling anything:
+
+    CONFIG_MAGIC (4 bytes) | clevel, filter, codec, flags (4 x uint8) | JSON config
+
+The AUTO flag marks configs without compression settings; the server then
+picks the codec for the connection from the measured link speed.
+
+Configurations that do not survive JSON, and those sent by older clients,
+are pickled instead. Unpickling runs arbitrary code from the peer, so
+`unpack_config` rejects these payloads unless the caller opts in with
+`allow_pickle` (the server's --allow-pickle-config flag).
+"""
+
+import json
+import logging
+import pickle
+import struct
+from typing import Any, Dict, Optional, Tuple
+
+import blosc2  # type: ignore
+
+from .compression import CompressionConfig
+from .protocols import CONFIG_MAGIC, DEFAULT_COMPRESSION_SETTINGS, HIGHEST_PROTOCOL
+
+logger = logging.getLogger("split_computing_logger")
+
+# Fixed compression header following the magic prefix: clevel, filter, codec,
+# flags
+_COMPRESSION_HEADER = struct.Struct(">BBBB")
+# Flag set when the client left compression settings to the server
+_FLAG_AUTO_COMPRESSION = 0x01
+_BODY_OFFSET = len(CONFIG_MAGIC) + _COMPRESSION_HEADER.size
+
+
+def pack_config(config: Dict[str, Any]) -> bytes:
+    """
+    Encode an experiment configuration for the connection handshake.
+
+    Falls back to pickle, with a warning, when the configuration does not
+    survive a JSON round trip unchanged (tuples, non-string keys, arbitrary
+    objects); servers only accept such payloads when started with
+    --allow-pickle-config. Without a `compression` section, the header
+    carries the default settings and the AUTO flag.
+    """
+    compression = config.get("compression") or DEFAULT_COMPRESSION_SETTINGS
+    flags = 0 if config.get("compression") else _FLAG_AUTO_COMPRESSION
+    try:
+        body = json.dumps(config, separators=(",", ":")).encode()
+        if json.loads(body) != config:
+            raise ValueError("config does not round-trip through JSON")
+        header = _COMPRESSION_HEADER.pack(
+            compression.get("clevel", 3),
+            blosc2.Filter[compression.get("filter", "NOSHUFFLE")].value,
+            blosc2.Codec[compression.get("codec", "ZSTD")].value,
+            flags,
+        )
+    except (TypeError, ValueError, KeyError, struct.error) as e:
+        logger.warning(
+            f"Config is not JSON-serializable ({e}), sending it pickled; the "
+            "server must be started with --allow-pickle-config to accept it"
+        )
+        return pickle.dumps(config, protocol=HIGHEST_PROTOCOL)
+    return CONFIG_MAGIC + header + body
+
+
+def unpack_config(
+    data: bytes, allow_pickle: bool = False
+) -> Tuple[Dict[str, Any], Optional[CompressionConfig]]:
+    """
+    Decode a handshake payload produced by `pack_config`.
+
+    Returns the configuration dictionary and the compression settings read
+    from the fixed header. The settings are None when the client left
+    compression to the server (AUTO flag) and for pickle payloads.
+
+    Raises ValueError for pickle payloads (no magic prefix) unless
+    `allow_pickle` is set.
+    """
+    view = memoryview(data)
+    if view[: len(CONFIG_MAGIC)] != CONFIG_MAGIC:
+        if not allow_pickle:
+            raise ValueError(
+                "Config is not in the JSON handshake format; pickle configs "
+                "are only accepted with --allow-pickle-config"
+            )
+        logger.warning("Unpickling client config; only do this for trusted clients")
+        return pickle.loads(data), None
+
+    clevel, filter_id, codec_id, flags = _COMPRESSION_HEADER.unpack_from(
+        view, len(CONFIG_MAGIC)
+    )
+    config = json.loads(data[_BODY_OFFSET:])
+    if flags & _FLAG_AUTO_COMPRESSION:
+        return config, None
+    compression = CompressionConfig(
+        clevel=clevel,
+        filter=blosc2.Filter(filter_id).name,
+        codec=blosc2.Codec(codec_id).name,
+    )
+    return config, compression
@@ -16,10 +16,18 @@ from typing import Final
 LENGTH_PREFIX_SIZE: Final[int] = 4  # Must be consistent between client and server
 # Header size for split index information
 SPLIT_INDEX_SIZE: Final[int] = LENGTH_PREFIX_SIZE
+# Result header: 4-byte result size followed by float32 server processing time
+RESULT_HEADER_FORMAT: Final[str] = ">If"
 # Buffer size for receiving data in chunks (4KB)
 BUFFER_SIZE: Final[int] = 4096
 # Size for receiving data in larger chunks (used in some implementations)
 CHUNK_SIZE: Final[int] = BUFFER_SIZE
+# Largest payload coalesced with its header into a single sendmsg() call (64KB)
+SENDMSG_MAX_PAYLOAD: Final[int] = 64 * 1024
+# Smallest payload sent with MSG_ZEROCOPY where supported (256KB)
+ZEROCOPY_MIN_PAYLOAD: Final[int] = 256 * 1024
+# Initial size of the server's reusable tensor receive buffer (32MB)
+RECEIVE_BUFFER_SIZE: Final[int] = 32 << 20
 # Default socket timeout in seconds
 SOCKET_TIMEOUT: Final[float] = 5.0
 # Server listening socket timeout in seconds (for accepting connections)
@@ -41,6 +49,14 @@ RETRY_DELAY: Final[float] = 2.0
 ACK_MESSAGE: Final[bytes] = b"OK"
 # Error message format
 ERROR_PREFIX: Final[bytes] = b"ERR:"
+# Magic prefix marking a binary config handshake (legacy clients send pickle)
+CONFIG_MAGIC: Final[bytes] = b"TRC1"
+# Magic prefix marking a typed tensor frame (other payloads are pickled)
+TENSOR_MAGIC: Final[bytes] = b"TRT1"
+# Magic prefix marking a pickled payload whose tensors are carried out of band
+OOB_PICKLE_MAGIC: Final[bytes] = b"TRP5"
+# Magic prefix marking a payload compressed as several independent segments
+SEGMENTED_MAGIC: Final[bytes] = b"TRS1"
 
 
 # ============================================================================
@@ -56,12 +72,25 @@ DEFAULT_COMPRESSION_SETTINGS: Final[dict] = {
     "codec": "ZSTD",
 }
 
-# Minimal compression settings for server (optimized for speed)
+# Server compression settings (Zstd-1 with bitshuffle balances ratio and speed)
 SERVER_COMPRESSION_SETTINGS: Final[dict] = {
     "clevel": 1,
-    "filter": "NOFILTER",
-    "codec": "BLOSCLZ",
+    "filter": "BITSHUFFLE",
+    "codec": "ZSTD",
 }
+# Upper bound on Blosc2's internal (process-wide) compression thread pool
+MAX_COMPRESSION_THREADS: Final[int] = 4
+# Link bandwidth thresholds (Mbit/s) used when auto-selecting the server codec
+FAST_LINK_MBPS: Final[float] = 800.0
+SLOW_LINK_MBPS: Final[float] = 14.0
+# Minimum request bytes still in flight, i.e. not yet buffered by the
+# receiving kernel, for a meaningful link bandwidth estimate (64KB)
+BANDWIDTH_PROBE_MIN_BYTES: Final[int] = 64 * 1024
+# Smallest serialized part compressed in place as its own segment (64KB)
+COMPRESSION_SEGMENT_MIN_BYTES: Final[int] = 64 * 1024
+# Transport precision for floating point tensors: unchanged, float16, bfloat16,
+# or int8 with a per-tensor scale
+TRANSPORT_DTYPE_POLICIES: Final[tuple] = ("fp32", "fp16", "bf16", "int8")
 
 
 # ============================================================================
@@ -105,16 +134,30 @@ class ConnectionState(Enum):
 SSH_PORT: Final[int] = 22
 # Default timeout for network discovery operations (seconds)
 DISCOVERY_TIMEOUT: Final[float] = 0.5
-# Maximum number of concurrent threads for network discovery
-MAX_DISCOVERY_THREADS: Final[int] = 10
+# Maximum number of concurrent connection probes for network discovery
+MAX_DISCOVERY_CONNECTIONS: Final[int] = 256
+# File descriptors left free for the rest of the process while probes are open
+DISCOVERY_FD_RESERVE: Final[int] = 64
 # Default CIDR block for local network scanning
 DEFAULT_LOCAL_CIDR: Final[str] = "192.168.1.0/24"
+# How long resolved hostnames are reused by reachability checks (seconds)
+DISCOVERY_DNS_TTL: Final[float] = 30.0
 
 
 # ============================================================================
 # SSH Protocol Constants
 # ============================================================================
 # Default timeout for SSH connectivity checks (seconds)
-SSH_CONNECTIVITY_TIMEOUT: Final[float] = 0.5
+SSH_CONNECTIVITY_TIMEOUT: Final[float] = 0.3
+# Default timeout for the SSH handshake of device sessions (seconds)
+SSH_DEFAULT_HANDSHAKE_TIMEOUT: Final[float] = 5.0
+# How long a connectivity check result is reused before probing again (seconds)
+SSH_REACHABILITY_TTL: Final[float] = 30.0
 # SSH connection default parameters
 SSH_DEFAULT_CONNECT_TIMEOUT: Final[float] = 10.0
+# Interval between SSH transport keepalive packets for pooled connections (seconds)
+SSH_KEEPALIVE_INTERVAL: Final[int] = 30
+# Number of parallel SFTP sessions used when copying result directories
+SFTP_TRANSFER_WORKERS: Final[int] = 4
+# Timeout for individual SFTP channel operations (seconds)
+SFTP_CHANNEL_TIMEOUT: Final[float] = 60.0
@@ -0,0 +1,270 @@
+"""
+Payload serialization for tensor transmission in split computing.
+
+Tensors and lists of tensors are written as a typed, length-prefixed frame
+(dtype, shape, raw contiguous bytes) instead of being pickled, so no Python
+objects are constructed for the tensor data on either side. Any other payload
+is pickled (protocol 5 or later); tensors nested in it (e.g. the `(output,
+original_size)` split payload) are passed out of band as raw buffers rather
+than through torch's storage pickling, and are viewed in place on receipt.
+
+Floating point tensors can also be reduced to float16, bfloat16 or int8 before
+serialization (`quantize`) and restored to their original dtype on receipt
+(`dequantize`), halving or quartering the bytes that reach the compressor.
+
+Tensor frame layout:
+
+    TENSOR_MAGIC (4 bytes) | dtype id (uint8) | is_list (uint8) | count (uint32)
+    then per tensor: ndim (uint8) | shape (ndim x uint64) | raw data
+
+Out-of-band pickle layout:
+
+    OOB_PICKLE_MAGIC (4 bytes) | buffer count (uint32) | pickle size (uint64)
+    | pickle | then per buffer: size (uint64) | raw data
+"""
+
+import io
+import pickle
+import struct
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Union
+
+import torch
+
+from .protocols import HIGHEST_PROTOCOL, OOB_PICKLE_MAGIC, TENSOR_MAGIC
+
+# Wire ids for tensor dtypes; the index in this tuple is the id on the wire
+_DTYPES = (
+    torch.float32,
+    torch.float16,
+    torch.bfloat16,
+    torch.float64,
+    torch.uint8,
+    torch.int8,
+    torch.int16,
+    torch.int32,
+    torch.int64,
+    torch.bool,
+)
+_DTYPE_IDS = {dtype: idx for idx, dtype in enumerate(_DTYPES)}
+# Integer dtypes used to expose raw tensor data, keyed by element size
+_RAW_DTYPES = {1: torch.uint8, 2: torch.int16, 4: torch.int32, 8: torch.int64}
+
+Buffer = Union[bytes, memoryview]
+
+_FRAME_HEADER = struct.Struct(">BBI")
+_NDIM = struct.Struct(">B")
+_OOB_HEADER = struct.Struct(">IQ")
+_OOB_SIZE = struct.Struct(">Q")
+
+# Tensor dtypes reduced by the fp16, bf16 and int8 transport policies
+_QUANTIZABLE_DTYPES = (torch.float32, torch.float64)
+_INT8_MAX = 127
+
+
+@dataclass(frozen=True)
+class QuantizedTensor:
+    """A floating point tensor reduced to 16 bits or int8 for transport."""
+
+    data: torch.Tensor  # 16-bit float values, or int8 values to multiply by scale
+    scale: float
+    dtype: torch.dtype  # dtype restored by `dequantize`
+
+
+def quantize(data: Any, policy: str) -> Any:
+    """
+    Reduce the floating point tensors in `data` according to a transport policy.
+
+    "fp16" casts to float16 (more mantissa, but values beyond +-65504 become
+    inf); "bf16" casts to bfloat16 (same exponent range, half the bytes);
+    "int8" applies symmetric per-tensor quantization. Tensors nested in tuples and
+    lists are handled; anything else is returned unchanged.
+    """
+    if policy == "fp32":
+        return data
+    if isinstance(data, torch.Tensor):
+        if data.dtype not in _QUANTIZABLE_DTYPES or data.requires_grad:
+            return data
+        if policy == "fp16":
+            return QuantizedTensor(data.to(torch.float16), 1.0, data.dtype)
+        if policy == "bf16":
+            return QuantizedTensor(data.to(torch.bfloat16), 1.0, data.dtype)
+        amax = data.abs().amax().item() if data.numel() else 0.0
+        scale = amax / _INT8_MAX if amax > 0 else 1.0
+        values = (data / scale).round_().clamp_(-_INT8_MAX, _INT8_MAX)
+        return QuantizedTensor(values.to(torch.int8), scale, data.dtype)
+    if type(data) is tuple:
+        return tuple(quantize(item, policy) for item in data)
+    if type(data) is list:
+        return [quantize(item, policy) for item in data]
+    return data
+
+
+def dequantize(data: Any) -> Any:
+    """Restore tensors reduced by `quantize` to their original dtype."""
+    if isinstance(data, QuantizedTensor):
+        tensor = data.data.to(data.dtype)
+        if data.data.dtype == torch.int8:
+            tensor.mul_(data.scale)
+        return tensor
+    if type(data) is tuple:
+        return tuple(dequantize(item) for item in data)
+    if type(data) is list:
+        return [dequantize(item) for item in data]
+    return data
+
+
+def _as_tensor_list(data: Any) -> Optional[List[torch.Tensor]]:
+    """Return the tensors to frame, or None if `data` needs pickle."""
+    if isinstance(data, torch.Tensor):
+        tensors = [data]
+    elif isinstance(data, list) and data and all(
+        isinstance(item, torch.Tensor) for item in data
+    ):
+        tensors = data
+    else:
+        return None
+
+    dtype = tensors[0].dtype
+    if dtype not in _DTYPE_IDS or any(t.dtype != dtype for t in tensors):
+        return None
+    if any(t.requires_grad or t.is_sparse for t in tensors):
+        return None
+    return tensors
+
+
+def _raw_array(tensor: torch.Tensor) -> Any:
+    """View a contiguous CPU tensor's data as a flat array of same-width integers."""
+    return tensor.view(-1).view(_RAW_DTYPES[tensor.element_size()]).numpy()
+
+
+def _rebuild_tensor(buffer: Any, dtype_id: int, shape: Tuple[int, ...]) -> torch.Tensor:
+    """Recreate a tensor passed out of band, viewing the received buffer in place."""
+    dtype = _DTYPES[dtype_id]
+    if not len(memoryview(buffer)):
+        return torch.empty(shape, dtype=dtype)
+    return torch.frombuffer(buffer, dtype=dtype).reshape(shape)
+
+
+class _TensorPickler(pickle.Pickler):
+    """Pickler that hands plain tensor data to `buffer_callback` out of band."""
+
+    def reducer_override(self, obj: Any) -> Any:
+        if (
+            type(obj) is not torch.Tensor
+            or obj.dtype not in _DTYPE_IDS
+            or obj.requires_grad
+            or obj.is_sparse
+        ):
+            return NotImplemented
+        raw = pickle.PickleBuffer(_raw_array(obj.detach().cpu().contiguous()))
+        return _rebuild_tensor, (raw, _DTYPE_IDS[obj.dtype], tuple(obj.shape))
+
+
+def _pickle_out_of_band(data: Any) -> List[Buffer]:
+    """Pickle `data`, appending the raw data of nested tensors after the pickle."""
+    buffers: List[pickle.PickleBuffer] = []
+    stream = io.BytesIO()
+    _TensorPickler(
+        stream, protocol=HIGHEST_PROTOCOL, buffer_callback=buffers.append
+    ).dump(data)
+    if not buffers:
+        return [stream.getvalue()]
+
+    pickled = stream.getbuffer()
+    parts: List[Buffer] = [
+        OOB_PICKLE_MAGIC,
+        _OOB_HEADER.pack(len(buffers), pickled.nbytes),
+        pickled,
+    ]
+    for buffer in buffers:
+        raw = memoryview(buffer)
+        parts.append(_OOB_SIZE.pack(raw.nbytes))
+        parts.append(raw)
+    return parts
+
+
+def _unpickle_out_of_band(view: memoryview) -> Any:
+    """Load a payload written by `_pickle_out_of_band` without copying its tensors."""
+    offset = len(OOB_PICKLE_MAGIC)
+    count, pickle_size = _OOB_HEADER.unpack_from(view, offset)
+    offset += _OOB_HEADER.size
+    pickled = view[offset : offset + pickle_size]
+    offset += pickle_size
+
+    buffers = []
+    for _ in range(count):
+        (size,) = _OOB_SIZE.unpack_from(view, offset)
+        offset += _OOB_SIZE.size
+        buffers.append(view[offset : offset + size])
+        offset += size
+    return pickle.loads(pickled, buffers=buffers)
+
+
+def serialize_parts(data: Any) -> List[Buffer]:
+    """
+    Serialize a payload into the buffers that make up its wire bytes.
+
+    Raw tensor data is returned as views over the tensors themselves, typed with
+    an integer format of the tensor's element size, so the compressor can read
+    it in place and shuffle it by element.
+    """
+    tensors = _as_tensor_list(data)
+    if tensors is None:
+        return _pickle_out_of_band(data)
+
+    parts: List[Buffer] = [
+        TENSOR_MAGIC,
+        _FRAME_HEADER.pack(
+            _DTYPE_IDS[tensors[0].dtype], isinstance(data, list), len(tensors)
+        ),
+    ]
+    for tensor in tensors:
+        tensor = tensor.detach().cpu().contiguous()
+        parts.append(_NDIM.pack(tensor.dim()))
+        parts.append(struct.pack(f">{tensor.dim()}Q", *tensor.shape))
+        parts.append(memoryview(_raw_array(tensor)))
+    return parts
+
+
+def serialize(data: Any) -> bytes:
+    """Serialize a payload, using the tensor frame for tensors and pickle otherwise."""
+    return b"".join(serialize_parts(data))
+
+
+def deserialize(buffer: Union[bytes, bytearray, memoryview]) -> Any:
+    """
+    Deserialize a payload produced by `serialize`.
+
+    Tensors are created directly over `buffer` without copying, so pass a
+    writable buffer (e.g. a bytearray) to get writable tensors.
+    """
+    view = memoryview(buffer)
+    if view[: len(OOB_PICKLE_MAGIC)] == OOB_PICKLE_MAGIC:
+        return _unpickle_out_of_band(view)
+    if view[: len(TENSOR_MAGIC)] != TENSOR_MAGIC:
+        return pickle.loads(buffer)
+
+    offset = len(TENSOR_MAGIC)
+    dtype_id, is_list, count = _FRAME_HEADER.unpack_from(view, offset)
+    offset += _FRAME_HEADER.size
+    dtype = _DTYPES[dtype_id]
+    itemsize = torch.empty((), dtype=dtype).element_size()
+
+    tensors = []
+    for _ in range(count):
+        (ndim,) = _NDIM.unpack_from(view, offset)
+        offset += _NDIM.size
+        shape = struct.unpack_from(f">{ndim}Q", view, offset)
+        offset += 8 * ndim
+        numel = 1
+        for dim in shape:
+            numel *= dim
+        if numel:
+            tensor = torch.frombuffer(view, dtype=dtype, count=numel, offset=offset)
+        else:
+            tensor = torch.empty(0, dtype=dtype)
+        tensors.append(tensor.reshape(shape))
+        offset += numel * itemsize
+
+    return tensors if is_list else tensors[0]
@@ -1,9 +1,10 @@
 """SSH protocol utilities for secure tensor transmission and remote execution in split computing"""
 
+import io
 import logging
 import os
 import select
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import wraps
 from pathlib import Path
@@ -14,6 +15,7 @@ from typing import (
     Final,
     Optional,
     Protocol,
+    Tuple,
     Union,
 )
 
@@ -59,6 +61,9 @@ class SSHConfig:
     timeout: float = DEFAULT_TIMEOUT  # Connection timeout in seconds
     allow_agent: bool = False  # Whether to allow paramiko's SSH agent
     look_for_keys: bool = False  # Whether to search for discoverable private keys
+    keepalive_interval: int = 0  # Transport keepalive in seconds (0 disables)
+    # Already-parsed private key; loaded from private_key_path when None
+    pkey: Optional[paramiko.PKey] = field(default=None, repr=False)
 
 
 class LogFunction(Protocol):
@@ -93,17 +98,25 @@ class SSHKeyHandler:
     REQUIRED_DIR_PERMISSIONS = 0o700  # drwx------
 
     @staticmethod
-    def check_key_permissions(key_path: Union[str, Path]) -> bool:
+    def check_key_permissions(
+        key_path: Union[str, Path], key_stat: Optional[os.stat_result] = None
+    ) -> bool:
         """Verify SSH key has proper permissions for secure tensor transmission.
 
         Ensures keys used to secure tensor data transfers meet security requirements.
+        Callers that already stat()ed the key can pass the result as `key_stat`
+        to skip resolving and re-checking the file.
         """
         try:
-            key_path = Path(key_path).resolve()
-            if not key_path.exists():
-                error_msg = f"Key file does not exist: {key_path}"
-                logger.error(error_msg)
-                raise KeyPermissionError(error_msg)
+            if key_stat is None:
+                key_path = Path(key_path).resolve()
+                if not key_path.exists():
+                    error_msg = f"Key file does not exist: {key_path}"
+                    logger.error(error_msg)
+                    raise KeyPermissionError(error_msg)
+                key_stat = key_path.stat()
+            else:
+                key_path = Path(key_path)
 
             # Check if running on Windows
             is_windows = os.name == "nt"
@@ -121,7 +134,7 @@ class SSHKeyHandler:
                     return False
             else:
                 # Unix-style permission checks (Linux/WSL)
-                file_mode = key_path.stat().st_mode & 0o777
+                file_mode = key_stat.st_mode & 0o777
                 if file_mode != SSHKeyHandler.REQUIRED_FILE_PERMISSIONS:
                     logger.error(
                         f"Invalid key file permissions: {oct(file_mode)} for {key_path}. "
@@ -153,22 +166,16 @@ class SSHKeyHandler:
                     f"Invalid permissions for key file: {key_path}"
                 )
 
-            # Convert key_path to string if not already
-            key_path_str = str(key_path)
-
             # First check the file extension
-            if key_path_str.endswith((".rsa", ".pem")):
-                return SSHKeyType.RSA
-            elif key_path_str.endswith((".ed25519", ".key")):
-                return SSHKeyType.ED25519
+            key_type = SSHKeyHandler._key_type_from_name(str(key_path))
+            if key_type != SSHKeyType.UNKNOWN:
+                return key_type
 
             # If no known extension, inspect the file's first line
             with open(key_path, "r") as key_file:
-                first_line = key_file.readline()
-                if "RSA" in first_line:
-                    return SSHKeyType.RSA
-                elif "OPENSSH PRIVATE KEY" in first_line:
-                    return SSHKeyType.ED25519
+                key_type = SSHKeyHandler._key_type_from_header(key_file.readline())
+                if key_type != SSHKeyType.UNKNOWN:
+                    return key_type
 
             logger.warning(
                 f"Could not determine key type for {key_path}. Assuming unknown."
@@ -181,6 +188,67 @@ class SSHKeyHandler:
             logger.error(error_msg)
             raise SSHError(error_msg) from e
 
+    @staticmethod
+    def _key_type_from_name(key_path: str) -> SSHKeyType:
+        """Determine the key type from the key file's extension."""
+        if key_path.endswith((".rsa", ".pem")):
+            return SSHKeyType.RSA
+        if key_path.endswith((".ed25519", ".key")):
+            return SSHKeyType.ED25519
+        return SSHKeyType.UNKNOWN
+
+    @staticmethod
+    def _key_type_from_header(first_line: str) -> SSHKeyType:
+        """Determine the key type from the first line of the key file."""
+        if "RSA" in first_line:
+            return SSHKeyType.RSA
+        if "OPENSSH PRIVATE KEY" in first_line:
+            return SSHKeyType.ED25519
+        return SSHKeyType.UNKNOWN
+
+    @staticmethod
+    def detect_and_load_key(
+        key_path: Union[str, Path], key_data: bytes
+    ) -> Tuple[SSHKeyType, paramiko.PKey]:
+        """Detect the type of and load an SSH key from its already-read contents.
+
+        Equivalent to `detect_key_type` followed by `load_key` without reopening
+        the key file; the caller is responsible for checking permissions.
+        """
+        try:
+            key_text = key_data.decode()
+            key_type = SSHKeyHandler._key_type_from_name(str(key_path))
+            if key_type == SSHKeyType.UNKNOWN:
+                key_type = SSHKeyHandler._key_type_from_header(
+                    key_text.partition("\n")[0]
+                )
+            logger.debug(f"Detected key type: {key_type} for {key_path}")
+
+            if key_type == SSHKeyType.RSA:
+                return key_type, paramiko.RSAKey.from_private_key(io.StringIO(key_text))
+            if key_type == SSHKeyType.ED25519:
+                return key_type, paramiko.Ed25519Key.from_private_key(
+                    io.StringIO(key_text)
+                )
+            # If key type is unknown, try both RSA and ED25519 as fallback
+            for key_class in (paramiko.RSAKey, paramiko.Ed25519Key):
+                try:
+                    return key_type, key_class.from_private_key(io.StringIO(key_text))
+                except Exception:
+                    continue
+            raise SSHError(f"Unsupported key type for file: {key_path}")
+
+        except paramiko.PasswordRequiredException:
+            error_msg = f"Key file {key_path} requires passphrase"
+            logger.error(error_msg)
+            raise AuthenticationError(error_msg)
+        except (SSHError, AuthenticationError):
+            raise
+        except Exception as e:
+            error_msg = f"Failed to load key: {e}"
+            logger.error(error_msg)
+            raise SSHError(error_msg) from e
+
     @staticmethod
     def load_key(key_path: Union[str, Path]) -> paramiko.PKey:
         """Load an SSH key for secure tensor transmission connections."""
@@ -256,8 +324,10 @@ class SSHClient:
         and executing remote computation operations.
         """
         try:
-            # Load the private key using SSHKeyHandler
-            key = SSHKeyHandler.load_key(self.config.private_key_path)
+            # Use the preloaded key, or load it using SSHKeyHandler
+            key = self.config.pkey or SSHKeyHandler.load_key(
+                self.config.private_key_path
+            )
 
             # Create and configure the SSH client
             self._client = paramiko.SSHClient()
@@ -273,6 +343,10 @@ class SSHClient:
                 allow_agent=self.config.allow_agent,
                 look_for_keys=self.config.look_for_keys,
             )
+            if self.config.keepalive_interval:
+                self._client.get_transport().set_keepalive(  # type: ignore
+                    self.config.keepalive_interval
+                )
 
             logger.info(
                 f"SSH connection established to {self.config.user}@{self.config.host}"
@@ -592,6 +666,14 @@ class SSHClient:
             logger.error(error_msg)
             raise SSHError(error_msg) from e
 
+    @ensure_connection
+    def open_sftp(self) -> paramiko.SFTPClient:
+        """Open an SFTP session over the already-authenticated transport.
+
+        The caller owns the returned session and is responsible for closing it.
+        """
+        return paramiko.SFTPClient.from_transport(self._client.get_transport())  # type: ignore
+
     def _ensure_remote_directory(self, path: Path) -> None:
         """Create directory structure on remote server for tensor storage."""
         if not self._sftp:
@@ -696,12 +778,15 @@ def create_ssh_client(
     timeout: float = DEFAULT_TIMEOUT,
     allow_agent: bool = False,
     look_for_keys: bool = False,
+    keepalive_interval: int = 0,
+    pkey: Optional[paramiko.PKey] = None,
 ) -> SSHClient:
     """
     Create a configured SSH client for secure tensor transmission.
 
     This factory function simplifies the creation of secure connections
     for tensor sharing between edge devices and computation servers.
+    Passing an already-parsed `pkey` skips reading the key file on connect.
     """
     # Resolve and normalize the private key path
     key_path = Path(private_key_path).expanduser().resolve()
@@ -715,6 +800,8 @@ def create_ssh_client(
         timeout=timeout,
         allow_agent=allow_agent,
         look_for_keys=look_for_keys,
+        keepalive_interval=keepalive_interval,
+        pkey=pkey,
     )
 
     # Create and return the SSH client for tensor transmission
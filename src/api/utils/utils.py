@@ -7,6 +7,15 @@ from typing import List, Optional, Union, Dict, Any
 
 from ..core.exceptions import FileOperationError
 
+try:
+    # libyaml-backed parser and emitter, several times faster than the
+    # pure-Python ones
+    from yaml import CSafeDumper as YamlDumper  # noqa: F401
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper  # noqa: F401
+    from yaml import SafeLoader as YamlLoader
+
 logger = logging.getLogger("split_computing_logger")
 
 
@@ -65,8 +74,8 @@ def read_yaml_file(path: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
         config_path = Path(path)
         logger.debug(f"Loading YAML configuration from: {config_path}")
 
-        with config_path.open("r", encoding="utf-8") as file:
-            config = yaml.safe_load(file) or {}
+        with config_path.open("rb") as file:
+            config = yaml.load(file, Loader=YamlLoader) or {}
 
         logger.debug(f"Successfully loaded configuration from: {config_path}")
         return config
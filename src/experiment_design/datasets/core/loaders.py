@@ -16,7 +16,14 @@ from .exceptions import DatasetConfigError, DatasetIOError, DatasetPathError
 logger = logging.getLogger("split_computing_logger")
 
 
-class DatasetRegistry:
+class _RegistryMeta(type):
+    """Metaclass giving the registry a cheap `name in DatasetRegistry` check."""
+
+    def __contains__(cls, name: str) -> bool:
+        return name in cls._registry
+
+
+class DatasetRegistry(metaclass=_RegistryMeta):
     """Registry of available dataset loaders with dynamic import capabilities.
 
     Manages registration, discovery, and instantiation of dataset implementations
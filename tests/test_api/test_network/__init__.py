@@ -0,0 +1,11 @@
+"""Test package for api.network."""
+
+import os
+import sys
+
+# Fix the path to include the project root
+project_root = os.path.dirname(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
@@ -0,0 +1,122 @@
+"""Tests for tensor compression in api.network.compression."""
+
+import unittest
+
+import blosc2
+import torch
+
+from src.api.network.client import DataCompression as ClientDataCompression
+from src.api.network.compression import (
+    DataCompression,
+    compress_segments,
+    decompress_segments,
+)
+from src.api.network.protocols import COMPRESSION_SEGMENT_MIN_BYTES, SEGMENTED_MAGIC
+from src.api.network.serialization import serialize, serialize_parts
+
+SETTINGS = {"clevel": 1, "filter": "SHUFFLE", "codec": "ZSTD"}
+
+
+def _compress(buffer):
+    return blosc2.compress(buffer, typesize=memoryview(buffer).itemsize)
+
+
+def _decompress_into(source, destination):
+    blosc2.decompress(source, dst=destination)
+
+
+class TestSegments(unittest.TestCase):
+    """Round trips through compress_segments/decompress_segments."""
+
+    def test_large_payload_is_segmented(self):
+        """Raw tensor data above the threshold becomes its own segment."""
+        tensor = torch.randn(COMPRESSION_SEGMENT_MIN_BYTES // 2)
+        payload = (tensor, (224, 224))
+        compressed = compress_segments(serialize_parts(payload), _compress)
+        self.assertTrue(compressed.startswith(SEGMENTED_MAGIC))
+
+        restored = decompress_segments(compressed, _decompress_into)
+        self.assertEqual(bytes(restored), serialize(payload))
+
+    def test_small_payload_is_a_plain_chunk(self):
+        """Payloads forming a single segment stay plain compressed chunks."""
+        payload = {"class_name": "cat", "confidence": 0.9}
+        compressed = compress_segments(serialize_parts(payload), _compress)
+        self.assertIsNone(decompress_segments(compressed, _decompress_into))
+        self.assertEqual(blosc2.decompress(compressed), serialize(payload))
+
+    def test_several_large_parts(self):
+        """Small parts between large ones are joined into their own segments."""
+        tensors = [torch.randn(COMPRESSION_SEGMENT_MIN_BYTES // 4) for _ in range(3)]
+        parts = serialize_parts(tensors)
+        restored = decompress_segments(
+            compress_segments(parts, _compress), _decompress_into
+        )
+        self.assertEqual(bytes(restored), serialize(tensors))
+
+    def test_empty_parts(self):
+        """An empty part list compresses to an empty plain chunk."""
+        compressed = compress_segments([], _compress)
+        self.assertEqual(blosc2.decompress(compressed), b"")
+
+
+class TestDataCompression(unittest.TestCase):
+    """Round trips through both DataCompression implementations."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.payloads = {
+            "split": (torch.relu(torch.randn(1, 32, 28, 28)), (224, 224)),
+            "tensor": torch.randn(3, 5),
+            "result": {"class_name": "cat", "confidence": 0.75},
+            "detections": [{"box": [1, 2, 3, 4], "confidence": 0.5}],
+        }
+
+    def assert_payload_equal(self, restored, payload):
+        if isinstance(payload, tuple):
+            self.assertTrue(torch.equal(restored[0], payload[0]))
+            self.assertEqual(tuple(restored[1]), payload[1])
+        elif isinstance(payload, torch.Tensor):
+            self.assertTrue(torch.equal(restored, payload))
+        else:
+            self.assertEqual(restored, payload)
+
+    def test_round_trip(self):
+        """Payloads survive compression with either implementation."""
+        for compression in (DataCompression, ClientDataCompression):
+            for name, payload in self.payloads.items():
+                with self.subTest(compression=compression.__module__, payload=name):
+                    compressor = compression(dict(SETTINGS))
+                    compressed, size = compressor.compress_data(payload)
+                    self.assertEqual(size, len(compressed))
+                    self.assert_payload_equal(
+                        compressor.decompress_data(compressed), payload
+                    )
+
+    def test_implementations_are_interchangeable(self):
+        """Data compressed by the server side decodes on the client side."""
+        payload = self.payloads["split"]
+        compressed, _ = DataCompression(dict(SETTINGS)).compress_data(payload)
+        restored = ClientDataCompression(dict(SETTINGS)).decompress_data(compressed)
+        self.assert_payload_equal(restored, payload)
+
+        compressed, _ = ClientDataCompression(dict(SETTINGS)).compress_data(payload)
+        restored = DataCompression(dict(SETTINGS)).decompress_data(
+            memoryview(compressed)
+        )
+        self.assert_payload_equal(restored, payload)
+
+    def test_dtype_policy(self):
+        """Reduced transport precision restores the original dtype."""
+        tensor = self.payloads["split"][0]
+        for policy in ("fp16", "bf16", "int8"):
+            with self.subTest(policy=policy):
+                compressor = DataCompression(dict(SETTINGS, dtype_policy=policy))
+                compressed, _ = compressor.compress_data(tensor)
+                restored = compressor.decompress_data(compressed)
+                self.assertEqual(restored.dtype, tensor.dtype)
+                torch.testing.assert_close(restored, tensor, rtol=0.02, atol=0.05)
+
+
+if __name__ == "__main__":
+    unittest.main()
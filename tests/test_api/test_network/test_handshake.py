@@ -0,0 +1,75 @@
+"""Tests for the configuration handshake in api.network.handshake."""
+
+import pickle
+import unittest
+from unittest import mock
+
+from src.api.network.compression import CompressionConfig
+from src.api.network.handshake import pack_config, unpack_config
+from src.api.network.protocols import CONFIG_MAGIC
+
+
+class TestConfigHandshake(unittest.TestCase):
+    """Round trips through pack_config/unpack_config."""
+
+    def test_json_config_with_compression(self):
+        """Configs with compression settings carry them in the header."""
+        config = {
+            "default": {"device": "cpu"},
+            "compression": {"clevel": 2, "filter": "BITSHUFFLE", "codec": "LZ4"},
+        }
+        data = pack_config(config)
+        self.assertTrue(data.startswith(CONFIG_MAGIC))
+
+        decoded, compression = unpack_config(data)
+        self.assertEqual(decoded, config)
+        self.assertEqual(
+            compression,
+            CompressionConfig(clevel=2, filter="BITSHUFFLE", codec="LZ4"),
+        )
+
+    def test_config_without_compression_requests_auto(self):
+        """Configs without compression settings leave the codec to the server."""
+        config = {"default": {"device": "cpu"}}
+        decoded, compression = unpack_config(pack_config(config))
+        self.assertEqual(decoded, config)
+        self.assertIsNone(compression)
+
+    def test_pack_config_does_not_modify_config(self):
+        """Encoding never adds default compression settings to the config."""
+        config = {"default": {}}
+        pack_config(config)
+        self.assertEqual(config, {"default": {}})
+
+    def test_non_json_config_falls_back_to_pickle(self):
+        """Configs that do not survive JSON unchanged are pickled."""
+        config = {"default": {"input_size": (3, 224, 224)}}
+        with self.assertLogs("split_computing_logger", "WARNING"):
+            data = pack_config(config)
+        self.assertFalse(data.startswith(CONFIG_MAGIC))
+
+        decoded, compression = unpack_config(data, allow_pickle=True)
+        self.assertEqual(decoded, config)
+        self.assertIsNone(compression)
+
+    def test_pickle_config_rejected_by_default(self):
+        """Payloads without the magic prefix are never unpickled unless allowed."""
+        data = pickle.dumps({"default": {"device": "cpu"}})
+        with mock.patch("pickle.loads") as loads:
+            with self.assertRaises(ValueError):
+                unpack_config(data)
+        loads.assert_not_called()
+
+    def test_legacy_pickle_config(self):
+        """With allow_pickle, payloads without the magic prefix are read as pickle."""
+        config = {"default": {"device": "cpu"}, "compression": {"clevel": 1}}
+        with self.assertLogs("split_computing_logger", "WARNING"):
+            decoded, compression = unpack_config(
+                pickle.dumps(config), allow_pickle=True
+            )
+        self.assertEqual(decoded, config)
+        self.assertIsNone(compression)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,275 @@
+"""Loopback tests for the split computing client and server in server.py."""
+
+import importlib
+import socket
+import threading
+import time
+import unittest
+from unittest import mock
+
+import torch
+
+from src.api.core import NetworkError
+from src.api.network.client import create_network_client
+from src.api.network.compression import DataCompression
+from src.api.network.protocols import BANDWIDTH_PROBE_MIN_BYTES, FAST_LINK_MBPS
+
+COMPRESSION = {"clevel": 1, "filter": "SHUFFLE", "codec": "ZSTD"}
+
+server_module = None
+
+
+def setUpModule():
+    """Import server.py, which starts the logging server on import."""
+    global server_module
+    try:
+        server_module = importlib.import_module("server")
+    except NetworkError as e:
+        raise unittest.SkipTest(f"Cannot start the server logging endpoint: {e}")
+
+
+class FakeExperiment:
+    """Stands in for a split experiment by summarizing the received tensor."""
+
+    device = torch.device("cpu")
+    model = torch.nn.Identity()
+
+    def process_tensor(self, output, original_size, split_layer, model=None):
+        return {
+            "sum": float(output.sum()),
+            "shape": list(output.shape),
+            "original_size": list(original_size),
+            "split_layer": split_layer,
+        }
+
+
+class FakeExperimentManager:
+    """Builds FakeExperiments and counts how many were set up."""
+
+    setups = 0
+
+    def __init__(self, config, force_local=False):
+        self.config = config
+
+    def setup_experiment(self):
+        FakeExperimentManager.setups += 1
+        return FakeExperiment()
+
+
+class ThrottledProxy:
+    """Relays one TCP connection, limiting client-to-server throughput.
+
+    Fakes a slow link: each chunk is forwarded after a pause, so the server
+    receives requests at roughly `chunk_size / delay` bytes per second.
+    """
+
+    def __init__(self, port, chunk_size=16 * 1024, delay=0.005):
+        self.port = port
+        self.chunk_size = chunk_size
+        self.delay = delay
+        self.listener = socket.create_server(("127.0.0.1", 0))
+        self.address = self.listener.getsockname()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        try:
+            client, _ = self.listener.accept()
+        except OSError:
+            return
+        upstream = socket.create_connection(("127.0.0.1", self.port))
+        threading.Thread(
+            target=self._relay, args=(client, upstream, self.delay), daemon=True
+        ).start()
+        threading.Thread(
+            target=self._relay, args=(upstream, client, 0), daemon=True
+        ).start()
+
+    def _relay(self, source, target, delay):
+        try:
+            while True:
+                data = source.recv(self.chunk_size)
+                if not data:
+                    break
+                target.sendall(data)
+                if delay:
+                    time.sleep(delay)
+        except OSError:
+            pass
+        finally:
+            for sock in (source, target):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    def close(self):
+        self.listener.close()
+
+
+class TestLoopbackExchange(unittest.TestCase):
+    """Exchanges between SplitComputeClient and a Server on localhost."""
+
+    def setUp(self):
+        patches = (
+            mock.patch.object(
+                server_module, "ExperimentManager", FakeExperimentManager
+            ),
+            mock.patch.object(server_module, "DeviceManager", lambda: None),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        FakeExperimentManager.setups = 0
+
+        self.server = server_module.Server()
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        self.server.server_socket = listener
+        self.port = listener.getsockname()[1]
+        event_loop = threading.Thread(
+            target=self.server._accept_connections, daemon=True
+        )
+        event_loop.start()
+        # Cleanups run last-in first-out: stop the loop, then release resources
+        self.addCleanup(self.server.cleanup)
+        self.addCleanup(event_loop.join, 5)
+        self.addCleanup(self.server.stop)
+
+    def make_client(self, config=None, port=None):
+        if config is None:
+            config = {"default": {}, "compression": dict(COMPRESSION)}
+        client = create_network_client(config, "127.0.0.1", port or self.port)
+        self.addCleanup(client.close)
+        return client
+
+    @staticmethod
+    def make_payload(tensor):
+        compressed, _ = DataCompression(dict(COMPRESSION)).compress_data(
+            (tensor, (640, 480))
+        )
+        return compressed
+
+    def test_single_exchange(self):
+        """A request is answered with the experiment's result and timing."""
+        client = self.make_client()
+        tensor = torch.arange(12, dtype=torch.float32).reshape(1, 3, 4)
+        result, server_time = client.process_split_computation(
+            3, self.make_payload(tensor)
+        )
+        self.assertEqual(
+            result,
+            {
+                "sum": 66.0,
+                "shape": [1, 3, 4],
+                "original_size": [640, 480],
+                "split_layer": 3,
+            },
+        )
+        self.assertGreaterEqual(server_time, 0.0)
+
+    def test_concurrent_clients_share_experiment(self):
+        """Clients with identical configs are served concurrently by one experiment."""
+        errors = []
+
+        def run_client(index):
+            try:
+                client = self.make_client()
+                for split_layer in range(3):
+                    tensor = torch.full((2, 8), float(index))
+                    result, _ = client.process_split_computation(
+                        split_layer, self.make_payload(tensor)
+                    )
+                    self.assertEqual(result["sum"], 16.0 * index)
+                    self.assertEqual(result["split_layer"], split_layer)
+            except Exception as e:  # Surface failures from worker threads
+                errors.append(e)
+
+        threads = [threading.Thread(target=run_client, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=30)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(FakeExperimentManager.setups, 1)
+        self.assertIsNone(self.server.experiment_manager)
+
+    def test_large_payload(self):
+        """Segmented payloads larger than the receive chunking round trip."""
+        client = self.make_client()
+        tensor = torch.ones(1, 64, 64, 64)
+        result, _ = client.process_split_computation(0, self.make_payload(tensor))
+        self.assertEqual(result["sum"], float(tensor.numel()))
+
+    def test_resend_after_connection_reset(self):
+        """A request whose send hits a reset is resent once on a new connection."""
+        client = self.make_client()
+        payload = self.make_payload(torch.ones(4))
+        client.process_split_computation(0, payload)
+        first_socket = client.socket
+
+        send_request = client._send_request
+        calls = []
+
+        def reset_once(header, data):
+            calls.append(client.socket)
+            if len(calls) == 1:
+                raise ConnectionResetError("connection reset by peer")
+            return send_request(header, data)
+
+        with mock.patch.object(client, "_send_request", side_effect=reset_once):
+            result, _ = client.process_split_computation(1, payload)
+
+        self.assertEqual(result["split_layer"], 1)
+        self.assertEqual(len(calls), 2)
+        self.assertIs(calls[0], first_socket)
+        self.assertIsNot(calls[1], first_socket)
+
+    def test_second_reset_is_reported(self):
+        """Resending is attempted only once."""
+        client = self.make_client()
+        with mock.patch.object(
+            client, "_send_request", side_effect=BrokenPipeError("broken pipe")
+        ):
+            with self.assertRaises(Exception):
+                client.process_split_computation(0, self.make_payload(torch.ones(4)))
+        self.assertFalse(client.connected)
+
+    def test_auto_codec_on_slow_link(self):
+        """Without client settings, a slow link makes the server choose ZSTD."""
+        # About 3 MB/s, well below FAST_LINK_MBPS
+        proxy = ThrottledProxy(self.port)
+        self.addCleanup(proxy.close)
+        client = self.make_client({"default": {}}, port=proxy.address[1])
+        tensor = torch.randn(4 * BANDWIDTH_PROBE_MIN_BYTES)
+        with mock.patch.object(
+            server_module.Server,
+            "_auto_select_codec",
+            wraps=server_module.Server._auto_select_codec,
+        ) as auto_select:
+            for split_layer in range(2):
+                result, _ = client.process_split_computation(
+                    split_layer, self.make_payload(tensor)
+                )
+                self.assertAlmostEqual(result["sum"], float(tensor.sum()), places=0)
+        auto_select.assert_called_once()
+        (link_mbps,), _ = auto_select.call_args
+        self.assertLess(link_mbps, FAST_LINK_MBPS)
+        self.assertEqual(
+            server_module.Server._auto_select_codec(link_mbps)["codec"], "ZSTD"
+        )
+
+    def test_configured_compression_is_kept(self):
+        """Clients with compression settings never trigger codec selection."""
+        client = self.make_client()
+        with mock.patch.object(server_module.Server, "_auto_select_codec") as auto:
+            client.process_split_computation(
+                0, self.make_payload(torch.randn(BANDWIDTH_PROBE_MIN_BYTES))
+            )
+        auto.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
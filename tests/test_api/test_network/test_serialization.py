@@ -0,0 +1,182 @@
+"""Tests for payload serialization in api.network.serialization."""
+
+import unittest
+
+import torch
+
+from src.api.network.protocols import OOB_PICKLE_MAGIC, TENSOR_MAGIC
+from src.api.network.serialization import (
+    QuantizedTensor,
+    dequantize,
+    deserialize,
+    quantize,
+    serialize,
+    serialize_parts,
+)
+
+# Every dtype with a wire id in the tensor frame
+DTYPES = (
+    torch.float32,
+    torch.float16,
+    torch.bfloat16,
+    torch.float64,
+    torch.uint8,
+    torch.int8,
+    torch.int16,
+    torch.int32,
+    torch.int64,
+    torch.bool,
+)
+
+
+def _make_tensor(dtype: torch.dtype, shape=(2, 3, 4)) -> torch.Tensor:
+    """Create a tensor of `dtype` with non-trivial values."""
+    values = torch.arange(torch.Size(shape).numel()).reshape(shape) - 5
+    if dtype == torch.bool:
+        return values > 0
+    if dtype == torch.uint8:
+        return values.abs().to(dtype)
+    return values.to(dtype)
+
+
+class TestSerialization(unittest.TestCase):
+    """Round trips through serialize/deserialize."""
+
+    @staticmethod
+    def round_trip(data):
+        """Serialize `data` and decode it from a writable buffer."""
+        return deserialize(bytearray(serialize(data)))
+
+    def test_tensor_frame_all_dtypes(self):
+        """Single tensors of every supported dtype use the tensor frame."""
+        for dtype in DTYPES:
+            with self.subTest(dtype=dtype):
+                tensor = _make_tensor(dtype)
+                data = serialize(tensor)
+                self.assertTrue(data.startswith(TENSOR_MAGIC))
+
+                decoded = deserialize(bytearray(data))
+                self.assertEqual(decoded.dtype, dtype)
+                self.assertTrue(torch.equal(decoded, tensor))
+
+    def test_tensor_list_frame(self):
+        """Lists of same-dtype tensors keep their shapes and order."""
+        tensors = [_make_tensor(torch.float32, shape) for shape in ((2, 3), (4,), ())]
+        decoded = self.round_trip(tensors)
+        self.assertIsInstance(decoded, list)
+        self.assertEqual(len(decoded), 3)
+        for original, result in zip(tensors, decoded):
+            self.assertTrue(torch.equal(original, result))
+
+    def test_empty_and_non_contiguous_tensors(self):
+        """Empty tensors and strided views are framed as plain data."""
+        empty = torch.empty(0, 3)
+        decoded = self.round_trip(empty)
+        self.assertEqual(decoded.shape, empty.shape)
+
+        strided = _make_tensor(torch.float32, (4, 6)).t()
+        self.assertTrue(torch.equal(self.round_trip(strided), strided))
+
+    def test_split_payload_uses_out_of_band_pickle(self):
+        """Nested tensors in pickled payloads are carried out of band."""
+        tensor = _make_tensor(torch.float32, (1, 8, 5, 5))
+        payload = (tensor, (224, 224))
+        data = serialize(payload)
+        self.assertTrue(data.startswith(OOB_PICKLE_MAGIC))
+
+        output, original_size = deserialize(bytearray(data))
+        self.assertEqual(original_size, (224, 224))
+        self.assertTrue(torch.equal(output, tensor))
+
+    def test_decoded_tensors_are_writable(self):
+        """Tensors decoded from a bytearray can be modified in place."""
+        decoded, _ = self.round_trip((torch.zeros(4), None))
+        decoded.add_(1)
+        self.assertTrue(torch.equal(decoded, torch.ones(4)))
+
+    def test_plain_pickle_payloads(self):
+        """Payloads without tensors are plain pickles."""
+        payload = {"class_name": "cat", "confidence": 0.5, "boxes": [[1, 2, 3, 4]]}
+        self.assertEqual(self.round_trip(payload), payload)
+
+    def test_mixed_dtype_list_is_pickled(self):
+        """Lists with mixed dtypes fall back to pickle and still round trip."""
+        tensors = [torch.ones(2), torch.ones(2, dtype=torch.int64)]
+        decoded = self.round_trip(tensors)
+        self.assertEqual([t.dtype for t in decoded], [torch.float32, torch.int64])
+
+    def test_serialize_parts_join_to_serialize(self):
+        """The parts of a payload concatenate to its serialized bytes."""
+        for payload in (_make_tensor(torch.int16), (torch.ones(3), (1, 1)), {"a": 1}):
+            with self.subTest(payload=type(payload).__name__):
+                parts = serialize_parts(payload)
+                self.assertEqual(
+                    b"".join(bytes(memoryview(p).cast("B")) for p in parts),
+                    serialize(payload),
+                )
+
+    def test_raw_parts_expose_element_size(self):
+        """Raw tensor parts are typed with the tensor's element size."""
+        parts = serialize_parts(_make_tensor(torch.float32))
+        self.assertEqual(memoryview(parts[-1]).itemsize, 4)
+
+
+class TestQuantization(unittest.TestCase):
+    """Round trips through quantize/dequantize."""
+
+    def setUp(self):
+        torch.manual_seed(0)
+        self.tensor = torch.randn(2, 16, 8, 8)
+
+    def test_fp32_policy_is_identity(self):
+        """The fp32 policy returns the payload unchanged."""
+        payload = (self.tensor, (224, 224))
+        self.assertIs(quantize(payload, "fp32"), payload)
+
+    def test_half_precision_policies(self):
+        """fp16 and bf16 halve the payload and restore the original dtype."""
+        for policy, dtype, tolerance in (
+            ("fp16", torch.float16, 1e-3),
+            ("bf16", torch.bfloat16, 1e-2),
+        ):
+            with self.subTest(policy=policy):
+                quantized = quantize(self.tensor, policy)
+                self.assertIsInstance(quantized, QuantizedTensor)
+                self.assertEqual(quantized.data.dtype, dtype)
+
+                restored = dequantize(deserialize(bytearray(serialize(quantized))))
+                self.assertEqual(restored.dtype, torch.float32)
+                torch.testing.assert_close(
+                    restored, self.tensor, rtol=tolerance, atol=tolerance
+                )
+
+    def test_int8_policy(self):
+        """int8 keeps values within one quantization step."""
+        quantized = quantize(self.tensor, "int8")
+        self.assertEqual(quantized.data.dtype, torch.int8)
+
+        restored = dequantize(quantized)
+        step = self.tensor.abs().max().item() / 127
+        self.assertLessEqual((restored - self.tensor).abs().max().item(), step)
+
+    def test_nested_payloads(self):
+        """Tensors nested in tuples and lists are quantized; other data is not."""
+        payload = (self.tensor, [self.tensor, 3], torch.arange(4))
+        quantized = quantize(payload, "int8")
+        self.assertIsInstance(quantized[0], QuantizedTensor)
+        self.assertIsInstance(quantized[1][0], QuantizedTensor)
+        self.assertEqual(quantized[1][1], 3)
+        self.assertTrue(torch.equal(quantized[2], torch.arange(4)))
+
+        restored = dequantize(quantized)
+        self.assertEqual(restored[0].shape, self.tensor.shape)
+        self.assertTrue(torch.equal(restored[2], torch.arange(4)))
+
+    def test_zero_tensor_int8(self):
+        """All-zero tensors quantize without dividing by zero."""
+        restored = dequantize(quantize(torch.zeros(5), "int8"))
+        self.assertTrue(torch.equal(restored, torch.zeros(5)))
+
+
+if __name__ == "__main__":
+    unittest.main()